@@ -1,17 +1,17 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers
 from starlette.responses import Response
 from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.types import ASGIApp, Receive, Scope, Send
 from jose import jwt, JWTError
 import json
 from app.config import settings
 
 
-class JWTMiddleware(BaseHTTPMiddleware):
+class JWTMiddleware:
     """JWT Authentication Middleware."""
     
     # Routes that don't require authentication
-    EXEMPT_ROUTES = [
+    EXEMPT_ROUTES = frozenset({
         "/",
         "/health",
         "/docs",
@@ -19,18 +19,23 @@ class JWTMiddleware(BaseHTTPMiddleware):
         "/openapi.json",
         "/api/v1/auth/login",
         "/api/v1/auth/register"
-    ]
+    })
+    # Swagger UI serves its OAuth2 redirect page under /docs/
+    EXEMPT_PREFIXES = ("/docs/",)
     
-    async def dispatch(self, request: Request, call_next):
-        # Skip authentication for exempt routes
-        if any(request.url.path.startswith(route) for route in self.EXEMPT_ROUTES):
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # Skip authentication for non-HTTP traffic and exempt routes
+        if scope["type"] != "http" or self._is_exempt(scope["path"]):
+            return await self.app(scope, receive, send)
         
         # Get Authorization header
-        auth_header = request.headers.get("Authorization")
+        auth_header = Headers(scope=scope).get("Authorization")
         
         if not auth_header or not auth_header.startswith("Bearer "):
-            return self._unauthorized_response()
+            return await self._unauthorized_response()(scope, receive, send)
         
         # Extract token
         token = auth_header.split(" ")[1]
@@ -41,16 +46,18 @@ class JWTMiddleware(BaseHTTPMiddleware):
             username = payload.get("sub")
             
             if not username:
-                return self._unauthorized_response()
+                return await self._unauthorized_response()(scope, receive, send)
             
             # Add user info to request state
-            request.state.username = username
-            
+            scope.setdefault("state", {})["username"] = username
+        
         except JWTError:
-            return self._unauthorized_response()
+            return await self._unauthorized_response()(scope, receive, send)
         
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
+    
+    def _is_exempt(self, path: str) -> bool:
+        return path in self.EXEMPT_ROUTES or path.startswith(self.EXEMPT_PREFIXES)
     
     def _unauthorized_response(self):
         """Return unauthorized response."""
@@ -2,30 +2,30 @@ from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.core.database.database import get_database
 from app.core.database.models import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 from app.config import settings
 from app.core.utils.logger import get_logger
+from app.core.utils import encryption
 
 logger = get_logger(__name__)
 router = APIRouter()
 security = HTTPBearer()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return encryption.verify_password(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return encryption.hash_password(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -73,7 +73,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_database)):
     
     # Check if user already exists
     existing_user = db.query(User).filter(
-        (User.email == user_data.email) | (User.username == user_data.username)
+        (func.lower(User.email) == user_data.email.lower()) | (User.username == user_data.username)
     ).first()
     
     if existing_user:
@@ -115,7 +115,7 @@ async def login(user_data: UserLogin, db: Session = Depends(get_database)):
     
     # Find user
     user = db.query(User).filter(
-        (User.email == user_data.email_or_username) | 
+        (func.lower(User.email) == user_data.email_or_username.lower()) | 
         (User.username == user_data.email_or_username)
     ).first()
     
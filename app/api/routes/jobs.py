@@ -30,7 +30,7 @@ async def create_job_description(
     service = JobService()
     try:
         job = await service.create_job_description(
-            db, job_data.dict(), current_user.id
+            db, job_data.model_dump(), current_user.id
         )
         return _convert_job_to_response(job)
         
@@ -132,7 +132,7 @@ async def update_job_description(
     service = JobService()
     try:
         job = await service.update_job_description(
-            db, job_id, job_update.dict(exclude_unset=True), current_user.id
+            db, job_id, job_update.model_dump(exclude_unset=True), current_user.id
         )
         return _convert_job_to_response(job)
     except HTTPException:
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 import os
 
@@ -9,11 +9,17 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./resume_system.db"
     postgres_url: Optional[str] = None
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
     
     # Security
     secret_key: str = "your-super-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12
     
     # OpenAI & LangChain
     openai_api_key: str
@@ -29,6 +35,7 @@ class Settings(BaseSettings):
     max_file_size: int = 10485760  # 10MB
     allowed_extensions: List[str] = ["pdf", "docx", "doc", "txt"]
     upload_directory: str = "./uploads"
+    file_hash_algorithm: str = "blake3"  # blake3 or sha256
     
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -59,9 +66,7 @@ class Settings(BaseSettings):
     medium_threshold: float = 60.0
     low_threshold: float = 40.0
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 # Global settings instance
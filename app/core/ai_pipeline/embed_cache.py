@@ -0,0 +1,80 @@
+import os
+import hashlib
+from typing import List, Optional
+import numpy as np
+from app.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "resume_relevance", "embeddings"
+)
+
+
+class EmbeddingDiskCache:
+    """Content-addressed on-disk store of unit-length text embeddings.
+
+    Each entry is a float16 ``.npy`` file named by a hash of the model name
+    and the text, so entries survive process restarts and are never stale
+    for a given model. Files are sharded by the first two hex digits of the key.
+    """
+
+    def __init__(self, model_name: str, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+
+    def key(self, text: str) -> str:
+        """Content hash of ``text`` under this cache's model."""
+        payload = f"{self.model_name}\x00{text}".encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npy")
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the stored vector for ``key``, or None on a miss."""
+        try:
+            return np.load(self._path(key), allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, vector: np.ndarray):
+        """Store ``vector`` as float16; the write is atomic."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.asarray(vector, dtype=np.float16))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write embedding cache entry: {e}")
+
+
+def cached_encode(model, texts: List[str], cache: EmbeddingDiskCache,
+                  batch_size: int = 128) -> np.ndarray:
+    """Encode ``texts`` to unit-length float32 rows, reusing disk-cached vectors.
+
+    Only texts missing from the cache go through ``model.encode``, in one
+    batched call, and their vectors are written back afterwards.
+    """
+    keys = [cache.key(text) for text in texts]
+    vectors = [cache.get(key) for key in keys]
+
+    misses = [i for i, vector in enumerate(vectors) if vector is None]
+    if misses:
+        encoded = model.encode(
+            [texts[i] for i in misses],
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        for i, vector in zip(misses, encoded):
+            # Round now so cold and warm runs return identical values
+            vector = np.asarray(vector, dtype=np.float16)
+            cache.set(keys[i], vector)
+            vectors[i] = vector
+
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.ascontiguousarray(np.vstack(vectors), dtype=np.float32)
@@ -1,16 +1,28 @@
+import os
 import re
+import copy
 import json
+import hashlib
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
 import fitz  # PyMuPDF
+import numpy as np
 import pdfplumber
 from docx import Document
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from functools import cached_property
 from datetime import datetime
 import spacy
 from app.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# WordprocessingML namespace used in DOCX document.xml tags
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
 
 @dataclass
 class ContactInfo:
@@ -78,19 +90,141 @@ class ParsedResume:
     parsing_confidence: float = 0.0
 
 
+class LazyParsedResume:
+    """Parsed resume whose sections are extracted on first access.
+    
+    Exposes the same attributes as ``ParsedResume``; call ``eager()`` to
+    materialize every section into a regular ``ParsedResume``.
+    """
+    
+    def __init__(self, parser: "ResumeParser", text: str, parsing_confidence: float):
+        self._parser = parser
+        self.raw_text = text
+        self.parsing_confidence = parsing_confidence
+    
+    @cached_property
+    def cleaned_text(self) -> str:
+        return self._parser._clean_text(self.raw_text)
+    
+    @cached_property
+    def contact_info(self) -> ContactInfo:
+        return self._parser._extract_contact_info(self.cleaned_text)
+    
+    @cached_property
+    def summary(self) -> Optional[str]:
+        return self._parser._extract_summary(self.cleaned_text)
+    
+    @cached_property
+    def skills(self) -> List[str]:
+        return self._parser._extract_skills(self.cleaned_text)
+    
+    @cached_property
+    def education(self) -> List[Education]:
+        return self._parser._extract_education(self.cleaned_text)
+    
+    @cached_property
+    def work_experience(self) -> List[WorkExperience]:
+        return self._parser._extract_work_experience(self.cleaned_text)
+    
+    @cached_property
+    def projects(self) -> List[Project]:
+        return self._parser._extract_projects(self.cleaned_text)
+    
+    @cached_property
+    def certifications(self) -> List[str]:
+        return self._parser._extract_certifications(self.cleaned_text)
+    
+    @cached_property
+    def languages(self) -> List[str]:
+        return self._parser._extract_languages(self.cleaned_text)
+    
+    @cached_property
+    def awards(self) -> List[str]:
+        return self._parser._extract_awards(self.cleaned_text)
+    
+    @cached_property
+    def total_experience_years(self) -> Optional[float]:
+        return self._parser._calculate_total_experience(self.work_experience)
+    
+    def eager(self) -> ParsedResume:
+        """Extract all remaining sections and return a ``ParsedResume``."""
+        return ParsedResume(
+            contact_info=self.contact_info,
+            summary=self.summary,
+            skills=self.skills,
+            education=self.education,
+            work_experience=self.work_experience,
+            projects=self.projects,
+            certifications=self.certifications,
+            languages=self.languages,
+            awards=self.awards,
+            total_experience_years=self.total_experience_years,
+            raw_text=self.raw_text,
+            parsing_confidence=self.parsing_confidence
+        )
+
+
+@dataclass
+class ParsedResumeBatch:
+    """Column-oriented (structure-of-arrays) view over a batch of parsed resumes.
+    
+    Work experience and education entries from every resume are flattened
+    into parallel columns; ``*_resume_index`` maps each row back to its
+    resume. Unknown years are stored as 0 and unknown GPAs as NaN.
+    """
+    resume_count: int = 0
+    total_experience_years: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    
+    # Work experience columns
+    experience_resume_index: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    titles: List[str] = field(default_factory=list)
+    companies: List[str] = field(default_factory=list)
+    start_years: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int16))
+    end_years: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int16))
+    durations_months: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int16))
+    
+    # Education columns
+    education_resume_index: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    degrees: List[Optional[str]] = field(default_factory=list)
+    institutions: List[Optional[str]] = field(default_factory=list)
+    graduation_years: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int16))
+    gpas: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+
+
 class ResumeParser:
     """Advanced resume parser with multiple extraction strategies."""
     
+    # Maximum number of entries kept in each in-memory LRU cache
+    PARSE_CACHE_SIZE = 128
+    FILE_CACHE_SIZE = 128
+    
     def __init__(self):
         self.nlp = None
         self._load_nlp_model()
         
+        # LRU caches of parsed results, keyed by text digest + confidence
+        # and by (file path, mtime, size) respectively
+        self._parse_cache: "OrderedDict[Tuple[bytes, float], ParsedResume]" = OrderedDict()
+        self._file_cache: "OrderedDict[Tuple[str, int, int], ParsedResume]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         # Regex patterns for extraction
         self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+        self.phone_pattern = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
         self.linkedin_pattern = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
         self.github_pattern = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
         self.url_pattern = re.compile(r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?')
+        # Runs of two or more capitalized words on one line (institution names),
+        # starting at a word boundary so "iPhone ..." doesn't match from "Phone"
+        self.institution_pattern = re.compile(r'(?<![\w.&-])[A-Z][\w.&-]*(?:[ \t]+[A-Z][\w.&-]*)+')
+        self.degree_patterns = [
+            re.compile(r'(bachelor|master|phd|doctorate|associate|diploma|certificate)[\s\w]*', re.IGNORECASE),
+            re.compile(r'(b\.?[sa]\.?|m\.?[sa]\.?|ph\.?d\.?|mba)', re.IGNORECASE),
+            re.compile(r'(undergraduate|graduate)', re.IGNORECASE)
+        ]
+        self.year_pattern = re.compile(r'(?:19|20)\d{2}')
+        self.gpa_pattern = re.compile(r'gpa:?\s*([0-9.]+)', re.IGNORECASE)
+        self.date_pattern = re.compile(r'\d{1,2}/\d{2,4}|\w+\s+\d{4}|\d{4}')
         
         # Skill categories for better categorization
         self.skill_categories = {
@@ -111,8 +245,42 @@ class ResumeParser:
             logger.warning("spaCy English model not found. Install with: python -m spacy download en_core_web_sm")
             self.nlp = None
     
+    def _cache_get(self, cache: OrderedDict, key: Any) -> Optional[ParsedResume]:
+        """Look up a cached parse result and mark it as recently used.
+        
+        Callers get their own copy, so editing a result never leaks into the cache.
+        """
+        with self._cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    def _cache_put(self, cache: OrderedDict, key: Any, value: ParsedResume, max_size: int):
+        """Store a snapshot of a parse result, evicting the least recently used entry."""
+        value = copy.deepcopy(value)
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
+    def _file_cache_key(self, file_path: str) -> Optional[Tuple[str, int, int]]:
+        """Build a change-detection key from the file's mtime and size."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    
     def parse_pdf(self, file_path: str) -> ParsedResume:
         """Parse PDF resume using multiple strategies."""
+        cache_key = self._file_cache_key(file_path)
+        if cache_key is not None:
+            cached = self._cache_get(self._file_cache, cache_key)
+            if cached is not None:
+                return cached
+        
         text = ""
         parsing_confidence = 0.0
         
@@ -137,19 +305,18 @@ class ResumeParser:
             logger.error(f"Error parsing PDF {file_path}: {str(e)}")
             parsing_confidence = 0.0
         
-        return self._parse_text_content(text, parsing_confidence)
+        parsed_resume = self._parse_text_content(text, parsing_confidence)
+        if cache_key is not None and parsing_confidence > 0:
+            self._cache_put(self._file_cache, cache_key, parsed_resume, self.FILE_CACHE_SIZE)
+        
+        return parsed_resume
     
     def _extract_text_pymupdf(self, file_path: str) -> str:
         """Extract text using PyMuPDF."""
-        text = ""
-        doc = fitz.open(file_path)
-        
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text += page.get_text()
-        
-        doc.close()
-        return text
+        # Iterating the document reuses page objects; sort=True orders
+        # blocks top-to-bottom, left-to-right for multi-column layouts
+        with fitz.open(file_path) as doc:
+            return "".join(page.get_text(sort=True) for page in doc)
     
     def _extract_text_pdfplumber(self, file_path: str) -> str:
         """Extract text using pdfplumber."""
@@ -165,22 +332,22 @@ class ResumeParser:
     
     def parse_docx(self, file_path: str) -> ParsedResume:
         """Parse DOCX resume."""
+        cache_key = self._file_cache_key(file_path)
+        if cache_key is not None:
+            cached = self._cache_get(self._file_cache, cache_key)
+            if cached is not None:
+                return cached
+        
         text = ""
         parsing_confidence = 0.0
         
         try:
-            doc = Document(file_path)
-            
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+            try:
+                text = self._extract_text_docx_xml(file_path)
+            except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+                # Fall back to python-docx for files the streaming reader can't handle
+                logger.warning(f"Streaming DOCX extraction failed for {file_path}: {str(e)}")
+                text = self._extract_text_python_docx(file_path)
             
             parsing_confidence = 0.90  # DOCX parsing is usually reliable
             logger.info(f"Extracted {len(text)} characters from DOCX")
@@ -189,51 +356,97 @@ class ResumeParser:
             logger.error(f"Error parsing DOCX {file_path}: {str(e)}")
             parsing_confidence = 0.0
         
-        return self._parse_text_content(text, parsing_confidence)
+        parsed_resume = self._parse_text_content(text, parsing_confidence)
+        if cache_key is not None and parsing_confidence > 0:
+            self._cache_put(self._file_cache, cache_key, parsed_resume, self.FILE_CACHE_SIZE)
+        
+        return parsed_resume
+    
+    def _extract_text_docx_xml(self, file_path: str) -> str:
+        """Extract text by streaming word/document.xml straight from the DOCX archive."""
+        parts = []
+        table_depth = 0
+        
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open("word/document.xml") as document_xml:
+                for event, element in ET.iterparse(document_xml, events=("start", "end")):
+                    tag = element.tag
+                    if event == "start":
+                        if tag == WORD_NS + "tbl":
+                            table_depth += 1
+                        continue
+                    
+                    if tag == WORD_NS + "t":
+                        if element.text:
+                            parts.append(element.text)
+                    elif tag == WORD_NS + "tab":
+                        parts.append("\t")
+                    elif tag == WORD_NS + "br":
+                        parts.append("\n")
+                    elif tag == WORD_NS + "p":
+                        # Table cells are joined with spaces, one row per line
+                        parts.append(" " if table_depth else "\n")
+                    elif tag == WORD_NS + "tr":
+                        parts.append("\n")
+                    elif tag == WORD_NS + "tbl":
+                        table_depth -= 1
+                    elif tag == WORD_NS + "body":
+                        break
+                    
+                    element.clear()
+        
+        return "".join(parts)
+    
+    def _extract_text_python_docx(self, file_path: str) -> str:
+        """Extract text using python-docx."""
+        text = ""
+        doc = Document(file_path)
+        
+        # Extract text from paragraphs
+        for paragraph in doc.paragraphs:
+            text += paragraph.text + "\n"
+        
+        # Extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    text += cell.text + " "
+                text += "\n"
+        
+        return text
     
     def parse_text(self, text: str) -> ParsedResume:
         """Parse plain text resume."""
         return self._parse_text_content(text, 1.0)
     
     def _parse_text_content(self, text: str, parsing_confidence: float) -> ParsedResume:
-        """Parse extracted text content."""
-        # Clean and normalize text
-        cleaned_text = self._clean_text(text)
-        
-        # Extract components
-        contact_info = self._extract_contact_info(cleaned_text)
-        summary = self._extract_summary(cleaned_text)
-        skills = self._extract_skills(cleaned_text)
-        education = self._extract_education(cleaned_text)
-        work_experience = self._extract_work_experience(cleaned_text)
-        projects = self._extract_projects(cleaned_text)
-        certifications = self._extract_certifications(cleaned_text)
-        languages = self._extract_languages(cleaned_text)
-        awards = self._extract_awards(cleaned_text)
-        
-        # Calculate total experience
-        total_experience = self._calculate_total_experience(work_experience)
+        """Parse extracted text content, reusing cached results for identical text."""
+        cache_key = (hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), parsing_confidence)
         
-        return ParsedResume(
-            contact_info=contact_info,
-            summary=summary,
-            skills=skills,
-            education=education,
-            work_experience=work_experience,
-            projects=projects,
-            certifications=certifications,
-            languages=languages,
-            awards=awards,
-            total_experience_years=total_experience,
-            raw_text=text,
-            parsing_confidence=parsing_confidence
-        )
+        cached = self._cache_get(self._parse_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        parsed_resume = self._parse_uncached(text, parsing_confidence)
+        self._cache_put(self._parse_cache, cache_key, parsed_resume, self.PARSE_CACHE_SIZE)
+        
+        return parsed_resume
+    
+    def _parse_uncached(self, text: str, parsing_confidence: float) -> ParsedResume:
+        """Run every extractor over the text."""
+        return self.parse_lazy(text, parsing_confidence).eager()
+    
+    def parse_lazy(self, text: str, parsing_confidence: float = 1.0) -> LazyParsedResume:
+        """Parse text, deferring each section's extraction until it is accessed."""
+        return LazyParsedResume(self, text, parsing_confidence)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s*\n', '\n', text)
+        # Collapse horizontal whitespace but keep line breaks, which the
+        # section and entry extractors rely on
+        text = re.sub(r'[ \t\r\f\v]+', ' ', text)
+        text = re.sub(r' ?\n ?', '\n', text)
+        text = re.sub(r'\n{2,}', '\n', text)
         return text.strip()
     
     def _extract_contact_info(self, text: str) -> ContactInfo:
@@ -241,20 +454,20 @@ class ResumeParser:
         contact = ContactInfo()
         
         # Extract email
-        email_matches = self.email_pattern.findall(text)
-        contact.email = email_matches[0] if email_matches else None
+        email_match = self.email_pattern.search(text)
+        contact.email = email_match.group() if email_match else None
         
         # Extract phone
-        phone_matches = self.phone_pattern.findall(text)
-        contact.phone = phone_matches[0] if phone_matches else None
+        phone_match = self.phone_pattern.search(text)
+        contact.phone = phone_match.group() if phone_match else None
         
         # Extract LinkedIn
-        linkedin_matches = self.linkedin_pattern.findall(text)
-        contact.linkedin = f"https://{linkedin_matches[0]}" if linkedin_matches else None
+        linkedin_match = self.linkedin_pattern.search(text)
+        contact.linkedin = f"https://{linkedin_match.group()}" if linkedin_match else None
         
         # Extract GitHub
-        github_matches = self.github_pattern.findall(text)
-        contact.github = f"https://{github_matches[0]}" if github_matches else None
+        github_match = self.github_pattern.search(text)
+        contact.github = f"https://{github_match.group()}" if github_match else None
         
         # Extract name (first few words, excluding common headers)
         lines = text.split('\n')[:5]  # Check first 5 lines
@@ -330,7 +543,7 @@ class ResumeParser:
             return education_list
         
         # Split into potential education entries
-        entries = re.split(r'\n(?=[A-Z])', education_section)
+        entries = self._split_entries(education_section, self._is_capitalized_line)
         
         for entry in entries:
             if len(entry.strip()) > 10:  # Minimum length for valid entry
@@ -345,45 +558,26 @@ class ResumeParser:
         edu = Education()
         
         # Extract degree
-        degree_patterns = [
-            r'(bachelor|master|phd|doctorate|associate|diploma|certificate)[\s\w]*',
-            r'(b\.?[sa]\.?|m\.?[sa]\.?|ph\.?d\.?|mba)',
-            r'(undergraduate|graduate)'
-        ]
-        
-        for pattern in degree_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in self.degree_patterns:
+            match = pattern.search(entry)
             if match:
                 edu.degree = match.group().strip().title()
                 break
         
         # Extract institution (typically the longest capitalized phrase)
-        words = entry.split()
-        potential_institutions = []
-        
-        current_phrase = []
-        for word in words:
-            if word and word[0].isupper():
-                current_phrase.append(word)
-            else:
-                if len(current_phrase) >= 2:
-                    potential_institutions.append(' '.join(current_phrase))
-                current_phrase = []
-        
-        if current_phrase and len(current_phrase) >= 2:
-            potential_institutions.append(' '.join(current_phrase))
+        potential_institutions = self.institution_pattern.findall(entry)
         
         if potential_institutions:
             # Choose the longest as most likely to be institution name
             edu.institution = max(potential_institutions, key=len)
         
         # Extract graduation year
-        year_matches = re.findall(r'(19|20)\d{2}', entry)
+        year_matches = self.year_pattern.findall(entry)
         if year_matches:
             edu.graduation_year = int(year_matches[-1])  # Take the latest year
         
         # Extract GPA
-        gpa_match = re.search(r'gpa:?\s*([0-9.]+)', entry, re.IGNORECASE)
+        gpa_match = self.gpa_pattern.search(entry)
         if gpa_match:
             try:
                 edu.gpa = float(gpa_match.group(1))
@@ -401,7 +595,7 @@ class ResumeParser:
             return experience_list
         
         # Split into potential experience entries
-        entries = re.split(r'\n(?=[A-Z].*(?:at|@|\|))', experience_section)
+        entries = self._split_entries(experience_section, self._is_experience_header)
         
         for entry in entries:
             if len(entry.strip()) > 20:  # Minimum length for valid entry
@@ -439,12 +633,10 @@ class ResumeParser:
                 company = ' '.join(words[len(words)//2:])
         
         # Extract dates
-        date_pattern = r'(\d{1,2}/\d{2,4}|\w+\s+\d{4}|\d{4})'
         dates = []
         
         for line in lines[:3]:  # Check first 3 lines for dates
-            date_matches = re.findall(date_pattern, line)
-            dates.extend(date_matches)
+            dates.extend(self.date_pattern.findall(line))
         
         start_date = dates[0] if len(dates) > 0 else None
         end_date = dates[1] if len(dates) > 1 else "Present"
@@ -452,7 +644,7 @@ class ResumeParser:
         # Extract description (remaining lines)
         description = []
         for line in lines[1:]:
-            if not re.search(date_pattern, line):  # Skip lines with dates
+            if not self.date_pattern.search(line):  # Skip lines with dates
                 clean_line = line.strip('•-*')
                 if clean_line:
                     description.append(clean_line)
@@ -474,7 +666,7 @@ class ResumeParser:
             return projects
         
         # Split into potential project entries
-        entries = re.split(r'\n(?=[A-Z])', project_section)
+        entries = self._split_entries(project_section, self._is_capitalized_line)
         
         for entry in entries:
             if len(entry.strip()) > 15:
@@ -560,6 +752,30 @@ class ResumeParser:
         
         return awards
     
+    def _split_entries(self, section: str, is_entry_start) -> List[str]:
+        """Split a section into entries at lines accepted by ``is_entry_start``."""
+        lines = section.split('\n')
+        entries = []
+        start = 0
+        
+        for i in range(1, len(lines)):
+            if is_entry_start(lines[i]):
+                entries.append('\n'.join(lines[start:i]))
+                start = i
+        
+        entries.append('\n'.join(lines[start:]))
+        return entries
+    
+    @staticmethod
+    def _is_capitalized_line(line: str) -> bool:
+        """Check if line starts with an uppercase letter."""
+        return line[:1].isupper()
+    
+    @staticmethod
+    def _is_experience_header(line: str) -> bool:
+        """Check if line looks like a "Title at Company" experience header."""
+        return line[:1].isupper() and (' at ' in line or ' @ ' in line or ' | ' in line)
+    
     def _extract_section(self, text: str, section_keywords: List[str]) -> Optional[str]:
         """Extract a specific section from text."""
         lines = text.split('\n')
@@ -630,6 +846,61 @@ class ResumeParser:
         if not date_str or date_str.lower() == 'present':
             return None
         
+        # Bare 4-digit years need no regex
+        if len(date_str) == 4 and date_str.isdigit():
+            return int(date_str) if date_str[:2] in ('19', '20') else None
+        
         # Extract 4-digit year
-        year_match = re.search(r'(19|20)\d{2}', date_str)
-        return int(year_match.group()) if year_match else None
\ No newline at end of file
+        year_match = self.year_pattern.search(date_str)
+        return int(year_match.group()) if year_match else None
+    
+    def build_batch(self, resumes: List[ParsedResume]) -> ParsedResumeBatch:
+        """Flatten parsed resumes into a column-oriented batch for vectorized scoring."""
+        current_year = datetime.now().year
+        
+        experience_resume_index, titles, companies = [], [], []
+        start_years, end_years, durations_months = [], [], []
+        education_resume_index, degrees, institutions = [], [], []
+        graduation_years, gpas = [], []
+        total_experience_years = []
+        
+        for resume_idx, resume in enumerate(resumes):
+            total_experience_years.append(resume.total_experience_years or 0.0)
+            
+            for exp in resume.work_experience or []:
+                start_year = self._extract_year_from_date(exp.start_date) or 0
+                end_year = self._extract_year_from_date(exp.end_date) or current_year
+                if exp.duration_months is not None:
+                    duration = exp.duration_months
+                else:
+                    duration = max(0, (end_year - start_year) * 12) if start_year else 0
+                
+                experience_resume_index.append(resume_idx)
+                titles.append(exp.title)
+                companies.append(exp.company)
+                start_years.append(start_year)
+                end_years.append(end_year)
+                durations_months.append(duration)
+            
+            for edu in resume.education or []:
+                education_resume_index.append(resume_idx)
+                degrees.append(edu.degree)
+                institutions.append(edu.institution)
+                graduation_years.append(edu.graduation_year or 0)
+                gpas.append(edu.gpa if edu.gpa is not None else np.nan)
+        
+        return ParsedResumeBatch(
+            resume_count=len(resumes),
+            total_experience_years=np.asarray(total_experience_years, dtype=np.float32),
+            experience_resume_index=np.asarray(experience_resume_index, dtype=np.int32),
+            titles=titles,
+            companies=companies,
+            start_years=np.asarray(start_years, dtype=np.int16),
+            end_years=np.asarray(end_years, dtype=np.int16),
+            durations_months=np.asarray(durations_months, dtype=np.int16),
+            education_resume_index=np.asarray(education_resume_index, dtype=np.int32),
+            degrees=degrees,
+            institutions=institutions,
+            graduation_years=np.asarray(graduation_years, dtype=np.int16),
+            gpas=np.asarray(gpas, dtype=np.float32)
+        )
\ No newline at end of file
@@ -1,7 +1,11 @@
+import re
+import heapq
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from app.core.ai_pipeline.skill_extractor import SkillProfile
 from app.core.ai_pipeline.semantic_matcher import SemanticMatchResult
 from app.core.ai_pipeline.resume_parser import ParsedResume
@@ -9,10 +13,88 @@ from app.core.ai_pipeline.jd_parser import ParsedJobDescription
 from app.config import settings
 from app.core.utils.logger import get_logger
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-keyword substring scans
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
+# Keyword tables scanned in job description text
+SOFT_SKILL_KEYWORDS = (
+    'leadership', 'communication', 'teamwork', 'collaboration',
+    'problem solving', 'analytical', 'creative', 'adaptable',
+    'organized', 'detail-oriented', 'time management', 'interpersonal'
+)
+# Zero-width lookahead so overlapping keywords are all reported, like `in`
+SOFT_SKILL_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, SOFT_SKILL_KEYWORDS)) + '))'
+)
 
-@dataclass
+# Education hierarchy for resume degrees; JD requirements also treat a
+# generic "degree" as bachelor level
+EDUCATION_LEVELS = MappingProxyType({
+    'phd': 5, 'doctorate': 5, 'doctoral': 5,
+    'master': 4, 'mba': 4, 'ms': 4, 'ma': 4,
+    'bachelor': 3, 'bs': 3, 'ba': 3,
+    'associate': 2,
+    'diploma': 1, 'certificate': 1
+})
+REQUIRED_EDUCATION_LEVELS = MappingProxyType({**EDUCATION_LEVELS, 'degree': 3})
+EDUCATION_LEVEL_PATTERN = re.compile(
+    r'\b(' + '|'.join(REQUIRED_EDUCATION_LEVELS) + r')s?\b'
+)
+
+# Markers that flag a required skill as a must-have
+CRITICAL_SKILL_KEYWORDS = ('required', 'must', 'essential', 'mandatory')
+
+YEAR_PATTERN = re.compile(r'(?:19|20)\d{2}')
+
+# Domains in priority order; the first domain with any keyword hit wins
+DOMAIN_KEYWORDS = (
+    ('software', ('software', 'programming', 'development', 'engineering', 'computer')),
+    ('data', ('data', 'analytics', 'science', 'machine learning', 'statistics')),
+    ('marketing', ('marketing', 'digital', 'campaign', 'brand', 'advertising')),
+    ('finance', ('finance', 'accounting', 'financial', 'investment', 'banking')),
+    ('sales', ('sales', 'business development', 'revenue', 'client', 'customer'))
+)
+DOMAIN_KEYWORD_MAP = MappingProxyType(dict(DOMAIN_KEYWORDS))
+DOMAIN_BY_KEYWORD = MappingProxyType(
+    {keyword: domain for domain, keywords in DOMAIN_KEYWORDS for keyword in keywords}
+)
+DOMAIN_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, DOMAIN_BY_KEYWORD)) + '))'
+)
+
+# Years-of-experience tiers: ratio of candidate to required years at which
+# each score in YEARS_RATIO_SCORES starts (index 0 is scaled, see
+# _years_experience_tier). Extra experience beyond the requirement is capped
+# at 1.0.
+YEARS_RATIO_BINS = np.array([0.5, 0.75, 1.0])
+YEARS_RATIO_SCORES = np.array([0.0, 0.6, 0.8, 1.0])
+
+# Mix of (years, relevance) in the experience score and
+# (level, relevance) in the education score
+EXPERIENCE_MIX = np.array([0.6, 0.4])
+EDUCATION_MIX = np.array([0.6, 0.4])
+
+# Verdict labels indexed by integer level (0 = lowest)
+SUITABILITY_LABELS = np.array(["Low", "Medium", "High"])
+CONFIDENCE_LABELS = np.array(["low", "medium", "high"])
+
+
+@lru_cache(maxsize=256)
+def _critical_skills(required_skills: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the required skills flagged as must-haves, memoized per JD skill list."""
+    critical_skills = []
+    for skill in required_skills:
+        skill_lower = skill.lower()
+        if any(keyword in skill_lower for keyword in CRITICAL_SKILL_KEYWORDS):
+            critical_skills.append(skill)
+    return tuple(critical_skills)
+
+
+@dataclass(slots=True, frozen=True)
 class ScoringWeights:
     """Configuration for scoring weights."""
     hard_skills: float = 0.35
@@ -26,9 +108,29 @@ class ScoringWeights:
         total = self.hard_skills + self.soft_skills + self.experience + self.education + self.semantic_match
         if abs(total - 1.0) > 0.01:
             raise ValueError(f"Scoring weights must sum to 1.0, got {total}")
+    
+    def to_array(self) -> np.ndarray:
+        """Return weights in component order (hard, soft, experience, education, semantic)."""
+        return np.array(
+            [self.hard_skills, self.soft_skills, self.experience, self.education, self.semantic_match],
+            dtype=np.float64
+        )
 
 
 @dataclass
+class JDFeatures:
+    """Job-description-derived features, computed once per JD and reused for every resume."""
+    combined_text: str  # Lowercased raw content plus requirements
+    soft_skills: List[str]
+    required_education_level: int
+    domain_keywords: List[str]
+    critical_skills: Tuple[str, ...]
+    title_tokens: frozenset  # Lowercased JD title words
+    company_tokens: frozenset  # Lowercased JD company words
+    jd_keywords_set: frozenset  # Lowercased required-skill and responsibility tokens
+
+
+@dataclass(slots=True, frozen=True)
 class DetailedScores:
     """Detailed breakdown of all scoring components."""
     # Main component scores (0-100)
@@ -59,7 +161,7 @@ class DetailedScores:
     overall_confidence: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinalScore:
     """Final scoring result with verdict."""
     overall_score: float  # 0-100
@@ -96,6 +198,10 @@ class AdvancedScoringEngine:
     def __init__(self, weights: Optional[ScoringWeights] = None):
         self.weights = weights or ScoringWeights()
         self.weights.validate()
+        self._weights_vec = self.weights.to_array()
+        self._keyword_automaton = self._build_keyword_automaton()
+        # Reference year for recency weighting, refreshed once per scoring call
+        self._now_year = datetime.now().year
         
         # Thresholds for different components
         self.thresholds = {
@@ -105,39 +211,101 @@ class AdvancedScoringEngine:
             'experience_penalty_threshold': 0.5,
             'education_boost_threshold': 0.8
         }
+        # Ascending score thresholds for branchless batch verdicts
+        self._suitability_thresholds = np.array(
+            [self.thresholds['low_score'], self.thresholds['medium_score'], self.thresholds['high_score']],
+            dtype=np.float64
+        )
+    
+    def _build_keyword_automaton(self):
+        """Build one Aho-Corasick automaton over all JD keyword tables."""
+        if ahocorasick is None:
+            return None
+        
+        payloads: Dict[str, List[Tuple[str, object]]] = {}
+        for skill in SOFT_SKILL_KEYWORDS:
+            payloads.setdefault(skill, []).append(('soft_skill', skill))
+        for keyword, domain in DOMAIN_BY_KEYWORD.items():
+            payloads.setdefault(keyword, []).append(('domain', domain))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, payload in payloads.items():
+            automaton.add_word(keyword, tuple(payload))
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan_keywords(self, text: str) -> Dict[str, Set]:
+        """Collect keyword table hits in a single automaton pass over the text."""
+        hits: Dict[str, Set] = {'soft_skill': set(), 'domain': set()}
+        for _, payload in self._keyword_automaton.iter(text):
+            for category, value in payload:
+                hits[category].add(value)
+        return hits
+    
+    def prepare_jd(self, jd_parsed: ParsedJobDescription) -> JDFeatures:
+        """Extract the job-description features shared by every resume scored against it."""
+        jd_text = (jd_parsed.raw_content or '').lower()
+        requirements = ' '.join(jd_parsed.requirements or []).lower()
+        combined_text = jd_text + ' ' + requirements
+        domain_text = jd_parsed.title.lower() + ' ' + jd_text
+        
+        if self._keyword_automaton is not None:
+            hits = self._scan_keywords(combined_text)
+            soft_skills = [skill for skill in SOFT_SKILL_KEYWORDS if skill in hits['soft_skill']]
+            
+            domain_hits = self._scan_keywords(domain_text)['domain']
+            matched_domain = next((domain for domain, _ in DOMAIN_KEYWORDS if domain in domain_hits), None)
+            domain_keywords = list(DOMAIN_KEYWORD_MAP[matched_domain][:5]) if matched_domain else []
+        else:
+            soft_skills = self._extract_soft_skills_from_jd(combined_text)
+            domain_keywords = self._extract_job_domain_keywords(domain_text)
+        
+        required_education_level = self._extract_required_education_level(combined_text)
+        
+        # Tokens matched against work experience descriptions
+        jd_keywords = set()
+        for phrase in (jd_parsed.required_skills or []) + (jd_parsed.responsibilities or []):
+            jd_keywords.update(phrase.lower().split())
+        
+        return JDFeatures(
+            combined_text=combined_text,
+            soft_skills=soft_skills,
+            required_education_level=required_education_level,
+            domain_keywords=domain_keywords,
+            critical_skills=self._identify_critical_skills(jd_parsed.required_skills or []),
+            title_tokens=frozenset((jd_parsed.title or '').lower().split()),
+            company_tokens=frozenset((jd_parsed.company or '').lower().split()),
+            jd_keywords_set=frozenset(jd_keywords)
+        )
+    
     def calculate_comprehensive_score(
         self,
         parsed_resume: ParsedResume,
         skill_profile: SkillProfile,
         semantic_match: SemanticMatchResult,
-        jd_parsed: ParsedJobDescription
+        jd_parsed: ParsedJobDescription,
+        jd_features: Optional[JDFeatures] = None
     ) -> FinalScore:
-        """Calculate comprehensive score with detailed breakdown."""
+        """Calculate comprehensive score with detailed breakdown.
+        
+        Pass ``jd_features`` from ``prepare_jd`` when scoring several resumes
+        against the same job description.
+        """
         
         logger.info("Calculating comprehensive score")
         
-        # Calculate individual component scores
-        hard_skills_score = self._calculate_hard_skills_score(skill_profile, semantic_match, jd_parsed)
-        soft_skills_score = self._calculate_soft_skills_score(skill_profile, jd_parsed)
-        experience_score = self._calculate_experience_score(parsed_resume, jd_parsed)
-        education_score = self._calculate_education_score(parsed_resume, jd_parsed)
-        semantic_score = self._calculate_semantic_score(semantic_match)
+        self._now_year = datetime.now().year
+        if jd_features is None:
+            jd_features = self.prepare_jd(jd_parsed)
         
-        # Calculate weighted overall score
-        overall_score = (
-            hard_skills_score * self.weights.hard_skills +
-            soft_skills_score * self.weights.soft_skills +
-            experience_score * self.weights.experience +
-            education_score * self.weights.education +
-            semantic_score * self.weights.semantic_match
-        ) * 100
-        
-        # Calculate detailed sub-scores
-        detailed_scores = self._calculate_detailed_scores(
-            parsed_resume, skill_profile, semantic_match, jd_parsed,
-            hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score
+        # Calculate individual component scores and detailed sub-scores
+        component_scores, detailed_scores = self._calculate_component_scores(
+            parsed_resume, skill_profile, semantic_match, jd_parsed, jd_features
         )
         
+        # Calculate weighted overall score
+        overall_score = float(self._weights_vec @ np.array(component_scores, dtype=np.float64)) * 100
+        
         # Determine suitability
         suitability = self._determine_suitability(overall_score, detailed_scores)
         
@@ -151,11 +319,91 @@ class AdvancedScoringEngine:
             confidence_level=confidence_level
         )
     
+    def score_batch(
+        self,
+        parsed_resumes: List[ParsedResume],
+        skill_profiles: List[SkillProfile],
+        semantic_matches: List[SemanticMatchResult],
+        jd_parsed: ParsedJobDescription
+    ) -> List[FinalScore]:
+        """Score many resumes against one job description.
+        
+        Component scores are still computed per resume, but the weighted
+        overall score, suitability and confidence verdicts are vectorized
+        across the whole batch.
+        """
+        
+        n_resumes = len(parsed_resumes)
+        if not (len(skill_profiles) == len(semantic_matches) == n_resumes):
+            raise ValueError("parsed_resumes, skill_profiles and semantic_matches must have the same length")
+        if n_resumes == 0:
+            return []
+        
+        logger.info(f"Calculating comprehensive scores for {n_resumes} resumes")
+        
+        self._now_year = datetime.now().year
+        jd_features = self.prepare_jd(jd_parsed)
+        components = np.empty((n_resumes, 5), dtype=np.float64)
+        detailed_scores_list = []
+        
+        for i, (parsed_resume, skill_profile, semantic_match) in enumerate(
+            zip(parsed_resumes, skill_profiles, semantic_matches)
+        ):
+            components[i], detailed_scores = self._calculate_component_scores(
+                parsed_resume, skill_profile, semantic_match, jd_parsed, jd_features
+            )
+            detailed_scores_list.append(detailed_scores)
+        
+        overall_scores = components @ self._weights_vec * 100
+        suitabilities = self._determine_suitability_batch(overall_scores, detailed_scores_list)
+        confidence_levels = self._calculate_confidence_level_batch(parsed_resumes, detailed_scores_list)
+        
+        return [
+            FinalScore(
+                overall_score=round(float(overall_score), 1),
+                detailed_scores=detailed_scores,
+                suitability=str(suitability),
+                confidence_level=str(confidence_level)
+            )
+            for overall_score, detailed_scores, suitability, confidence_level in zip(
+                overall_scores, detailed_scores_list, suitabilities, confidence_levels
+            )
+        ]
+    
+    def _calculate_component_scores(
+        self,
+        parsed_resume: ParsedResume,
+        skill_profile: SkillProfile,
+        semantic_match: SemanticMatchResult,
+        jd_parsed: ParsedJobDescription,
+        jd_features: JDFeatures
+    ) -> Tuple[Tuple[float, float, float, float, float], DetailedScores]:
+        """Calculate the five weighted component scores and the detailed breakdown."""
+        hard_skills_score = self._calculate_hard_skills_score(skill_profile, semantic_match, jd_parsed, jd_features)
+        soft_skills_score = self._calculate_soft_skills_score(skill_profile, jd_features)
+        experience_score, years_score, experience_relevance_score = self._calculate_experience_score(
+            parsed_resume, jd_parsed, jd_features
+        )
+        education_score, education_level_score, education_relevance_score = self._calculate_education_score(
+            parsed_resume, jd_features
+        )
+        semantic_score = self._calculate_semantic_score(semantic_match)
+        
+        # Sub-scores computed above are reused rather than recalculated
+        detailed_scores = self._calculate_detailed_scores(
+            parsed_resume, skill_profile, semantic_match, jd_parsed,
+            hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score,
+            years_score, experience_relevance_score, education_level_score, education_relevance_score
+        )
+        
+        return (hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score), detailed_scores
+    
     def _calculate_hard_skills_score(
         self, 
         skill_profile: SkillProfile, 
         semantic_match: SemanticMatchResult,
-        jd_parsed: ParsedJobDescription
+        jd_parsed: ParsedJobDescription,
+        jd_features: JDFeatures
     ) -> float:
         """Calculate hard/technical skills score."""
         
@@ -163,7 +411,8 @@ class AdvancedScoringEngine:
             return 0.5  # Neutral score if no required skills specified
         
         total_required = len(jd_parsed.required_skills)
-        matched_skills = len([m for m in semantic_match.skill_matches if m.confidence >= 0.7])
+        confidences = semantic_match.confidences
+        matched_skills = int(np.count_nonzero(confidences >= 0.7))
         
         # Base matching score
         base_score = matched_skills / total_required if total_required > 0 else 0
@@ -172,34 +421,32 @@ class AdvancedScoringEngine:
         diversity_bonus = skill_profile.skill_diversity_score * 0.2
         
         # Bonus for high-confidence matches
-        high_confidence_matches = len([m for m in semantic_match.skill_matches if m.confidence >= 0.9])
+        high_confidence_matches = int(np.count_nonzero(confidences >= 0.9))
         confidence_bonus = (high_confidence_matches / total_required) * 0.1 if total_required > 0 else 0
         
         # Penalty for critical missing skills
-        critical_skills = self._identify_critical_skills(jd_parsed.required_skills)
-        missing_critical = len([s for s in critical_skills if s in semantic_match.missing_skills])
+        critical_skills = jd_features.critical_skills
+        missing_skills = semantic_match.missing_skills_set
+        missing_critical = sum(1 for s in critical_skills if s.lower() in missing_skills)
         critical_penalty = (missing_critical / len(critical_skills)) * 0.3 if critical_skills else 0
         
         final_score = base_score + diversity_bonus + confidence_bonus - critical_penalty
         return max(0, min(1, final_score))
     
-    def _calculate_soft_skills_score(self, skill_profile: SkillProfile, jd_parsed: ParsedJobDescription) -> float:
+    def _calculate_soft_skills_score(self, skill_profile: SkillProfile, jd_features: JDFeatures) -> float:
         """Calculate soft skills score."""
         
-        # Extract soft skills from JD requirements
-        jd_soft_skills = self._extract_soft_skills_from_jd(jd_parsed)
+        # Soft skills mentioned in JD requirements
+        jd_soft_skills = jd_features.soft_skills
         
         if not jd_soft_skills:
             # If no specific soft skills mentioned, score based on presence
             return 0.8 if skill_profile.soft_skills else 0.3
         
-        # Match soft skills
-        resume_soft_skills = [s.name.lower() for s in skill_profile.soft_skills]
-        matched_soft_skills = 0
-        
-        for jd_skill in jd_soft_skills:
-            if any(jd_skill.lower() in resume_skill for resume_skill in resume_soft_skills):
-                matched_soft_skills += 1
+        # Match soft skills: JD keywords are already lowercase, and joining on a
+        # newline keeps a keyword from matching across two skill names
+        resume_soft_skills = '\n'.join(s.name_lower for s in skill_profile.soft_skills)
+        matched_soft_skills = sum(1 for jd_skill in jd_soft_skills if jd_skill in resume_soft_skills)
         
         base_score = matched_soft_skills / len(jd_soft_skills) if jd_soft_skills else 0
         
@@ -208,17 +455,23 @@ class AdvancedScoringEngine:
         
         return min(1, base_score + variety_bonus)
     
-    def _calculate_experience_score(self, parsed_resume: ParsedResume, jd_parsed: ParsedJobDescription) -> float:
-        """Calculate experience score based on years and relevance."""
+    def _calculate_experience_score(
+        self, parsed_resume: ParsedResume, jd_parsed: ParsedJobDescription, jd_features: JDFeatures
+    ) -> Tuple[float, float, float]:
+        """Calculate experience score based on years and relevance.
+        
+        Returns ``(experience_score, years_score, relevance_score)``.
+        """
         
         # Years of experience component
         years_score = self._calculate_years_experience_score(parsed_resume, jd_parsed)
         
         # Experience relevance component
-        relevance_score = self._calculate_experience_relevance_score(parsed_resume, jd_parsed)
+        relevance_score = self._calculate_experience_relevance_score(parsed_resume, jd_features)
         
         # Combine with weights
-        return years_score * 0.6 + relevance_score * 0.4
+        experience_score = float(EXPERIENCE_MIX @ np.array([years_score, relevance_score]))
+        return experience_score, years_score, relevance_score
     
     def _calculate_years_experience_score(self, parsed_resume: ParsedResume, jd_parsed: ParsedJobDescription) -> float:
         """Calculate score based on years of experience."""
@@ -226,90 +479,89 @@ class AdvancedScoringEngine:
         candidate_years = parsed_resume.total_experience_years or 0
         required_years = jd_parsed.required_experience_years or 2  # Default to 2 years if not specified
         
-        if candidate_years >= required_years:
-            # Full score if meets requirement, bonus for significant experience
-            base_score = 1.0
-            if candidate_years > required_years * 1.5:
-                return min(1.0, base_score + 0.1)  # 10% bonus for 50% more experience
-            return base_score
-        else:
-            # Partial score based on how close they are
-            ratio = candidate_years / required_years
-            if ratio >= 0.75:  # 75% of required experience
-                return 0.8
-            elif ratio >= 0.5:  # 50% of required experience
-                return 0.6
-            else:
-                return ratio * 0.5  # Steep penalty for very little experience
-    
-    def _calculate_experience_relevance_score(self, parsed_resume: ParsedResume, jd_parsed: ParsedJobDescription) -> float:
+        return float(self._years_experience_tier(candidate_years / required_years))
+    
+    @staticmethod
+    def _years_experience_tier(ratio):
+        """Map candidate/required years ratio(s) to a score without branching.
+        
+        Meeting the requirement scores 1.0, 75% scores 0.8, 50% scores 0.6 and
+        anything less is penalized steeply at ``ratio * 0.5``. Accepts a scalar
+        or an array of ratios.
+        """
+        ratio = np.asarray(ratio, dtype=np.float64)
+        tier = np.searchsorted(YEARS_RATIO_BINS, ratio, side='right')
+        return np.where(tier == 0, ratio * 0.5, YEARS_RATIO_SCORES[tier])
+    
+    def _calculate_experience_relevance_score(self, parsed_resume: ParsedResume, jd_features: JDFeatures) -> float:
         """Calculate relevance of work experience to the job."""
         
-        if not parsed_resume.work_experience:
+        work_experience = parsed_resume.work_experience
+        if not work_experience:
             return 0.2
         
-        relevance_scores = []
+        # JD-side tokens are loop invariant; bind them once for all entries
+        jd_tokens = (jd_features.title_tokens, jd_features.company_tokens, jd_features.jd_keywords_set)
         
-        for exp in parsed_resume.work_experience:
-            # Check if job title contains relevant keywords
-            title_relevance = self._calculate_title_relevance(exp.title, jd_parsed.title)
-            
-            # Check if company industry is relevant
-            industry_relevance = self._calculate_industry_relevance(exp.company, jd_parsed.company)
-            
-            # Check if description contains relevant terms
-            description_relevance = self._calculate_description_relevance(exp.description or [], jd_parsed)
-            
-            # Weight recent experience more heavily
-            recency_weight = self._calculate_recency_weight(exp.end_date)
-            
-            exp_relevance = (title_relevance * 0.4 + industry_relevance * 0.2 + description_relevance * 0.4) * recency_weight
-            relevance_scores.append(exp_relevance)
+        if len(work_experience) == 1:
+            return self._calculate_single_experience_relevance(work_experience[0], *jd_tokens)
         
         # Return weighted average with more weight on most relevant experiences
-        relevance_scores.sort(reverse=True)
-        if len(relevance_scores) >= 3:
-            return (relevance_scores[0] * 0.5 + relevance_scores[1] * 0.3 + relevance_scores[2] * 0.2)
-        elif len(relevance_scores) == 2:
-            return (relevance_scores[0] * 0.7 + relevance_scores[1] * 0.3)
+        single_relevance = self._calculate_single_experience_relevance
+        top_scores = heapq.nlargest(3, (single_relevance(exp, *jd_tokens) for exp in work_experience))
+        if len(top_scores) == 3:
+            return (top_scores[0] * 0.5 + top_scores[1] * 0.3 + top_scores[2] * 0.2)
         else:
-            return relevance_scores[0] if relevance_scores else 0
+            return (top_scores[0] * 0.7 + top_scores[1] * 0.3)
+    
+    def _calculate_single_experience_relevance(
+        self, exp, jd_title_tokens: frozenset, jd_company_tokens: frozenset, jd_keywords_set: frozenset
+    ) -> float:
+        """Calculate recency-weighted relevance of one work experience entry."""
+        # Check if job title contains relevant keywords
+        title_relevance = self._calculate_title_relevance(exp.title, jd_title_tokens)
+        
+        # Check if company industry is relevant
+        industry_relevance = self._calculate_industry_relevance(exp.company, jd_company_tokens)
+        
+        # Check if description contains relevant terms
+        description_relevance = self._calculate_description_relevance(exp.description or [], jd_keywords_set)
+        
+        # Weight recent experience more heavily
+        recency_weight = self._calculate_recency_weight(exp.end_date)
+        
+        return (title_relevance * 0.4 + industry_relevance * 0.2 + description_relevance * 0.4) * recency_weight
     
-    def _calculate_education_score(self, parsed_resume: ParsedResume, jd_parsed: ParsedJobDescription) -> float:
-        """Calculate education score."""
+    def _calculate_education_score(self, parsed_resume: ParsedResume, jd_features: JDFeatures) -> Tuple[float, float, float]:
+        """Calculate education score.
         
-        if not parsed_resume.education:
-            return 0.3  # Base score for no education info
+        Returns ``(education_score, level_score, relevance_score)``.
+        """
         
-        education_level_score = self._calculate_education_level_score(parsed_resume.education, jd_parsed)
-        education_relevance_score = self._calculate_education_relevance_score(parsed_resume.education, jd_parsed)
+        education_list = parsed_resume.education or []
+        education_level_score = self._calculate_education_level_score(education_list, jd_features)
+        education_relevance_score = self._calculate_education_relevance_score(education_list, jd_features)
         
-        return education_level_score * 0.6 + education_relevance_score * 0.4
+        if not education_list:
+            # Base score for no education info
+            return 0.3, education_level_score, education_relevance_score
+        
+        education_score = float(EDUCATION_MIX @ np.array([education_level_score, education_relevance_score]))
+        return education_score, education_level_score, education_relevance_score
     
-    def _calculate_education_level_score(self, education_list, jd_parsed: ParsedJobDescription) -> float:
+    def _calculate_education_level_score(self, education_list, jd_features: JDFeatures) -> float:
         """Calculate score based on education level."""
         
         # Define education hierarchy
-        education_levels = {
-            'phd': 5, 'doctorate': 5, 'doctoral': 5,
-            'master': 4, 'mba': 4, 'ms': 4, 'ma': 4,
-            'bachelor': 3, 'bs': 3, 'ba': 3,
-            'associate': 2,
-            'diploma': 1, 'certificate': 1
-        }
-        
         # Find highest education level
         max_level = 0
         for edu in education_list:
             if edu.degree:
-                degree_lower = edu.degree.lower()
-                for level_name, level_value in education_levels.items():
-                    if level_name in degree_lower:
-                        max_level = max(max_level, level_value)
-                        break
+                for match in EDUCATION_LEVEL_PATTERN.finditer(edu.degree.lower()):
+                    max_level = max(max_level, EDUCATION_LEVELS.get(match.group(1), 0))
         
-        # Extract required education level from JD
-        required_level = self._extract_required_education_level(jd_parsed)
+        # Required education level from JD
+        required_level = jd_features.required_education_level
         
         if max_level >= required_level:
             return 1.0
@@ -318,10 +570,10 @@ class AdvancedScoringEngine:
         else:
             return 0.5
     
-    def _calculate_education_relevance_score(self, education_list, jd_parsed: ParsedJobDescription) -> float:
+    def _calculate_education_relevance_score(self, education_list, jd_features: JDFeatures) -> float:
         """Calculate relevance of education to the job."""
         
-        job_keywords = self._extract_job_domain_keywords(jd_parsed)
+        job_keywords = jd_features.domain_keywords
         if not job_keywords:
             return 0.7  # Neutral score if can't determine relevance
         
@@ -340,58 +592,63 @@ class AdvancedScoringEngine:
     
     def _calculate_detailed_scores(
         self, parsed_resume, skill_profile, semantic_match, jd_parsed,
-        hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score
+        hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score,
+        years_score, experience_relevance_score, education_level_score, education_relevance_score
     ) -> DetailedScores:
         """Calculate detailed breakdown of all scores."""
         
-        # Technical sub-scores
-        technical_skills = [s for s in skill_profile.technical_skills]
-        domain_expertise = [s for s in skill_profile.domain_expertise]
-        tools_platforms = [s for s in skill_profile.tools_platforms]
-        
-        technical_skills_score = len(technical_skills) / 10 * 100  # Normalize to 0-100
-        domain_expertise_score = len(domain_expertise) / 5 * 100
-        tools_platforms_score = len(tools_platforms) / 8 * 100
-        
-        # Experience sub-scores
-        years_experience_score = self._calculate_years_experience_score(parsed_resume, jd_parsed) * 100
-        experience_relevance_score = self._calculate_experience_relevance_score(parsed_resume, jd_parsed) * 100
-        
-        # Education sub-scores
-        education_level_score = self._calculate_education_level_score(parsed_resume.education or [], jd_parsed) * 100
-        education_relevance_score = self._calculate_education_relevance_score(parsed_resume.education or [], jd_parsed) * 100
-        
         # Matching statistics
         skills_matched = len(semantic_match.skill_matches)
         skills_required = len(jd_parsed.required_skills) if jd_parsed.required_skills else 0
         skills_missing = len(semantic_match.missing_skills)
         skills_additional = len(semantic_match.additional_skills)
         
-        # Confidence metrics
-        parsing_confidence = parsed_resume.parsing_confidence * 100
-        matching_confidence = np.mean([m.confidence for m in semantic_match.skill_matches]) * 100 if semantic_match.skill_matches else 50
+        # Confidence metrics (0-1)
+        parsing_confidence = parsed_resume.parsing_confidence
+        skill_matches = semantic_match.skill_matches
+        matching_confidence = sum(m.confidence for m in skill_matches) / len(skill_matches) if skill_matches else 0.5
         overall_confidence = (parsing_confidence + matching_confidence) / 2
         
+        # Scale every 0-1 score to 0-100 and round them in one pass
+        scores = np.array([
+            hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score,
+            # Technical sub-scores, normalized by a typical profile size
+            len(skill_profile.technical_skills) / 10,
+            len(skill_profile.domain_expertise) / 5,
+            len(skill_profile.tools_platforms) / 8,
+            years_score, experience_relevance_score,
+            education_level_score, education_relevance_score,
+            parsing_confidence, matching_confidence, overall_confidence
+        ], dtype=np.float64) * 100
+        np.minimum(scores[5:8], 100, out=scores[5:8])
+        (
+            hard_skills_score, soft_skills_score, experience_score, education_score, semantic_score,
+            technical_skills_score, domain_expertise_score, tools_platforms_score,
+            years_experience_score, experience_relevance_score,
+            education_level_score, education_relevance_score,
+            parsing_confidence, matching_confidence, overall_confidence
+        ) = np.round(scores, 1).tolist()
+        
         return DetailedScores(
-            hard_skills_score=round(hard_skills_score * 100, 1),
-            soft_skills_score=round(soft_skills_score * 100, 1),
-            experience_score=round(experience_score * 100, 1),
-            education_score=round(education_score * 100, 1),
-            semantic_match_score=round(semantic_score * 100, 1),
-            technical_skills_score=round(min(technical_skills_score, 100), 1),
-            domain_expertise_score=round(min(domain_expertise_score, 100), 1),
-            tools_platforms_score=round(min(tools_platforms_score, 100), 1),
-            years_experience_score=round(years_experience_score, 1),
-            experience_relevance_score=round(experience_relevance_score, 1),
-            education_level_score=round(education_level_score, 1),
-            education_relevance_score=round(education_relevance_score, 1),
+            hard_skills_score=hard_skills_score,
+            soft_skills_score=soft_skills_score,
+            experience_score=experience_score,
+            education_score=education_score,
+            semantic_match_score=semantic_score,
+            technical_skills_score=technical_skills_score,
+            domain_expertise_score=domain_expertise_score,
+            tools_platforms_score=tools_platforms_score,
+            years_experience_score=years_experience_score,
+            experience_relevance_score=experience_relevance_score,
+            education_level_score=education_level_score,
+            education_relevance_score=education_relevance_score,
             skills_matched_count=skills_matched,
             skills_required_count=skills_required,
             skills_missing_count=skills_missing,
             skills_additional_count=skills_additional,
-            parsing_confidence=round(parsing_confidence, 1),
-            matching_confidence=round(matching_confidence, 1),
-            overall_confidence=round(overall_confidence, 1)
+            parsing_confidence=parsing_confidence,
+            matching_confidence=matching_confidence,
+            overall_confidence=overall_confidence
         )
     
     def _determine_suitability(self, overall_score: float, detailed_scores: DetailedScores) -> str:
@@ -428,6 +685,55 @@ class AdvancedScoringEngine:
         
         return base_suitability
     
+    def _determine_suitability_batch(self, overall_scores: np.ndarray, detailed_scores_list: List[DetailedScores]) -> np.ndarray:
+        """Vectorized equivalent of ``_determine_suitability`` over a batch."""
+        
+        skills_missing = np.array([d.skills_missing_count for d in detailed_scores_list])
+        skills_matched = np.array([d.skills_matched_count for d in detailed_scores_list])
+        experience = np.array([d.experience_score for d in detailed_scores_list])
+        hard_skills = np.array([d.hard_skills_score for d in detailed_scores_list])
+        education = np.array([d.education_score for d in detailed_scores_list])
+        confidence = np.array([d.overall_confidence for d in detailed_scores_list])
+        
+        # Base level from overall score: 0 = Low, 1 = Medium, 2 = High
+        # (scores below the low threshold are still Low)
+        level = np.searchsorted(self._suitability_thresholds, overall_scores, side='right') - 1
+        level = np.clip(level, 0, 2)
+        
+        # Downgrade if more skills are missing than matched
+        level = np.clip(level - (skills_missing > skills_matched), 0, 2)
+        
+        # Upgrade if exceptional in one area
+        exceptional = (experience >= 90) | (hard_skills >= 95) | (education >= 90)
+        level += exceptional & (level == 0) & (overall_scores >= 50)
+        
+        # Consider confidence level
+        level -= (confidence < 60) & (level == 2)
+        
+        return SUITABILITY_LABELS[level]
+    
+    def _calculate_confidence_level_batch(self, parsed_resumes: List[ParsedResume], detailed_scores_list: List[DetailedScores]) -> np.ndarray:
+        """Vectorized equivalent of ``_calculate_confidence_level`` over a batch."""
+        
+        parsing = np.array([d.parsing_confidence for d in detailed_scores_list]) / 100
+        matching = np.array([d.matching_confidence for d in detailed_scores_list]) / 100
+        matched = np.array([d.skills_matched_count for d in detailed_scores_list])
+        required = np.array([d.skills_required_count for d in detailed_scores_list])
+        has_email = np.array([bool(r.contact_info.email) for r in parsed_resumes])
+        has_experience = np.array([bool(r.work_experience) for r in parsed_resumes])
+        
+        confidence_factors = np.stack([
+            parsing,
+            matching,
+            np.minimum(matched / np.maximum(required, 1), 1.0),
+            np.where(has_email, 1.0, 0.5),
+            np.where(has_experience, 1.0, 0.3)
+        ], axis=1)
+        avg_confidence = confidence_factors.mean(axis=1)
+        
+        level = np.where(avg_confidence >= 0.8, 2, np.where(avg_confidence >= 0.6, 1, 0))
+        return CONFIDENCE_LABELS[level]
+    
     def _calculate_confidence_level(self, parsed_resume, semantic_match, detailed_scores) -> str:
         """Calculate overall confidence in the evaluation."""
         
@@ -439,7 +745,7 @@ class AdvancedScoringEngine:
             1.0 if parsed_resume.work_experience else 0.3,  # Has work experience
         ]
         
-        avg_confidence = np.mean(confidence_factors)
+        avg_confidence = sum(confidence_factors) / len(confidence_factors)
         
         if avg_confidence >= 0.8:
             return "high"
@@ -450,79 +756,52 @@ class AdvancedScoringEngine:
     
     # Helper methods for specific calculations
     
-    def _identify_critical_skills(self, required_skills: List[str]) -> List[str]:
+    def _identify_critical_skills(self, required_skills: List[str]) -> Tuple[str, ...]:
         """Identify critical skills that are must-haves."""
-        critical_keywords = ['required', 'must', 'essential', 'mandatory']
-        return [skill for skill in required_skills if any(keyword in skill.lower() for keyword in critical_keywords)]
-    
-    def _extract_soft_skills_from_jd(self, jd_parsed: ParsedJobDescription) -> List[str]:
-        """Extract soft skills mentioned in job description."""
-        soft_skill_keywords = [
-            'leadership', 'communication', 'teamwork', 'collaboration',
-            'problem solving', 'analytical', 'creative', 'adaptable',
-            'organized', 'detail-oriented', 'time management', 'interpersonal'
-        ]
-        
-        jd_text = (jd_parsed.raw_content or '').lower()
-        requirements = ' '.join(jd_parsed.requirements or []).lower()
-        combined_text = jd_text + ' ' + requirements
-        
-        found_skills = []
-        for skill in soft_skill_keywords:
-            if skill in combined_text:
-                found_skills.append(skill)
-        
-        return found_skills
+        return _critical_skills(tuple(required_skills))
     
-    def _calculate_title_relevance(self, resume_title: str, jd_title: str) -> float:
-        """Calculate relevance between job titles."""
-        if not resume_title or not jd_title:
+    def _extract_soft_skills_from_jd(self, combined_text: str) -> List[str]:
+        """Extract soft skills mentioned in lowercased job description text."""
+        found = {match.group(1) for match in SOFT_SKILL_PATTERN.finditer(combined_text)}
+        return [skill for skill in SOFT_SKILL_KEYWORDS if skill in found]
+    
+    def _calculate_title_relevance(self, resume_title: str, jd_title_tokens: frozenset) -> float:
+        """Calculate Jaccard relevance between a job title and pre-tokenized JD title."""
+        if not resume_title or not jd_title_tokens:
             return 0.5
         
-        resume_words = set(resume_title.lower().split())
-        jd_words = set(jd_title.lower().split())
-        
-        common_words = resume_words.intersection(jd_words)
-        total_words = resume_words.union(jd_words)
+        resume_words = frozenset(resume_title.lower().split())
+        total_words = resume_words | jd_title_tokens
         
-        return len(common_words) / len(total_words) if total_words else 0
+        return len(resume_words & jd_title_tokens) / len(total_words)
     
-    def _calculate_industry_relevance(self, resume_company: str, jd_company: str) -> float:
+    def _calculate_industry_relevance(self, resume_company: str, jd_company_tokens: frozenset) -> float:
         """Calculate industry relevance (simplified)."""
         # This would ideally use a company/industry database
-        if not resume_company or not jd_company:
+        if not resume_company or not jd_company_tokens:
             return 0.5
         
         # Simple keyword matching for now
-        resume_words = set(resume_company.lower().split())
-        jd_words = set(jd_company.lower().split())
-        
-        if resume_words.intersection(jd_words):
+        if not jd_company_tokens.isdisjoint(resume_company.lower().split()):
             return 0.9
         else:
             return 0.4  # Different companies, assume different but not necessarily bad
     
-    def _calculate_description_relevance(self, description_list: List[str], jd_parsed: ParsedJobDescription) -> float:
-        """Calculate relevance of job description to JD requirements."""
+    def _calculate_description_relevance(self, description_list: List[str], jd_keywords_set: frozenset) -> float:
+        """Calculate relevance of job description to JD requirements.
+        
+        Matches whole tokens, so a JD keyword no longer counts when it only
+        appears inside a longer description word.
+        """
         if not description_list:
             return 0.3
         
-        description_text = ' '.join(description_list).lower()
-        jd_keywords = []
-        
-        # Extract keywords from JD
-        if jd_parsed.required_skills:
-            jd_keywords.extend([skill.lower() for skill in jd_parsed.required_skills])
-        if jd_parsed.responsibilities:
-            for resp in jd_parsed.responsibilities:
-                jd_keywords.extend(resp.lower().split())
-        
-        if not jd_keywords:
+        if not jd_keywords_set:
             return 0.5
         
-        # Count matches
-        matches = sum(1 for keyword in jd_keywords if keyword in description_text)
-        return min(1.0, matches / len(jd_keywords))
+        description_tokens = ' '.join(description_list).lower().split()
+        matches = len(jd_keywords_set.intersection(description_tokens))
+        return min(1.0, matches / len(jd_keywords_set))
     
     def _calculate_recency_weight(self, end_date: Optional[str]) -> float:
         """Calculate weight based on how recent the experience is."""
@@ -530,51 +809,28 @@ class AdvancedScoringEngine:
             return 1.0  # Current job gets full weight
         
         # This is simplified - would need proper date parsing
-        current_year = datetime.now().year
-        try:
-            if any(str(year) in end_date for year in range(current_year - 10, current_year + 1)):
-                years_ago = current_year - int([year for year in range(current_year - 10, current_year + 1) if str(year) in end_date][0])
+        year_match = YEAR_PATTERN.search(end_date)
+        if year_match:
+            years_ago = self._now_year - int(year_match.group())
+            if 0 <= years_ago <= 10:
                 return max(0.5, 1.0 - (years_ago * 0.1))  # Decay by 10% per year
-        except:
-            pass
         
         return 0.7  # Default weight for uncertain dates
     
-    def _extract_required_education_level(self, jd_parsed: ParsedJobDescription) -> int:
-        """Extract required education level from JD."""
-        jd_text = (jd_parsed.raw_content or '').lower()
-        requirements = ' '.join(jd_parsed.requirements or []).lower()
-        combined_text = jd_text + ' ' + requirements
-        
-        if any(word in combined_text for word in ['phd', 'doctorate', 'doctoral']):
-            return 5
-        elif any(word in combined_text for word in ['master', 'mba', 'ms', 'ma']):
-            return 4
-        elif any(word in combined_text for word in ['bachelor', 'bs', 'ba', 'degree']):
-            return 3
-        elif any(word in combined_text for word in ['associate']):
-            return 2
-        else:
-            return 2  # Default to associate level
-    
-    def _extract_job_domain_keywords(self, jd_parsed: ParsedJobDescription) -> List[str]:
-        """Extract domain-specific keywords from job description."""
-        domain_keywords = {
-            'software': ['software', 'programming', 'development', 'engineering', 'computer'],
-            'data': ['data', 'analytics', 'science', 'machine learning', 'statistics'],
-            'marketing': ['marketing', 'digital', 'campaign', 'brand', 'advertising'],
-            'finance': ['finance', 'accounting', 'financial', 'investment', 'banking'],
-            'sales': ['sales', 'business development', 'revenue', 'client', 'customer']
-        }
-        
-        jd_text = jd_parsed.title.lower() + ' ' + (jd_parsed.raw_content or '').lower()
-        
-        relevant_keywords = []
-        for domain, keywords in domain_keywords.items():
-            if any(keyword in jd_text for keyword in keywords):
-                relevant_keywords.extend(keywords)
-                break  # Take first matching domain
-        
-        return relevant_keywords[:5]  # Limit to 5 keywords
+    def _extract_required_education_level(self, combined_text: str) -> int:
+        """Extract required education level from lowercased JD text."""
+        required_level = 2  # Default to associate level
+        for match in EDUCATION_LEVEL_PATTERN.finditer(combined_text):
+            required_level = max(required_level, REQUIRED_EDUCATION_LEVELS[match.group(1)])
+        return required_level
+    
+    def _extract_job_domain_keywords(self, jd_text: str) -> List[str]:
+        """Extract domain-specific keywords from lowercased JD title and content."""
+        domain_hits = {DOMAIN_BY_KEYWORD[match.group(1)] for match in DOMAIN_PATTERN.finditer(jd_text)}
+        for domain, keywords in DOMAIN_KEYWORDS:
+            if domain in domain_hits:
+                return list(keywords[:5])  # Take first matching domain, limit to 5 keywords
+        
+        return []
 
 
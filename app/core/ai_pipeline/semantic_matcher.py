@@ -1,10 +1,18 @@
+import os
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+import torch
+from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process, utils as fuzz_utils
 import faiss
 from app.core.ai_pipeline.skill_extractor import SkillProfile, ExtractedSkill
 from app.core.ai_pipeline.jd_parser import ParsedJobDescription
@@ -34,29 +42,101 @@ class SemanticMatchResult:
     category_similarities: Dict[str, float]
     embedding_similarity: float
     text_similarity: float
+    
+    @cached_property
+    def confidences(self) -> np.ndarray:
+        """Skill match confidences as an array, in ``skill_matches`` order."""
+        return np.fromiter((m.confidence for m in self.skill_matches), dtype=np.float64, count=len(self.skill_matches))
+    
+    @cached_property
+    def missing_skills_set(self) -> frozenset:
+        """Lowercased missing skills for constant-time membership checks."""
+        return frozenset(skill.lower() for skill in self.missing_skills)
+    
+    @cached_property
+    def additional_skills_set(self) -> frozenset:
+        """Lowercased additional skills for constant-time membership checks."""
+        return frozenset(skill.lower() for skill in self.additional_skills)
 
 
 class SemanticMatcher:
     """Advanced semantic matching using embeddings and similarity metrics."""
     
+    MODEL_NAME = 'all-MiniLM-L6-v2'
+    # Dynamically quantized int8 export shipped with the model, used on CPU
+    ONNX_CPU_MODEL_FILE = 'onnx/model_qint8_avx512_vnni.onnx'
+    
+    # Max number of cached text embeddings (LRU eviction)
+    EMBEDDING_CACHE_SIZE = 4096
+    # Texts longer than this are cached under a digest rather than verbatim
+    EMBEDDING_KEY_MAX_LEN = 256
+    # Resume/JD texts are truncated to this many characters before encoding
+    EMBEDDING_TEXT_MAX_CHARS = 2000
+    
+    # Corpus skill index: exact fp16 search below IVF_MIN_VECTORS, otherwise
+    # an inverted file with product quantization (48 x 8-bit codes per vector)
+    IVF_MIN_VECTORS = 10000
+    IVF_NLIST = 256
+    IVF_NPROBE = 8
+    PQ_M = 48
+    PQ_NBITS = 8
+    IVF_TRAIN_SIZE = 65536
+    
+    # Above this many JD x resume skill pairs, fuzzy matching only scores
+    # pairs that share a character trigram instead of the full score matrix
+    FUZZY_PREFILTER_MIN_PAIRS = 4096
+    
     def __init__(self):
         self.sentence_transformer = None
+        self.model_variant: Optional[str] = None  # Backend/precision of the loaded model
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=5000,
             stop_words='english',
             ngram_range=(1, 2)
         )
+        self._tfidf_fitted = False  # Set once fit_tfidf has learned a corpus vocabulary
+        self._indexed_skills: List[str] = []  # Labels for rows of the FAISS skill index
+        self._encode_batch_size = 64
         self._load_models()
         self._initialize_faiss_index()
     
     def _load_models(self):
         """Load sentence transformer model."""
         try:
-            self.sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Loaded sentence transformer for semantic matching")
+            if torch.cuda.is_available():
+                self.sentence_transformer = SentenceTransformer(self.MODEL_NAME, device='cuda')
+                # Half precision halves memory traffic on GPU with negligible accuracy loss
+                self.sentence_transformer.half()
+                self._encode_batch_size = 256
+                self.model_variant = 'cuda-fp16'
+                logger.info("Loaded sentence transformer for semantic matching on cuda (fp16)")
+            else:
+                self.sentence_transformer = self._load_cpu_model()
         except Exception as e:
             logger.error(f"Failed to load sentence transformer: {e}")
     
+    def _load_cpu_model(self) -> SentenceTransformer:
+        """Load the int8-quantized ONNX export for CPU, falling back to the fp32 PyTorch model."""
+        try:
+            model = SentenceTransformer(
+                self.MODEL_NAME,
+                device='cpu',
+                backend='onnx',
+                model_kwargs={'file_name': self.ONNX_CPU_MODEL_FILE, 'provider': 'CPUExecutionProvider'}
+            )
+            self.model_variant = 'onnx-int8'
+            logger.info("Loaded int8 ONNX sentence transformer for semantic matching on cpu")
+            return model
+        except Exception as e:  # Older sentence-transformers or no ONNX runtime installed
+            logger.info(f"ONNX sentence transformer unavailable, using PyTorch: {e}")
+        
+        model = SentenceTransformer(self.MODEL_NAME, device='cpu')
+        self.model_variant = 'cpu-fp32'
+        logger.info("Loaded sentence transformer for semantic matching on cpu")
+        return model
+    
     def _initialize_faiss_index(self):
         """Initialize FAISS index for fast similarity search."""
         try:
@@ -67,43 +147,232 @@ class SemanticMatcher:
             logger.warning(f"FAISS not available: {e}")
             self.faiss_index = None
     
+    def _embedding_key(self, text: str) -> str:
+        """Build the embedding cache key for a text."""
+        text = text.strip()
+        if len(text) <= self.EMBEDDING_KEY_MAX_LEN:
+            return text
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts to unit-length embeddings, reusing cached ones.
+        
+        Only texts missing from the cache are sent to the model, in a single
+        ``encode`` call. Rows of the result follow the order of ``texts``. The
+        result is a C-contiguous float32 matrix, ready for BLAS and FAISS
+        without further copies.
+        """
+        keys = [self._embedding_key(text) for text in texts]
+        
+        with self._cache_lock:
+            cached = {key: self._embedding_cache[key] for key in keys if key in self._embedding_cache}
+            for key in cached:
+                self._embedding_cache.move_to_end(key)
+        
+        # Deduplicate misses so repeated texts are encoded once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        
+        if missing:
+            embeddings = np.ascontiguousarray(self.sentence_transformer.encode(
+                list(missing.values()), batch_size=self._encode_batch_size, convert_to_numpy=True, show_progress_bar=False
+            ), dtype=np.float32)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+            # Stored as float16 to halve cache memory; widened back for the math
+            new_entries = dict(zip(missing, embeddings.astype(np.float16)))
+            cached.update(new_entries)
+            self._cache_embeddings(new_entries.keys(), new_entries.values())
+        
+        return np.stack([cached[key] for key in keys]).astype(np.float32)
+    
+    def _cache_embeddings(self, keys, vectors):
+        """Insert embeddings into the LRU cache as float16, evicting the oldest entries."""
+        with self._cache_lock:
+            for key, vector in zip(keys, vectors):
+                self._embedding_cache[key] = np.asarray(vector, dtype=np.float16)
+                self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+    
+    def _warm_embedding_cache(self, texts: List[str]):
+        """Encode any uncached texts in a single batch ahead of the matching stages."""
+        if not self.sentence_transformer or not texts:
+            return
+        try:
+            self._encode(texts)
+        except Exception as e:
+            logger.error(f"Error pre-computing embeddings: {e}")
+    
+    def save_embedding_cache(self, path: str):
+        """Persist cached embeddings to an ``.npz`` file for reuse across processes."""
+        with self._cache_lock:
+            keys = list(self._embedding_cache)
+            vectors = list(self._embedding_cache.values())
+        if not keys:
+            return
+        np.savez(path, keys=np.array(keys), vectors=np.stack(vectors))
+        logger.info(f"Saved {len(keys)} cached embeddings to {path}")
+    
+    def load_embedding_cache(self, path: str):
+        """Load embeddings written by ``save_embedding_cache`` into the cache."""
+        try:
+            with np.load(path) as data:
+                keys, vectors = data['keys'].tolist(), data['vectors']
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not load embedding cache from {path}: {e}")
+            return
+        
+        self._cache_embeddings(keys[-self.EMBEDDING_CACHE_SIZE:], vectors[-self.EMBEDDING_CACHE_SIZE:])
+        logger.info(f"Loaded {len(keys)} cached embeddings from {path}")
+    
+    def precompute_resume(self, resume_skills: List[str], index_path: str) -> Tuple[str, List[str]]:
+        """Encode a resume's skills once and persist them as a FAISS index.
+        
+        Skill names are written next to the index (``<index_path>.skills.json``)
+        in row order. Returns the index path and the indexed skill names.
+        """
+        skill_names = list(dict.fromkeys(resume_skills))
+        if not self.sentence_transformer or self.faiss_index is None or not skill_names:
+            return index_path, []
+        
+        embeddings = self._encode(skill_names)
+        index = self._create_fp16_index(embeddings.shape[1])
+        index.add(embeddings)
+        faiss.write_index(index, index_path)
+        with open(index_path + '.skills.json', 'w', encoding='utf-8') as f:
+            json.dump(skill_names, f)
+        
+        return index_path, skill_names
+    
+    def _load_resume_index(self, index_path: str) -> List[str]:
+        """Seed the embedding cache from a resume index written by ``precompute_resume``."""
+        try:
+            index = faiss.read_index(index_path)
+            with open(index_path + '.skills.json', encoding='utf-8') as f:
+                skill_names = json.load(f)
+        except (OSError, RuntimeError, ValueError) as e:
+            logger.warning(f"Could not load resume index from {index_path}: {e}")
+            return []
+        
+        vectors = index.reconstruct_n(0, index.ntotal)
+        self._cache_embeddings([self._embedding_key(name) for name in skill_names], vectors)
+        return skill_names
+    
+    def match_resume_to_jd_from_index(
+        self,
+        index_path: str,
+        resume_skills: SkillProfile,
+        jd_parsed: ParsedJobDescription,
+        resume_text: str,
+        jd_text: str
+    ) -> SemanticMatchResult:
+        """Like ``match_resume_to_jd``, but reuses resume skill embeddings from ``precompute_resume``.
+        
+        Only the JD skills and the full texts still need encoding.
+        """
+        self._load_resume_index(index_path)
+        return self.match_resume_to_jd(resume_skills, jd_parsed, resume_text, jd_text)
+    
+    def _create_fp16_index(self, dim: int):
+        """Create an exact inner-product index that stores vectors as float16."""
+        return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT)
+    
+    def _create_skill_index(self, embeddings: np.ndarray):
+        """Create a FAISS index sized for the number of embeddings."""
+        n_vectors, dim = embeddings.shape
+        if n_vectors < self.IVF_MIN_VECTORS:
+            return self._create_fp16_index(dim)
+        
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFPQ(
+            quantizer, dim, self.IVF_NLIST, self.PQ_M, self.PQ_NBITS, faiss.METRIC_INNER_PRODUCT
+        )
+        if n_vectors > self.IVF_TRAIN_SIZE:
+            sample = np.random.default_rng(0).choice(n_vectors, self.IVF_TRAIN_SIZE, replace=False)
+            index.train(embeddings[sample])
+        else:
+            index.train(embeddings)
+        index.nprobe = self.IVF_NPROBE
+        return index
+    
+    def build_skill_index(self, skills: List[str]):
+        """Index a corpus of skills (e.g. every stored resume skill) for ``search_skill_index``.
+        
+        Small corpora use an exact float16 index; corpora of ``IVF_MIN_VECTORS`` or
+        more use IVF-PQ, trading a little recall for much less memory traffic.
+        """
+        if not self.sentence_transformer or self.faiss_index is None or not skills:
+            return
+        
+        embeddings = self._encode(skills)
+        index = self._create_skill_index(embeddings)
+        index.add(embeddings)
+        
+        self.faiss_index = index
+        self._indexed_skills = list(skills)
+        logger.info(f"Indexed {len(skills)} skills ({type(index).__name__})")
+    
+    def search_skill_index(self, query_skills: List[str], k: int = 1) -> List[List[Tuple[str, float]]]:
+        """Return the ``k`` most similar indexed skills and similarities for each query skill."""
+        if not self._indexed_skills or not query_skills:
+            return [[] for _ in query_skills]
+        
+        queries = self._encode(query_skills)
+        similarities, indices = self.faiss_index.search(queries, k)
+        
+        return [
+            [(self._indexed_skills[idx], float(sim)) for sim, idx in zip(row_sims, row_idx) if idx >= 0]
+            for row_sims, row_idx in zip(similarities, indices)
+        ]
+    
     def match_resume_to_jd(
         self, 
         resume_skills: SkillProfile, 
         jd_parsed: ParsedJobDescription,
         resume_text: str,
-        jd_text: str
+        jd_text: str,
+        tfidf_vectorizer: Optional[TfidfVectorizer] = None,
+        fuzzy_workers: int = -1
     ) -> SemanticMatchResult:
-        """Perform comprehensive semantic matching."""
+        """Perform comprehensive semantic matching.
+        
+        ``tfidf_vectorizer`` is an already fitted vectorizer to transform the
+        texts with; by default the shared one from ``fit_tfidf`` is used.
+        ``fuzzy_workers`` is the thread count for fuzzy scoring (-1 for all cores).
+        """
         
         logger.info("Performing semantic matching between resume and JD")
         
         # Extract all resume skills
-        all_resume_skills = []
-        all_resume_skills.extend([s.name for s in resume_skills.technical_skills])
-        all_resume_skills.extend([s.name for s in resume_skills.soft_skills])
-        all_resume_skills.extend([s.name for s in resume_skills.domain_expertise])
-        all_resume_skills.extend([s.name for s in resume_skills.tools_platforms])
+        all_resume_skills = self._profile_skill_names(resume_skills)
         
         # Get JD required skills
         jd_required_skills = jd_parsed.required_skills or []
         jd_preferred_skills = jd_parsed.preferred_skills or []
         all_jd_skills = jd_required_skills + jd_preferred_skills
         
-        # Perform different types of matching
-        skill_matches = self._match_skills_comprehensive(all_resume_skills, all_jd_skills)
+        # Perform different types of matching; the full texts are encoded in the
+        # same batch as any skills left for semantic matching
+        truncated_texts = (resume_text[:self.EMBEDDING_TEXT_MAX_CHARS], jd_text[:self.EMBEDDING_TEXT_MAX_CHARS])
+        skill_matches = self._match_skills_comprehensive(
+            all_resume_skills, all_jd_skills, truncated_texts, fuzzy_workers
+        )
         
         # Calculate missing and additional skills
-        matched_jd_skills = [match.jd_skill for match in skill_matches]
+        matched_jd_skills = {match.jd_skill for match in skill_matches}
+        matched_resume_skills = {match.resume_skill for match in skill_matches if match.resume_skill}
         missing_skills = [skill for skill in jd_required_skills if skill not in matched_jd_skills]
-        additional_skills = [skill for skill in all_resume_skills if skill not in [match.resume_skill for match in skill_matches if match.resume_skill]]
+        additional_skills = [skill for skill in all_resume_skills if skill not in matched_resume_skills]
         
         # Calculate category-wise similarities
         category_similarities = self._calculate_category_similarities(resume_skills, jd_parsed)
         
         # Calculate overall text similarity
         embedding_similarity = self._calculate_embedding_similarity(resume_text, jd_text)
-        text_similarity = self._calculate_tfidf_similarity(resume_text, jd_text)
+        text_similarity = self._calculate_tfidf_similarity(resume_text, jd_text, tfidf_vectorizer)
         
         # Calculate overall similarity score
         overall_similarity = self._calculate_overall_similarity(
@@ -120,34 +389,102 @@ class SemanticMatcher:
             text_similarity=text_similarity
         )
     
-    def _match_skills_comprehensive(self, resume_skills: List[str], jd_skills: List[str]) -> List[SkillMatch]:
-        """Perform comprehensive skill matching using multiple techniques."""
+    def match_many(
+        self,
+        resumes: List[Tuple[SkillProfile, str]],
+        jd_parsed: ParsedJobDescription,
+        jd_text: str,
+        max_workers: Optional[int] = None
+    ) -> List[SemanticMatchResult]:
+        """Match many ``(skill_profile, resume_text)`` pairs against one job description.
+        
+        Every text and skill in the batch is encoded in one forward pass up
+        front, then the per-resume matching fans out over a thread pool. The
+        shared model, embedding cache and FAISS calls are safe to use from
+        several threads.
+        """
+        if not resumes:
+            return []
+        
+        logger.info(f"Performing semantic matching for {len(resumes)} resumes")
+        
+        jd_skills = (jd_parsed.required_skills or []) + (jd_parsed.preferred_skills or [])
+        batch_texts = [jd_text[:self.EMBEDDING_TEXT_MAX_CHARS]] + jd_skills
+        for skill_profile, resume_text in resumes:
+            batch_texts.append(resume_text[:self.EMBEDDING_TEXT_MAX_CHARS])
+            batch_texts.extend(self._profile_skill_names(skill_profile))
+        self._warm_embedding_cache(batch_texts)
+        
+        # Without a corpus vocabulary from fit_tfidf, fit a vectorizer for this batch
+        # only; fitting the shared one would tie later scores to the first batch seen
+        tfidf_vectorizer = None
+        if not self._tfidf_fitted:
+            tfidf_vectorizer = self._fit_local_tfidf([jd_text] + [resume_text for _, resume_text in resumes])
+        
+        # The pool already uses every core, so each match scores fuzzy pairs on one thread
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(
+                lambda resume: self.match_resume_to_jd(
+                    resume[0], jd_parsed, resume[1], jd_text, tfidf_vectorizer, fuzzy_workers=1
+                ),
+                resumes
+            ))
+    
+    def _profile_skill_names(self, resume_skills: SkillProfile) -> List[str]:
+        """Collect skill names from every category of a skill profile."""
+        return [
+            s.name
+            for category in (
+                resume_skills.technical_skills, resume_skills.soft_skills,
+                resume_skills.domain_expertise, resume_skills.tools_platforms
+            )
+            for s in category
+        ]
+    
+    def _match_skills_comprehensive(
+        self, resume_skills: List[str], jd_skills: List[str], prefetch_texts: Tuple[str, ...] = (),
+        fuzzy_workers: int = -1
+    ) -> List[SkillMatch]:
+        """Perform comprehensive skill matching using multiple techniques.
+        
+        ``prefetch_texts`` are encoded in the same batch as the skills left for
+        the semantic stage, so callers can share a single forward pass.
+        """
         matches = []
         
+        # Skills often repeat across profile categories; match each resume skill once
+        resume_skills = list(dict.fromkeys(resume_skills))
+        
         # 1. Exact matching (case-insensitive)
         exact_matches = self._exact_match_skills(resume_skills, jd_skills)
         matches.extend(exact_matches)
         
         # Get unmatched skills for further processing
-        matched_resume_skills = [m.resume_skill for m in exact_matches if m.resume_skill]
-        matched_jd_skills = [m.jd_skill for m in exact_matches]
+        matched_resume_skills = {m.resume_skill for m in exact_matches if m.resume_skill}
+        matched_jd_skills = {m.jd_skill for m in exact_matches}
         
         unmatched_resume = [s for s in resume_skills if s not in matched_resume_skills]
         unmatched_jd = [s for s in jd_skills if s not in matched_jd_skills]
+        if not unmatched_resume or not unmatched_jd:
+            return matches
         
         # 2. Fuzzy matching
-        fuzzy_matches = self._fuzzy_match_skills(unmatched_resume, unmatched_jd)
+        fuzzy_matches = self._fuzzy_match_skills(unmatched_resume, unmatched_jd, workers=fuzzy_workers)
         matches.extend(fuzzy_matches)
         
         # Update unmatched lists
-        matched_resume_skills.extend([m.resume_skill for m in fuzzy_matches if m.resume_skill])
-        matched_jd_skills.extend([m.jd_skill for m in fuzzy_matches])
+        matched_resume_skills = {m.resume_skill for m in fuzzy_matches if m.resume_skill}
+        matched_jd_skills = {m.jd_skill for m in fuzzy_matches}
+        
+        unmatched_resume = [s for s in unmatched_resume if s not in matched_resume_skills]
+        unmatched_jd = [s for s in unmatched_jd if s not in matched_jd_skills]
         
-        unmatched_resume = [s for s in unmatched_resume if s not in [m.resume_skill for m in fuzzy_matches if m.resume_skill]]
-        unmatched_jd = [s for s in unmatched_jd if s not in [m.jd_skill for m in fuzzy_matches]]
+        if not unmatched_resume or not unmatched_jd:
+            return matches
         
         # 3. Semantic matching using embeddings
-        if self.sentence_transformer and unmatched_resume and unmatched_jd:
+        if self.sentence_transformer:
+            self._warm_embedding_cache(list(prefetch_texts) + unmatched_resume + unmatched_jd)
             semantic_matches = self._semantic_match_skills(unmatched_resume, unmatched_jd)
             matches.extend(semantic_matches)
         
@@ -156,12 +493,15 @@ class SemanticMatcher:
     def _exact_match_skills(self, resume_skills: List[str], jd_skills: List[str]) -> List[SkillMatch]:
         """Perform exact skill matching."""
         matches = []
-        resume_lower = [s.lower() for s in resume_skills]
+        
+        # First resume spelling of each lowercased skill
+        resume_by_lower = {}
+        for skill in resume_skills:
+            resume_by_lower.setdefault(skill.lower(), skill)
         
         for jd_skill in jd_skills:
-            jd_skill_lower = jd_skill.lower()
-            if jd_skill_lower in resume_lower:
-                resume_skill = resume_skills[resume_lower.index(jd_skill_lower)]
+            resume_skill = resume_by_lower.get(jd_skill.lower())
+            if resume_skill is not None:
                 matches.append(SkillMatch(
                     skill_name=jd_skill,
                     resume_skill=resume_skill,
@@ -172,26 +512,87 @@ class SemanticMatcher:
         
         return matches
     
-    def _fuzzy_match_skills(self, resume_skills: List[str], jd_skills: List[str], threshold: float = 85) -> List[SkillMatch]:
-        """Perform fuzzy skill matching."""
+    def _fuzzy_match_skills(
+        self, resume_skills: List[str], jd_skills: List[str], threshold: float = 85, workers: int = -1
+    ) -> List[SkillMatch]:
+        """Perform fuzzy skill matching; ``workers`` is passed to rapidfuzz's cdist."""
+        if not resume_skills or not jd_skills:
+            return []
+        
         matches = []
         
-        for jd_skill in jd_skills:
-            # Find best match in resume skills
-            best_match = process.extractOne(jd_skill, resume_skills, scorer=fuzz.token_sort_ratio)
-            
-            if best_match and best_match[1] >= threshold:
-                confidence = best_match[1] / 100.0
-                matches.append(SkillMatch(
-                    skill_name=jd_skill,
-                    resume_skill=best_match[0],
-                    jd_skill=jd_skill,
-                    match_type="fuzzy",
-                    confidence=confidence
-                ))
+        if len(resume_skills) * len(jd_skills) < self.FUZZY_PREFILTER_MIN_PAIRS:
+            # Score every JD/resume pair in one native call, then take each JD skill's best match
+            scores = process.cdist(
+                jd_skills, resume_skills, scorer=fuzz.token_sort_ratio,
+                processor=fuzz_utils.default_process, dtype=np.uint8, workers=workers
+            )
+            best_match_idx = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(jd_skills)), best_match_idx]
+        else:
+            best_match_idx, best_scores = self._fuzzy_best_matches_blocked(resume_skills, jd_skills, threshold)
+        
+        for i in np.flatnonzero(best_scores >= threshold):
+            jd_skill = jd_skills[i]
+            matches.append(SkillMatch(
+                skill_name=jd_skill,
+                resume_skill=resume_skills[best_match_idx[i]],
+                jd_skill=jd_skill,
+                match_type="fuzzy",
+                confidence=float(best_scores[i]) / 100.0
+            ))
         
         return matches
     
+    @staticmethod
+    def _fuzzy_key(skill: str) -> str:
+        """Normalize a skill the way token_sort_ratio compares it."""
+        return ' '.join(sorted(fuzz_utils.default_process(skill).split()))
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Character trigrams of a normalized skill."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _fuzzy_best_matches_blocked(
+        self, resume_skills: List[str], jd_skills: List[str], threshold: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Best fuzzy match per JD skill, scoring only resume skills that share a trigram.
+        
+        Returns ``(best_match_idx, best_scores)`` like the full score matrix
+        path; JD skills without a candidate at or above ``threshold`` score 0.
+        """
+        resume_keys = [self._fuzzy_key(skill) for skill in resume_skills]
+        trigram_index: Dict[str, Set[int]] = {}
+        for i, key in enumerate(resume_keys):
+            for trigram in self._trigrams(key):
+                trigram_index.setdefault(trigram, set()).add(i)
+        
+        best_match_idx = np.zeros(len(jd_skills), dtype=np.intp)
+        best_scores = np.zeros(len(jd_skills), dtype=np.uint8)
+        
+        for j, jd_skill in enumerate(jd_skills):
+            jd_key = self._fuzzy_key(jd_skill)
+            trigrams = self._trigrams(jd_key)
+            if trigrams:
+                candidates = sorted(set().union(*(trigram_index.get(t, ()) for t in trigrams)))
+            else:
+                candidates = range(len(resume_skills))  # Too short to block on
+            if not candidates:
+                continue
+            
+            # Scores are rounded half up to integers like the uint8 cdist path, so
+            # accept anything that rounds up to the threshold
+            best = process.extractOne(
+                jd_key, [resume_keys[i] for i in candidates], scorer=fuzz.token_sort_ratio,
+                processor=None, score_cutoff=threshold - 0.5
+            )
+            if best is not None:
+                best_match_idx[j] = candidates[best[2]]
+                best_scores[j] = int(best[1] + 0.5)
+        
+        return best_match_idx, best_scores
+    
     def _semantic_match_skills(self, resume_skills: List[str], jd_skills: List[str], threshold: float = 0.7) -> List[SkillMatch]:
         """Perform semantic skill matching using embeddings."""
         if not self.sentence_transformer:
@@ -199,30 +600,46 @@ class SemanticMatcher:
         
         matches = []
         
-        # Generate embeddings
-        resume_embeddings = self.sentence_transformer.encode(resume_skills)
-        jd_embeddings = self.sentence_transformer.encode(jd_skills)
-        
-        # Calculate similarity matrix
-        similarity_matrix = cosine_similarity(jd_embeddings, resume_embeddings)
-        
-        # Find best matches above threshold
-        for i, jd_skill in enumerate(jd_skills):
-            best_match_idx = np.argmax(similarity_matrix[i])
-            best_similarity = similarity_matrix[i][best_match_idx]
-            
-            if best_similarity >= threshold:
-                matches.append(SkillMatch(
-                    skill_name=jd_skill,
-                    resume_skill=resume_skills[best_match_idx],
-                    jd_skill=jd_skill,
-                    match_type="semantic",
-                    confidence=float(best_similarity),
-                    semantic_similarity=float(best_similarity)
-                ))
+        # Search with each distinct skill once; jd_inverse maps JD skills back to their rows
+        resume_skills = list(dict.fromkeys(resume_skills))
+        jd_rows = {skill: row for row, skill in enumerate(dict.fromkeys(jd_skills))}
+        jd_inverse = np.fromiter((jd_rows[skill] for skill in jd_skills), dtype=np.intp, count=len(jd_skills))
+        
+        # Generate embeddings for both sides in one forward pass
+        embeddings = self._encode(resume_skills + list(jd_rows))
+        resume_embeddings = embeddings[:len(resume_skills)]
+        jd_embeddings = embeddings[len(resume_skills):]
+        
+        # Embeddings are unit length, so inner product equals cosine similarity
+        best_similarity, best_match_idx = self._nearest_resume_skills(resume_embeddings, jd_embeddings)
+        best_similarity, best_match_idx = best_similarity[jd_inverse], best_match_idx[jd_inverse]
+        
+        # Keep best matches above threshold
+        for i in np.flatnonzero(best_similarity >= threshold):
+            similarity = float(best_similarity[i])
+            matches.append(SkillMatch(
+                skill_name=jd_skills[i],
+                resume_skill=resume_skills[best_match_idx[i]],
+                jd_skill=jd_skills[i],
+                match_type="semantic",
+                confidence=similarity,
+                semantic_similarity=similarity
+            ))
         
         return matches
     
+    def _nearest_resume_skills(self, resume_embeddings: np.ndarray, jd_embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the best inner-product similarity and resume index for each JD embedding."""
+        if self.faiss_index is not None:
+            index = faiss.IndexFlatIP(resume_embeddings.shape[1])
+            index.add(resume_embeddings)
+            similarities, indices = index.search(jd_embeddings, 1)
+            return similarities[:, 0], indices[:, 0]
+        
+        similarity_matrix = jd_embeddings @ resume_embeddings.T
+        best_match_idx = similarity_matrix.argmax(axis=1)
+        return similarity_matrix[np.arange(len(jd_embeddings)), best_match_idx], best_match_idx
+    
     def _calculate_category_similarities(self, resume_skills: SkillProfile, jd_parsed: ParsedJobDescription) -> Dict[str, float]:
         """Calculate similarity scores for different skill categories."""
         similarities = {}
@@ -247,11 +664,11 @@ class SemanticMatcher:
     
     def _calculate_jaccard_similarity(self, list1: List[str], list2: List[str]) -> float:
         """Calculate Jaccard similarity between two lists."""
-        set1 = set([item.lower() for item in list1])
-        set2 = set([item.lower() for item in list2])
+        set1 = {item.lower() for item in list1}
+        set2 = {item.lower() for item in list2}
         
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        intersection = len(set1 & set2)
+        union = len(set1) + len(set2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
@@ -262,23 +679,55 @@ class SemanticMatcher:
         
         try:
             # Truncate texts to prevent memory issues
-            resume_text = resume_text[:2000]
-            jd_text = jd_text[:2000]
+            resume_text = resume_text[:self.EMBEDDING_TEXT_MAX_CHARS]
+            jd_text = jd_text[:self.EMBEDDING_TEXT_MAX_CHARS]
             
-            embeddings = self.sentence_transformer.encode([resume_text, jd_text])
-            similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+            embeddings = self._encode([resume_text, jd_text])
+            similarity = embeddings[0] @ embeddings[1]
             
             return float(similarity)
         except Exception as e:
             logger.error(f"Error calculating embedding similarity: {e}")
             return 0.0
     
-    def _calculate_tfidf_similarity(self, resume_text: str, jd_text: str) -> float:
+    def fit_tfidf(self, corpus: List[str]):
+        """Fit the TF-IDF vocabulary and IDF weights once on a background corpus.
+        
+        Afterwards each resume/JD pair is only transformed, instead of
+        refitting the vectorizer on the two documents for every comparison.
+        """
+        if not corpus:
+            return
+        try:
+            self.tfidf_vectorizer.fit(corpus)
+            self._tfidf_fitted = True
+            logger.info(f"Fitted TF-IDF vocabulary on {len(corpus)} documents")
+        except ValueError as e:
+            logger.warning(f"Could not fit TF-IDF vocabulary: {e}")
+    
+    def _fit_local_tfidf(self, corpus: List[str]) -> Optional[TfidfVectorizer]:
+        """Fit a private copy of the TF-IDF settings on ``corpus``, leaving the shared one untouched."""
+        try:
+            return clone(self.tfidf_vectorizer).fit(corpus)
+        except ValueError as e:
+            logger.warning(f"Could not fit TF-IDF vocabulary: {e}")
+            return None
+    
+    def _calculate_tfidf_similarity(
+        self, resume_text: str, jd_text: str, vectorizer: Optional[TfidfVectorizer] = None
+    ) -> float:
         """Calculate TF-IDF based similarity."""
         try:
-            # Fit TF-IDF on both texts
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([resume_text, jd_text])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            if vectorizer is not None:
+                tfidf_matrix = vectorizer.transform([resume_text, jd_text])
+            elif self._tfidf_fitted:
+                tfidf_matrix = self.tfidf_vectorizer.transform([resume_text, jd_text])
+            else:
+                # No corpus vocabulary yet: fit a private vectorizer on the pair itself
+                tfidf_matrix = clone(self.tfidf_vectorizer).fit_transform([resume_text, jd_text])
+            
+            # Rows are L2-normalized, so cosine similarity is their sparse dot product
+            similarity = tfidf_matrix[0].multiply(tfidf_matrix[1]).sum()
             
             return float(similarity)
         except Exception as e:
@@ -316,4 +765,10 @@ class SemanticMatcher:
             text_component * 0.25
         )
         
-        return min(overall_score, 1.0)
\ No newline at end of file
+        return min(overall_score, 1.0)
+
+
+@lru_cache(maxsize=1)
+def get_semantic_matcher() -> SemanticMatcher:
+    """Return the process-wide matcher so its models are loaded only once."""
+    return SemanticMatcher()
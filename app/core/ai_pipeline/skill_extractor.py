@@ -1,16 +1,55 @@
 import re
 import json
-from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
+import bisect
+import itertools
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
 import spacy
-from sentence_transformers import SentenceTransformer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+import faiss
+from types import MappingProxyType
 from app.core.utils.logger import get_logger
+from app.core.ai_pipeline.embed_cache import DEFAULT_CACHE_DIR, EmbeddingDiskCache, cached_encode
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-term substring scans
+    ahocorasick = None
 
 logger = get_logger(__name__)
 
+# Text normalization: "foo.JS" -> "foo.js", "FooJS" -> "Foo.js", HTML5/CSS3 -> HTML/CSS
+JS_EXTENSION_PATTERN = re.compile(r'(\w+)\.js', re.IGNORECASE)
+JS_SUFFIX_PATTERN = re.compile(r'(\w+)JS')
+VERSIONED_MARKUP_PATTERN = re.compile(r'HTML5|CSS3', re.IGNORECASE)
+SEPARATOR_TABLE = str.maketrans(dict.fromkeys(',;|•▪▫◦', ' '))
+
+# Terms the former regex pass tagged with higher confidence than a plain dictionary hit
+PATTERN_SKILL_CONFIDENCE = MappingProxyType({
+    **dict.fromkeys((
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+        'kotlin', 'swift', 'scala', 'matlab', 'perl', 'bash', 'powershell'
+    ), 0.9),
+    **dict.fromkeys((
+        'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express',
+        'tensorflow', 'pytorch', 'keras', 'scikit-learn'
+    ), 0.85),
+})
+
+# Headings near which dictionary matches get a confidence boost
+SKILL_SECTION_PATTERN = re.compile(r'\b(?:skills|technologies|experience|projects)\b')
+SKILL_SECTION_WINDOW = 200
+
+CERTIFICATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(AWS|Azure|Google Cloud|GCP)\s+(Certified|Certification)',
+    r'(PMP|CISSP|CISM|CISA)\s*(Certified|Certification)?',
+    r'(Scrum Master|Product Owner|Agile)\s*(Certified|Certification)',
+    r'(Oracle|Microsoft|Cisco|CompTIA)\s+\w+\s*(Certified|Certification)'
+))
+
+
+
 
 @dataclass
 class ExtractedSkill:
@@ -21,6 +60,10 @@ class ExtractedSkill:
     context: str  # Context where skill was found
     aliases: List[str] = None  # Alternative names
     proficiency_level: Optional[str] = None  # beginner, intermediate, advanced
+    name_lower: str = field(init=False, repr=False, compare=False)  # Normalized for matching
+    
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
 
 
 @dataclass
@@ -36,161 +79,253 @@ class SkillProfile:
     skill_diversity_score: float
 
 
+SKILL_DATABASE = {
+    'programming_languages': {
+        'python': ['python', 'py', 'python3'],
+        'javascript': ['javascript', 'js', 'ecmascript', 'es6', 'es2015'],
+        'java': ['java', 'jvm'],
+        'typescript': ['typescript', 'ts'],
+        'c++': ['c++', 'cpp', 'c plus plus'],
+        'c#': ['c#', 'csharp', 'c sharp'],
+        'php': ['php', 'php7', 'php8'],
+        'ruby': ['ruby', 'rb'],
+        'go': ['go', 'golang'],
+        'rust': ['rust', 'rust-lang'],
+        'kotlin': ['kotlin', 'kt'],
+        'swift': ['swift', 'swift5'],
+        'scala': ['scala'],
+        'r': ['r programming', 'r language'],
+        'matlab': ['matlab'],
+        'perl': ['perl'],
+        'bash': ['bash', 'shell scripting', 'bash scripting'],
+        'powershell': ['powershell', 'ps1']
+    },
+
+    'web_technologies': {
+        'react': ['react', 'reactjs', 'react.js'],
+        'angular': ['angular', 'angularjs', 'angular2+'],
+        'vue': ['vue', 'vue.js', 'vuejs'],
+        'html': ['html', 'html5'],
+        'css': ['css', 'css3', 'cascading style sheets'],
+        'sass': ['sass', 'scss'],
+        'less': ['less css'],
+        'bootstrap': ['bootstrap', 'bootstrap4', 'bootstrap5'],
+        'tailwind': ['tailwind', 'tailwindcss'],
+        'jquery': ['jquery', 'jquery ui'],
+        'node.js': ['node.js', 'nodejs', 'node js'],
+        'express': ['express', 'express.js', 'expressjs'],
+        'django': ['django', 'django rest framework'],
+        'flask': ['flask', 'flask-restful'],
+        'spring': ['spring', 'spring boot', 'spring framework'],
+        'laravel': ['laravel', 'laravel framework'],
+        'rails': ['ruby on rails', 'rails', 'ror']
+    },
+
+    'databases': {
+        'mysql': ['mysql', 'my sql'],
+        'postgresql': ['postgresql', 'postgres', 'psql'],
+        'mongodb': ['mongodb', 'mongo'],
+        'redis': ['redis'],
+        'elasticsearch': ['elasticsearch', 'elastic search', 'elk stack'],
+        'oracle': ['oracle database', 'oracle db'],
+        'sqlite': ['sqlite', 'sqlite3'],
+        'cassandra': ['cassandra', 'apache cassandra'],
+        'dynamodb': ['dynamodb', 'dynamo db'],
+        'neo4j': ['neo4j', 'graph database'],
+        'influxdb': ['influxdb', 'time series database']
+    },
+
+    'cloud_platforms': {
+        'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'rds'],
+        'azure': ['azure', 'microsoft azure'],
+        'gcp': ['gcp', 'google cloud platform', 'google cloud'],
+        'kubernetes': ['kubernetes', 'k8s'],
+        'docker': ['docker', 'containerization'],
+        'terraform': ['terraform', 'infrastructure as code'],
+        'ansible': ['ansible', 'configuration management'],
+        'jenkins': ['jenkins', 'ci/cd'],
+        'gitlab': ['gitlab', 'gitlab ci'],
+        'circleci': ['circleci', 'circle ci']
+    },
+
+    'data_science': {
+        'pandas': ['pandas', 'pd'],
+        'numpy': ['numpy', 'np'],
+        'scikit-learn': ['scikit-learn', 'sklearn', 'sci-kit learn'],
+        'tensorflow': ['tensorflow', 'tf'],
+        'pytorch': ['pytorch', 'torch'],
+        'keras': ['keras'],
+        'matplotlib': ['matplotlib', 'pyplot'],
+        'seaborn': ['seaborn', 'sns'],
+        'plotly': ['plotly', 'plotly dash'],
+        'jupyter': ['jupyter', 'jupyter notebook', 'ipython'],
+        'apache spark': ['spark', 'apache spark', 'pyspark'],
+        'hadoop': ['hadoop', 'hdfs'],
+        'tableau': ['tableau'],
+        'power bi': ['power bi', 'powerbi'],
+        'r shiny': ['shiny', 'r shiny']
+    },
+
+    'mobile_development': {
+        'ios': ['ios development', 'ios', 'iphone development'],
+        'android': ['android development', 'android'],
+        'react native': ['react native', 'react-native'],
+        'flutter': ['flutter', 'dart'],
+        'xamarin': ['xamarin'],
+        'cordova': ['cordova', 'phonegap'],
+        'ionic': ['ionic framework', 'ionic']
+    },
+
+    'devops_tools': {
+        'git': ['git', 'version control', 'github', 'gitlab'],
+        'svn': ['svn', 'subversion'],
+        'maven': ['maven', 'apache maven'],
+        'gradle': ['gradle'],
+        'webpack': ['webpack', 'module bundler'],
+        'npm': ['npm', 'node package manager'],
+        'yarn': ['yarn package manager', 'yarn'],
+        'pip': ['pip', 'python package installer']
+    },
+
+    'soft_skills': {
+        'leadership': ['leadership', 'team leadership', 'leading teams'],
+        'communication': ['communication', 'public speaking', 'presentation'],
+        'problem solving': ['problem solving', 'analytical thinking', 'troubleshooting'],
+        'project management': ['project management', 'agile', 'scrum', 'kanban'],
+        'teamwork': ['teamwork', 'collaboration', 'cross-functional teams'],
+        'adaptability': ['adaptability', 'flexibility', 'learning agility'],
+        'time management': ['time management', 'organization', 'prioritization'],
+        'creativity': ['creativity', 'innovation', 'creative thinking'],
+        'critical thinking': ['critical thinking', 'analysis', 'evaluation'],
+        'mentoring': ['mentoring', 'coaching', 'training others']
+    }
+}
+
+# Reverse lookup from every lowercased skill name and alias to (skill, category)
+SKILL_LOOKUP = MappingProxyType({
+    term.lower(): (skill, category)
+    for category, skills in SKILL_DATABASE.items()
+    for skill, aliases in skills.items()
+    for term in (skill, *aliases)
+})
+
+
+def _build_skill_automaton():
+    """Build one Aho-Corasick automaton over every skill term and alias."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for skill_term, (canonical_name, category) in SKILL_LOOKUP.items():
+        automaton.add_word(skill_term, (skill_term, canonical_name, category))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once per process and shared read-only by every extractor
+SKILL_AUTOMATON = _build_skill_automaton()
+
+
 class AdvancedSkillExtractor:
     """Advanced skill extraction using multiple NLP techniques."""
     
-    def __init__(self):
+    # Noun chunks need the tagger, attribute ruler (tag -> POS) and parser and
+    # entities need NER, so only the lemmatizer is left out of the pipeline
+    NLP_EXCLUDED_PIPES = ("lemmatizer",)
+    NLP_BATCH_SIZE = 64
+    
+    # Skill catalogs at least this large are searched with an HNSW graph
+    SKILL_HNSW_MIN_TERMS = 10000
+    SKILL_HNSW_M = 32
+    
+    def __init__(self, embedding_cache_dir: str = DEFAULT_CACHE_DIR):
         self.nlp = None
         self.skill_embeddings = None
+        self._embedding_cache_dir = embedding_cache_dir
+        self._embed_cache: Optional[EmbeddingDiskCache] = None
+        self._skill_names: List[str] = []
+        self._skill_index: Optional[faiss.Index] = None  # One row per entry of _skill_names
         self._load_models()
         self._load_skill_database()
     
     def _load_models(self):
         """Load NLP models."""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=self.NLP_EXCLUDED_PIPES)
             logger.info("Loaded spaCy model successfully")
         except OSError:
             logger.warning("spaCy model not found. Some features will be limited.")
         
         try:
-            # Use a lightweight sentence transformer
-            self.skill_embeddings = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Loaded sentence transformer model")
+            # Imported lazily: the matcher pulls in torch. Sharing its model keeps
+            # one copy per process on the best available backend (CUDA fp16,
+            # int8 ONNX Runtime on CPU, or PyTorch fp32)
+            from app.core.ai_pipeline.semantic_matcher import get_semantic_matcher
+            
+            matcher = get_semantic_matcher()
+            self.skill_embeddings = matcher.sentence_transformer
+            if self.skill_embeddings is not None:
+                # Vectors differ slightly per backend, so each gets its own cache keys
+                self._embed_cache = EmbeddingDiskCache(
+                    f"{matcher.MODEL_NAME}:{matcher.model_variant}", self._embedding_cache_dir
+                )
+                logger.info(f"Using shared sentence transformer ({matcher.model_variant})")
         except Exception as e:
             logger.warning(f"Could not load sentence transformer: {e}")
     
     def _load_skill_database(self):
         """Load comprehensive skill database with categories."""
-        self.skill_database = {
-            'programming_languages': {
-                'python': ['python', 'py', 'python3'],
-                'javascript': ['javascript', 'js', 'ecmascript', 'es6', 'es2015'],
-                'java': ['java', 'jvm'],
-                'typescript': ['typescript', 'ts'],
-                'c++': ['c++', 'cpp', 'c plus plus'],
-                'c#': ['c#', 'csharp', 'c sharp'],
-                'php': ['php', 'php7', 'php8'],
-                'ruby': ['ruby', 'rb'],
-                'go': ['go', 'golang'],
-                'rust': ['rust', 'rust-lang'],
-                'kotlin': ['kotlin', 'kt'],
-                'swift': ['swift', 'swift5'],
-                'scala': ['scala'],
-                'r': ['r programming', 'r language'],
-                'matlab': ['matlab'],
-                'perl': ['perl'],
-                'bash': ['bash', 'shell scripting', 'bash scripting'],
-                'powershell': ['powershell', 'ps1']
-            },
-            
-            'web_technologies': {
-                'react': ['react', 'reactjs', 'react.js'],
-                'angular': ['angular', 'angularjs', 'angular2+'],
-                'vue': ['vue', 'vue.js', 'vuejs'],
-                'html': ['html', 'html5'],
-                'css': ['css', 'css3', 'cascading style sheets'],
-                'sass': ['sass', 'scss'],
-                'less': ['less css'],
-                'bootstrap': ['bootstrap', 'bootstrap4', 'bootstrap5'],
-                'tailwind': ['tailwind', 'tailwindcss'],
-                'jquery': ['jquery', 'jquery ui'],
-                'node.js': ['node.js', 'nodejs', 'node js'],
-                'express': ['express', 'express.js', 'expressjs'],
-                'django': ['django', 'django rest framework'],
-                'flask': ['flask', 'flask-restful'],
-                'spring': ['spring', 'spring boot', 'spring framework'],
-                'laravel': ['laravel', 'laravel framework'],
-                'rails': ['ruby on rails', 'rails', 'ror']
-            },
-            
-            'databases': {
-                'mysql': ['mysql', 'my sql'],
-                'postgresql': ['postgresql', 'postgres', 'psql'],
-                'mongodb': ['mongodb', 'mongo'],
-                'redis': ['redis'],
-                'elasticsearch': ['elasticsearch', 'elastic search', 'elk stack'],
-                'oracle': ['oracle database', 'oracle db'],
-                'sqlite': ['sqlite', 'sqlite3'],
-                'cassandra': ['cassandra', 'apache cassandra'],
-                'dynamodb': ['dynamodb', 'dynamo db'],
-                'neo4j': ['neo4j', 'graph database'],
-                'influxdb': ['influxdb', 'time series database']
-            },
-            
-            'cloud_platforms': {
-                'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'rds'],
-                'azure': ['azure', 'microsoft azure'],
-                'gcp': ['gcp', 'google cloud platform', 'google cloud'],
-                'kubernetes': ['kubernetes', 'k8s'],
-                'docker': ['docker', 'containerization'],
-                'terraform': ['terraform', 'infrastructure as code'],
-                'ansible': ['ansible', 'configuration management'],
-                'jenkins': ['jenkins', 'ci/cd'],
-                'gitlab': ['gitlab', 'gitlab ci'],
-                'circleci': ['circleci', 'circle ci']
-            },
-            
-            'data_science': {
-                'pandas': ['pandas', 'pd'],
-                'numpy': ['numpy', 'np'],
-                'scikit-learn': ['scikit-learn', 'sklearn', 'sci-kit learn'],
-                'tensorflow': ['tensorflow', 'tf'],
-                'pytorch': ['pytorch', 'torch'],
-                'keras': ['keras'],
-                'matplotlib': ['matplotlib', 'pyplot'],
-                'seaborn': ['seaborn', 'sns'],
-                'plotly': ['plotly', 'plotly dash'],
-                'jupyter': ['jupyter', 'jupyter notebook', 'ipython'],
-                'apache spark': ['spark', 'apache spark', 'pyspark'],
-                'hadoop': ['hadoop', 'hdfs'],
-                'tableau': ['tableau'],
-                'power bi': ['power bi', 'powerbi'],
-                'r shiny': ['shiny', 'r shiny']
-            },
-            
-            'mobile_development': {
-                'ios': ['ios development', 'ios', 'iphone development'],
-                'android': ['android development', 'android'],
-                'react native': ['react native', 'react-native'],
-                'flutter': ['flutter', 'dart'],
-                'xamarin': ['xamarin'],
-                'cordova': ['cordova', 'phonegap'],
-                'ionic': ['ionic framework', 'ionic']
-            },
-            
-            'devops_tools': {
-                'git': ['git', 'version control', 'github', 'gitlab'],
-                'svn': ['svn', 'subversion'],
-                'maven': ['maven', 'apache maven'],
-                'gradle': ['gradle'],
-                'webpack': ['webpack', 'module bundler'],
-                'npm': ['npm', 'node package manager'],
-                'yarn': ['yarn package manager', 'yarn'],
-                'pip': ['pip', 'python package installer']
-            },
-            
-            'soft_skills': {
-                'leadership': ['leadership', 'team leadership', 'leading teams'],
-                'communication': ['communication', 'public speaking', 'presentation'],
-                'problem solving': ['problem solving', 'analytical thinking', 'troubleshooting'],
-                'project management': ['project management', 'agile', 'scrum', 'kanban'],
-                'teamwork': ['teamwork', 'collaboration', 'cross-functional teams'],
-                'adaptability': ['adaptability', 'flexibility', 'learning agility'],
-                'time management': ['time management', 'organization', 'prioritization'],
-                'creativity': ['creativity', 'innovation', 'creative thinking'],
-                'critical thinking': ['critical thinking', 'analysis', 'evaluation'],
-                'mentoring': ['mentoring', 'coaching', 'training others']
-            }
-        }
+        # Shared, import-time tables and automaton; nothing is rebuilt per instance
+        self.skill_database = SKILL_DATABASE
+        self.skill_lookup = SKILL_LOOKUP
         
-        # Create reverse lookup for faster searching
-        self.skill_lookup = {}
-        for category, skills in self.skill_database.items():
-            for skill, aliases in skills.items():
-                self.skill_lookup[skill.lower()] = (skill, category)
-                for alias in aliases:
-                    self.skill_lookup[alias.lower()] = (skill, category)
+        self._skill_automaton = SKILL_AUTOMATON
+        self._encode_skill_terms()
+    
+    def _encode_skill_terms(self):
+        """Embed every skill term once and index the vectors for inner-product search."""
+        if self.skill_embeddings is None:
+            return
+        
+        self._skill_names = list(self.skill_lookup.keys())
+        vectors = cached_encode(
+            self.skill_embeddings, self._skill_names, self._embed_cache, batch_size=128
+        )
+        self._skill_index = self._create_skill_index(vectors)
+    
+    def _create_skill_index(self, vectors: np.ndarray) -> faiss.Index:
+        """Build the catalog index; vectors are unit length, so inner product is cosine."""
+        dim = vectors.shape[1]
+        if len(vectors) >= self.SKILL_HNSW_MIN_TERMS:
+            # Graph search keeps lookups sub-linear for very large catalogs
+            index = faiss.IndexHNSWFlat(dim, self.SKILL_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        else:
+            # 8-bit scalar quantization: a quarter of float32 memory, SIMD distance kernels
+            index = faiss.IndexScalarQuantizer(
+                dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+            index.train(vectors)
+        index.add(vectors)
+        return index
+    
+    def find_similar_skills(self, phrase: str, top_k: int = 5,
+                            threshold: float = 0.6) -> List[Tuple[str, str, float]]:
+        """Return (canonical name, category, similarity) for the closest known skills."""
+        if self._skill_index is None:
+            return []
+        
+        query = cached_encode(self.skill_embeddings, [phrase], self._embed_cache)
+        scores, indices = self._skill_index.search(query, min(top_k, self._skill_index.ntotal))
+        
+        matches = {}
+        for score, idx in zip(scores[0], indices[0]):
+            if idx < 0 or score < threshold:
+                break
+            canonical_name, category = self.skill_lookup[self._skill_names[idx]]
+            if canonical_name not in matches:
+                matches[canonical_name] = (canonical_name, category, float(score))
+        
+        return list(matches.values())
     
     def extract_skills(self, text: str, context_type: str = "resume") -> SkillProfile:
         """Extract comprehensive skill profile from text."""
@@ -198,26 +333,53 @@ class AdvancedSkillExtractor:
         
         # Clean and prepare text
         cleaned_text = self._preprocess_text(text)
+        doc = self.nlp(cleaned_text) if self.nlp else None
         
-        # Extract skills using multiple methods
-        extracted_skills = []
+        return self._extract_skill_profile(text, cleaned_text, doc)
+    
+    def extract_skills_batch(self, texts: List[str], context_type: str = "resume") -> List[SkillProfile]:
+        """Extract skill profiles for many texts, batching the spaCy pass."""
+        logger.info(f"Extracting skills from {len(texts)} {context_type} documents")
         
-        # Method 1: Dictionary-based exact matching
-        dict_skills = self._extract_skills_dictionary(cleaned_text)
-        extracted_skills.extend(dict_skills)
+        return [profile for _, profile in self.extract_skills_stream(zip(texts, range(len(texts))))]
+    
+    def extract_skills_stream(self, items: Iterable[Tuple[str, Any]],
+                              batch_size: Optional[int] = None) -> Iterator[Tuple[Any, SkillProfile]]:
+        """Yield (item_id, SkillProfile) for (text, item_id) pairs as each document finishes.
         
-        # Method 2: Pattern-based extraction
-        pattern_skills = self._extract_skills_patterns(cleaned_text)
-        extracted_skills.extend(pattern_skills)
+        Input is consumed lazily, so callers can stream resumes in and results out
+        without holding the whole batch in memory.
+        """
+        prepared = ((self._preprocess_text(text), (text, item_id)) for text, item_id in items)
         
-        # Method 3: NLP-based extraction (if spaCy is available)
-        if self.nlp:
-            nlp_skills = self._extract_skills_nlp(cleaned_text)
-            extracted_skills.extend(nlp_skills)
+        if not self.nlp:
+            for cleaned_text, (text, item_id) in prepared:
+                yield item_id, self._extract_skill_profile(text, cleaned_text, None)
+            return
+        
+        docs = self.nlp.pipe(
+            prepared,
+            as_tuples=True,
+            batch_size=batch_size or self.NLP_BATCH_SIZE,
+            n_process=1  # Doc pickling outweighs multiprocessing gains
+        )
+        for doc, (text, item_id) in docs:
+            yield item_id, self._extract_skill_profile(text, doc.text, doc)
+    
+    def _extract_skill_profile(self, text: str, cleaned_text: str, doc) -> SkillProfile:
+        """Run all extraction methods over preprocessed text and its spaCy doc."""
+        # Lowercased once for the dictionary scan; spaCy spans carry their own offsets
+        text_lower = cleaned_text.lower()
         
-        # Method 4: Context-aware extraction
-        context_skills = self._extract_skills_contextual(cleaned_text)
-        extracted_skills.extend(context_skills)
+        # Extract skills using multiple methods; both are generators, so
+        # candidates stream straight into deduplication
+        # Method 1: Dictionary matching; one pass over the text finds every known
+        # alias, with pattern and context confidence folded in
+        extracted_skills = self._extract_skills_dictionary(cleaned_text, text_lower)
+        
+        # Method 2: NLP-based extraction (if spaCy is available)
+        if doc is not None:
+            extracted_skills = itertools.chain(extracted_skills, self._extract_skills_nlp(doc))
         
         # Deduplicate and categorize
         unique_skills = self._deduplicate_skills(extracted_skills)
@@ -228,94 +390,69 @@ class AdvancedSkillExtractor:
     
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for better skill extraction."""
-        # Normalize common variations
-        text = re.sub(r'(\w+)\.js', r'\1.js', text, flags=re.IGNORECASE)
-        text = re.sub(r'(\w+)JS', r'\1.js', text)
-        text = re.sub(r'HTML5', 'HTML', text, flags=re.IGNORECASE)
-        text = re.sub(r'CSS3', 'CSS', text, flags=re.IGNORECASE)
-        
-        # Handle common separators
-        text = re.sub(r'[,;|•▪▫◦]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # Normalize common variations; each substitution only runs when its
+        # trigger substring is present, which most resumes lack
+        text_lower = text.lower()
+        if '.js' in text_lower:
+            text = JS_EXTENSION_PATTERN.sub(r'\1.js', text)
+        if 'JS' in text:
+            text = JS_SUFFIX_PATTERN.sub(r'\1.js', text)
+        if 'html5' in text_lower or 'css3' in text_lower:
+            text = VERSIONED_MARKUP_PATTERN.sub(lambda m: m.group()[:-1].upper(), text)
+        
+        # Handle common separators and collapse whitespace
+        text = text.translate(SEPARATOR_TABLE)
+        return ' '.join(text.split())
     
-    def _extract_skills_dictionary(self, text: str) -> List[ExtractedSkill]:
+    def _extract_skills_dictionary(self, text: str, text_lower: str) -> Iterator[ExtractedSkill]:
         """Extract skills using dictionary matching."""
-        skills = []
-        text_lower = text.lower()
-        
-        for skill_term, (canonical_name, category) in self.skill_lookup.items():
-            if skill_term in text_lower:
-                # Find context around the skill
-                context = self._extract_context(text, skill_term)
-                confidence = self._calculate_dictionary_confidence(skill_term, text_lower)
-                
-                skills.append(ExtractedSkill(
-                    name=canonical_name,
-                    category=category,
-                    confidence=confidence,
-                    context=context
-                ))
-        
-        return skills
+        # Section headings are located once per document, not once per skill
+        section_offsets = [match.start() for match in SKILL_SECTION_PATTERN.finditer(text_lower)]
+        
+        for skill_term, offsets in self._find_skill_terms(text_lower).items():
+            canonical_name, category = self.skill_lookup[skill_term]
+            # Find context around the skill
+            context = self._extract_context(text, skill_term, offsets[0])
+            confidence = max(
+                self._calculate_dictionary_confidence(skill_term, offsets, section_offsets),
+                PATTERN_SKILL_CONFIDENCE.get(skill_term, 0.0)
+            )
+            
+            yield ExtractedSkill(
+                name=canonical_name,
+                category=category,
+                confidence=confidence,
+                context=context
+            )
     
-    def _extract_skills_patterns(self, text: str) -> List[ExtractedSkill]:
-        """Extract skills using regex patterns."""
-        skills = []
-        
-        # Programming language patterns
-        prog_patterns = [
-            r'\b(python|java|javascript|typescript|c\+\+|c#|php|ruby|go|rust)\b',
-            r'\b(kotlin|swift|scala|matlab|perl|bash|powershell)\b'
-        ]
-        
-        for pattern in prog_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skill_name = match.group(1).lower()
-                if skill_name in self.skill_lookup:
-                    canonical_name, category = self.skill_lookup[skill_name]
-                    context = self._extract_context(text, skill_name, match.start())
-                    
-                    skills.append(ExtractedSkill(
-                        name=canonical_name,
-                        category=category,
-                        confidence=0.9,  # High confidence for pattern matches
-                        context=context
-                    ))
-        
-        # Framework patterns
-        framework_patterns = [
-            r'\b(react|angular|vue)(?:\.js)?\b',
-            r'\b(django|flask|spring|express)(?:\s+(?:boot|framework))?\b',
-            r'\b(tensorflow|pytorch|keras|scikit-learn)\b'
-        ]
-        
-        for pattern in framework_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skill_name = match.group(1).lower()
-                if skill_name in self.skill_lookup:
-                    canonical_name, category = self.skill_lookup[skill_name]
-                    context = self._extract_context(text, skill_name, match.start())
-                    
-                    skills.append(ExtractedSkill(
-                        name=canonical_name,
-                        category=category,
-                        confidence=0.85,
-                        context=context
-                    ))
-        
-        return skills
+    def _find_skill_terms(self, text_lower: str) -> Dict[str, List[int]]:
+        """Map each skill term found as a whole word to the offsets of its occurrences."""
+        found = {}
+        
+        if self._skill_automaton is not None:
+            # Single pass over the text for all terms
+            for end_idx, (skill_term, _, _) in self._skill_automaton.iter(text_lower):
+                start_idx = end_idx - len(skill_term) + 1
+                if self._is_whole_word(text_lower, start_idx, end_idx + 1):
+                    found.setdefault(skill_term, []).append(start_idx)
+            return found
+        
+        for skill_term in self.skill_lookup:
+            start_idx = text_lower.find(skill_term)
+            while start_idx != -1:
+                if self._is_whole_word(text_lower, start_idx, start_idx + len(skill_term)):
+                    found.setdefault(skill_term, []).append(start_idx)
+                start_idx = text_lower.find(skill_term, start_idx + 1)
+        return found
     
-    def _extract_skills_nlp(self, text: str) -> List[ExtractedSkill]:
-        """Extract skills using NLP techniques."""
-        if not self.nlp:
-            return []
-        
-        skills = []
-        doc = self.nlp(text)
+    @staticmethod
+    def _is_whole_word(text: str, start: int, end: int) -> bool:
+        """Check that text[start:end] is not embedded in a longer alphanumeric token."""
+        return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+    
+    def _extract_skills_nlp(self, doc) -> Iterator[ExtractedSkill]:
+        """Extract skills using NLP techniques from a parsed spaCy doc."""
+        text = doc.text
         
         # Extract noun phrases that might be skills
         for noun_phrase in doc.noun_chunks:
@@ -328,14 +465,14 @@ class AdvancedSkillExtractor:
             # Check if phrase matches known skills
             if phrase_text in self.skill_lookup:
                 canonical_name, category = self.skill_lookup[phrase_text]
-                context = self._extract_context(text, phrase_text)
+                context = self._extract_context(text, phrase_text, noun_phrase.start_char)
                 
-                skills.append(ExtractedSkill(
+                yield ExtractedSkill(
                     name=canonical_name,
                     category=category,
                     confidence=0.75,  # Lower confidence for NLP extraction
                     context=context
-                ))
+                )
         
         # Extract named entities that might be technologies
         for ent in doc.ents:
@@ -343,91 +480,50 @@ class AdvancedSkillExtractor:
                 ent_text = ent.text.lower().strip()
                 if ent_text in self.skill_lookup:
                     canonical_name, category = self.skill_lookup[ent_text]
-                    context = self._extract_context(text, ent_text)
+                    context = self._extract_context(text, ent_text, ent.start_char)
                     
-                    skills.append(ExtractedSkill(
+                    yield ExtractedSkill(
                         name=canonical_name,
                         category=category,
                         confidence=0.70,
                         context=context
-                    ))
-        
-        return skills
+                    )
     
-    def _extract_skills_contextual(self, text: str) -> List[ExtractedSkill]:
-        """Extract skills based on context clues."""
-        skills = []
-        
-        # Look for skill-indicating phrases
-        skill_indicators = [
-            r'(?:experience (?:with|in)|proficient (?:in|with)|skilled (?:in|with)|expertise (?:in|with))\s+([^,.\n]+)',
-            r'(?:technologies:|skills:|tools:)\s*([^.\n]+)',
-            r'(?:worked with|used|implemented|developed using)\s+([^,.\n]+)',
-            r'(?:programming languages?|technologies?|frameworks?|tools?):\s*([^.\n]+)'
-        ]
-        
-        for pattern in skill_indicators:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skill_text = match.group(1).strip()
-                
-                # Split by common delimiters and check each part
-                potential_skills = re.split(r'[,;|&]', skill_text)
-                for potential_skill in potential_skills:
-                    clean_skill = potential_skill.strip().lower()
-                    
-                    if clean_skill in self.skill_lookup:
-                        canonical_name, category = self.skill_lookup[clean_skill]
-                        context = skill_text
-                        
-                        skills.append(ExtractedSkill(
-                            name=canonical_name,
-                            category=category,
-                            confidence=0.80,
-                            context=context
-                        ))
-        
-        return skills
-    
-    def _extract_context(self, text: str, skill: str, position: int = None) -> str:
-        """Extract context around a skill mention."""
-        if position is None:
-            position = text.lower().find(skill.lower())
-        
-        if position == -1:
-            return ""
-        
+    def _extract_context(self, text: str, skill: str, position: int) -> str:
+        """Extract context around a skill mention starting at ``position``."""
         # Extract 50 characters before and after
         start = max(0, position - 50)
         end = min(len(text), position + len(skill) + 50)
         
         return text[start:end].strip()
     
-    def _calculate_dictionary_confidence(self, skill_term: str, text: str) -> float:
+    def _calculate_dictionary_confidence(self, skill_term: str, offsets: List[int],
+                                         section_offsets: List[int]) -> float:
         """Calculate confidence score for dictionary matches."""
         base_confidence = 0.8
         
         # Boost confidence if skill appears multiple times
-        count = text.count(skill_term.lower())
+        count = len(offsets)
         if count > 1:
             base_confidence += min(0.1 * (count - 1), 0.2)
         
-        # Boost confidence if skill appears in typical skill sections
-        skill_sections = ['skills', 'technologies', 'experience', 'projects']
-        for section in skill_sections:
-            if section in text and skill_term in text[text.find(section):text.find(section) + 200]:
+        # Boost confidence if skill appears within a window after a typical skill section
+        for offset in offsets:
+            i = bisect.bisect_right(section_offsets, offset)
+            if i and offset + len(skill_term) - section_offsets[i - 1] <= SKILL_SECTION_WINDOW:
                 base_confidence += 0.1
                 break
         
         return min(base_confidence, 1.0)
     
-    def _deduplicate_skills(self, skills: List[ExtractedSkill]) -> List[ExtractedSkill]:
+    def _deduplicate_skills(self, skills: Iterable[ExtractedSkill]) -> List[ExtractedSkill]:
         """Remove duplicate skills, keeping the one with highest confidence."""
-        skill_dict = {}
+        skill_dict: Dict[Tuple[str, str], ExtractedSkill] = {}
         
         for skill in skills:
-            key = (skill.name.lower(), skill.category)
-            if key not in skill_dict or skill.confidence > skill_dict[key].confidence:
+            key = (skill.name_lower, skill.category)
+            current = skill_dict.get(key)
+            if current is None or skill.confidence > current.confidence:
                 skill_dict[key] = skill
         
         return list(skill_dict.values())
@@ -456,12 +552,13 @@ class AdvancedSkillExtractor:
     def _build_skill_profile(self, categorized_skills: Dict[str, List[ExtractedSkill]], original_text: str) -> SkillProfile:
         """Build comprehensive skill profile."""
         # Calculate skill categories distribution
-        skill_categories = {}
-        for category, skills in categorized_skills.items():
-            skill_categories[category] = [skill.name for skill in skills]
+        skill_categories = {
+            category: [skill.name for skill in skills]
+            for category, skills in categorized_skills.items()
+        }
         
         # Calculate diversity score
-        total_categories = len([cat for cat, skills in skill_categories.items() if skills])
+        total_categories = sum(1 for skills in categorized_skills.values() if skills)
         max_categories = 4  # technical, soft, domain, tools
         diversity_score = min(total_categories / max_categories, 1.0)
         
@@ -475,23 +572,21 @@ class AdvancedSkillExtractor:
             tools_platforms=categorized_skills['tools_platforms'],
             certifications=certifications,
             skill_categories=skill_categories,
-            total_skills_count=sum(len(skills) for skills in categorized_skills.values()),
+            total_skills_count=sum(map(len, categorized_skills.values())),
             skill_diversity_score=diversity_score
         )
     
     def _extract_certifications(self, text: str) -> List[str]:
         """Extract certifications from text."""
-        cert_patterns = [
-            r'(AWS|Azure|Google Cloud|GCP)\s+(Certified|Certification)',
-            r'(PMP|CISSP|CISM|CISA)\s*(Certified|Certification)?',
-            r'(Scrum Master|Product Owner|Agile)\s*(Certified|Certification)',
-            r'(Oracle|Microsoft|Cisco|CompTIA)\s+\w+\s*(Certified|Certification)'
-        ]
-        
         certifications = []
-        for pattern in cert_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in CERTIFICATION_PATTERNS:
+            for match in pattern.finditer(text):
                 certifications.append(match.group().strip())
         
-        return certifications
\ No newline at end of file
+        return certifications
+
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> AdvancedSkillExtractor:
+    """Return the process-wide extractor so its models are loaded only once."""
+    return AdvancedSkillExtractor()
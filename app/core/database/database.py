@@ -12,12 +12,32 @@ if settings.postgres_url and not settings.debug:
 else:
     DATABASE_URL = settings.database_url
 
+# Connection pool options; SQLite keeps SQLAlchemy's default pool
+if DATABASE_URL.startswith("postgresql"):
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        # Fail fast instead of queueing requests indefinitely when the pool is exhausted
+        "pool_timeout": settings.db_pool_timeout,
+        # Reuse the most recently returned (warm) connection first
+        "pool_use_lifo": True,
+        # Replace connections dropped by the server or a proxy before handing them out
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        # Send executemany() INSERTs (e.g. batch evaluations) as multi-row VALUES pages
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 500,
+        # Short queries don't benefit from JIT compilation
+        "connect_args": {"options": "-c jit=off"},
+    }
+else:
+    engine_options = {"pool_pre_ping": True}
+
 # Create database engine
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=settings.debug
+    pool_recycle=settings.db_pool_recycle,
+    echo=settings.debug,
+    **engine_options
 )
 
 # Create session factory
@@ -1,17 +1,43 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, ForeignKey, JSON, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import List
 import uuid
 
 Base = declarative_base()
 
+# Binary, indexable JSONB on PostgreSQL; plain JSON elsewhere (e.g. SQLite in development)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _gin_index(name: str, column: str) -> Index:
+    """GIN index for JSONB containment (@>) queries, created on PostgreSQL only."""
+    return Index(
+        name, column,
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"}
+    ).ddl_if(dialect="postgresql")
+
+
+def _brin_index(name: str, column: str) -> Index:
+    """BRIN index for date-range scans on append-mostly tables, created on PostgreSQL only."""
+    return Index(
+        name, column,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32}
+    ).ddl_if(dialect="postgresql")
+
 
 class User(Base):
     """User model for authentication and role management."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Emails match case-insensitively at registration and login
+        Index("ix_users_email_lower", func.lower(text("email")), unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -31,6 +57,10 @@ class User(Base):
 class JobDescription(Base):
     """Job description model with parsed content."""
     __tablename__ = "job_descriptions"
+    __table_args__ = (
+        _gin_index("ix_job_descriptions_required_skills_gin", "required_skills"),
+        _gin_index("ix_job_descriptions_preferred_skills_gin", "preferred_skills"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -42,13 +72,13 @@ class JobDescription(Base):
     
     # Content
     raw_content = Column(Text, nullable=False)
-    parsed_content = Column(JSON, nullable=True)  # Structured parsed data
+    parsed_content = Column(JSONType, nullable=True)  # Structured parsed data
     
     # Extracted Information
-    required_skills = Column(JSON, nullable=True)  # List of required skills
-    preferred_skills = Column(JSON, nullable=True)  # List of preferred skills
+    required_skills = Column(JSONType, nullable=True)  # List of required skills
+    preferred_skills = Column(JSONType, nullable=True)  # List of preferred skills
     required_experience_years = Column(Integer, nullable=True)
-    education_requirements = Column(JSON, nullable=True)
+    education_requirements = Column(JSONType, nullable=True)
     
     # Metadata
     job_type = Column(String(50), nullable=True)  # full-time, part-time, contract
@@ -64,22 +94,15 @@ class JobDescription(Base):
     # Relationships
     created_by_user = relationship("User", back_populates="job_descriptions")
     resume_evaluations = relationship("ResumeEvaluation", back_populates="job_description")
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'required_skills': self.required_skills or [],
-            'experience_required': self.experience_required,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
+    skill_links = relationship("JobSkill", cascade="all, delete-orphan")
 
 
 class Resume(Base):
     """Resume model with parsed content and metadata."""
     __tablename__ = "resumes"
+    __table_args__ = (
+        _gin_index("ix_resumes_skills_gin", "skills"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -94,28 +117,28 @@ class Resume(Base):
     file_path = Column(String(500), nullable=False)
     file_type = Column(String(10), nullable=False)  # pdf, docx, doc
     file_size = Column(Integer, nullable=False)
-    file_hash = Column(String(64), nullable=False, unique=True)  # SHA256 hash
+    file_hash = Column(String(64), nullable=False, unique=True)  # BLAKE3 (or SHA-256) hex digest
     
     # Parsed Content
     raw_text = Column(Text, nullable=False)
-    parsed_content = Column(JSON, nullable=True)  # Structured parsed data
+    parsed_content = Column(JSONType, nullable=True)  # Structured parsed data
     
     # Extracted Information
-    skills = Column(JSON, nullable=True)  # List of skills
+    skills = Column(JSONType, nullable=True)  # List of skills
     experience_years = Column(Float, nullable=True)
-    education = Column(JSON, nullable=True)  # Education details
-    work_experience = Column(JSON, nullable=True)  # Work experience
-    projects = Column(JSON, nullable=True)  # Projects
-    certifications = Column(JSON, nullable=True)  # Certifications
+    education = Column(JSONType, nullable=True)  # Education details
+    work_experience = Column(JSONType, nullable=True)  # Work experience
+    projects = Column(JSONType, nullable=True)  # Projects
+    certifications = Column(JSONType, nullable=True)  # Certifications
     
     # Analysis Results
-    skill_categories = Column(JSON, nullable=True)  # Categorized skills
+    skill_categories = Column(JSONType, nullable=True)  # Categorized skills
     experience_level = Column(String(20), nullable=True)  # entry, mid, senior
     
     # Metadata
     upload_source = Column(String(50), default="manual")  # manual, bulk, api
     processing_status = Column(String(20), default="pending")  # pending, processed, failed
-    processing_errors = Column(JSON, nullable=True)
+    processing_errors = Column(JSONType, nullable=True)
     
     # Tracking
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -124,22 +147,21 @@ class Resume(Base):
     
     # Relationships
     evaluations = relationship("ResumeEvaluation", back_populates="resume")
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'candidate_name': self.candidate_name,
-            'candidate_email': self.candidate_email,
-            'skills': self.skills or [],
-            'experience_years': self.experience_years,
-            'experience_level': self.experience_level,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
+    skill_links = relationship("ResumeSkill", cascade="all, delete-orphan")
 
 
 class ResumeEvaluation(Base):
     """Resume evaluation results against job descriptions."""
     __tablename__ = "resume_evaluations"
+    __table_args__ = (
+        _gin_index("ix_resume_evaluations_matching_skills_gin", "matching_skills"),
+        _gin_index("ix_resume_evaluations_missing_skills_gin", "missing_skills"),
+        # Ranked candidates for a job: ordered index scan instead of a sort
+        Index("ix_resume_evaluations_job_score", "job_description_id", text("overall_score DESC")),
+        # A resume's evaluations, newest first
+        Index("ix_resume_evaluations_resume_created", "resume_id", "created_at"),
+        _brin_index("ix_resume_evaluations_created_brin", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -156,23 +178,23 @@ class ResumeEvaluation(Base):
     education_score = Column(Float, nullable=False)
     
     # Detailed Analysis
-    matching_skills = Column(JSON, nullable=True)  # Skills that match
-    missing_skills = Column(JSON, nullable=True)  # Skills that are missing
-    additional_skills = Column(JSON, nullable=True)  # Extra skills candidate has
+    matching_skills = Column(JSONType, nullable=True)  # Skills that match
+    missing_skills = Column(JSONType, nullable=True)  # Skills that are missing
+    additional_skills = Column(JSONType, nullable=True)  # Extra skills candidate has
     
     # Verdict
     suitability = Column(String(10), nullable=False)  # High, Medium, Low
     recommendation = Column(Text, nullable=True)
     
     # AI-Generated Feedback
-    strengths = Column(JSON, nullable=True)  # List of strengths
-    weaknesses = Column(JSON, nullable=True)  # List of areas for improvement
-    suggestions = Column(JSON, nullable=True)  # Improvement suggestions
+    strengths = Column(JSONType, nullable=True)  # List of strengths
+    weaknesses = Column(JSONType, nullable=True)  # List of areas for improvement
+    suggestions = Column(JSONType, nullable=True)  # Improvement suggestions
     personalized_feedback = Column(Text, nullable=True)  # Detailed feedback
     
     # Benchmarking
     percentile_rank = Column(Float, nullable=True)  # 0-100
-    peer_comparison = Column(JSON, nullable=True)  # Comparison with similar profiles
+    peer_comparison = Column(JSONType, nullable=True)  # Comparison with similar profiles
     
     # Processing Metadata
     processing_time = Column(Float, nullable=True)  # Processing time in seconds
@@ -184,20 +206,39 @@ class ResumeEvaluation(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
+    # List queries eager-load resume/job_description with only the columns they show
     resume = relationship("Resume", back_populates="evaluations")
     job_description = relationship("JobDescription", back_populates="resume_evaluations")
-    evaluated_by_user = relationship("User", back_populates="resume_evaluations")
+    evaluated_by_user = relationship("User", back_populates="resume_evaluations", lazy="raise")
+
+
+class Skill(Base):
+    """Canonical skill names shared by resumes and job descriptions."""
+    __tablename__ = "skills"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), unique=True, index=True, nullable=False)
+
+
+class ResumeSkill(Base):
+    """Resume-to-skill link; normalized form of Resume.skills for indexed joins."""
+    __tablename__ = "resume_skills"
+    
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True, index=True)
+    
+    skill = relationship("Skill")
+
+
+class JobSkill(Base):
+    """Job-to-skill link; normalized form of required/preferred skills."""
+    __tablename__ = "job_skills"
+    
+    job_description_id = Column(Integer, ForeignKey("job_descriptions.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True, index=True)
+    required = Column(Boolean, nullable=False, default=True)  # False for preferred skills
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'overall_score': self.overall_score,
-            'suitability': self.suitability,
-            'matching_skills': self.matching_skills or [],
-            'missing_skills': self.missing_skills or [],
-            'percentile_rank': self.percentile_rank,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
+    skill = relationship("Skill")
 
 
 class SkillBenchmark(Base):
@@ -229,6 +270,9 @@ class SkillBenchmark(Base):
 class Analytics(Base):
     """Analytics and insights data."""
     __tablename__ = "analytics"
+    __table_args__ = (
+        _brin_index("ix_analytics_date_recorded_brin", "date_recorded"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -241,7 +285,7 @@ class Analytics(Base):
     # Metrics
     metric_value = Column(Float, nullable=False)
     metric_count = Column(Integer, nullable=True)
-    additional_data = Column(JSON, nullable=True)
+    additional_data = Column(JSONType, nullable=True)
     
     # Tracking
     date_recorded = Column(DateTime(timezone=True), nullable=False)
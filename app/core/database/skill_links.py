@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
+
+from app.core.database.models import Skill, ResumeSkill, JobSkill, Resume, JobDescription
+
+# Dialects with INSERT ... ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def get_or_create_skills(db: Session, names: Iterable[str]) -> Dict[str, Skill]:
+    """Map skill names to Skill rows, adding any that don't exist yet."""
+    names = list(dict.fromkeys(name for name in names if name))
+    if not names:
+        return {}
+    
+    skills = {skill.name: skill for skill in db.query(Skill).filter(Skill.name.in_(names))}
+    missing = [name for name in names if name not in skills]
+    if missing:
+        _insert_skill_names(db, missing)
+        skills.update(
+            (skill.name, skill) for skill in db.query(Skill).filter(Skill.name.in_(missing))
+        )
+    return skills
+
+
+def _insert_skill_names(db: Session, names: List[str]) -> None:
+    """Insert skill names, tolerating rows a concurrent transaction added first."""
+    dialect = db.get_bind().dialect.name
+    if dialect in _UPSERT_INSERTS:
+        db.execute(
+            _UPSERT_INSERTS[dialect](Skill)
+            .values([{"name": name} for name in names])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        return
+    
+    for name in names:
+        try:
+            with db.begin_nested():
+                db.add(Skill(name=name))
+        except IntegrityError:
+            pass  # Another transaction created it; the caller re-selects
+
+
+def resume_skill_links(db: Session, skills: Optional[List[str]]) -> List[ResumeSkill]:
+    """Build join rows for a resume's skill list."""
+    return [ResumeSkill(skill=skill) for skill in get_or_create_skills(db, skills or []).values()]
+
+
+def job_skill_links(
+    db: Session,
+    required_skills: Optional[List[str]],
+    preferred_skills: Optional[List[str]]
+) -> List[JobSkill]:
+    """Build join rows for a job's skills; a skill listed as both counts as required."""
+    required = set(required_skills or [])
+    skills = get_or_create_skills(db, [*(required_skills or []), *(preferred_skills or [])])
+    return [JobSkill(skill=skill, required=name in required) for name, skill in skills.items()]
+
+
+def backfill_skill_links_if_empty(db: Session) -> bool:
+    """Backfill the join tables once, for databases created before they existed.
+    
+    Returns True if a backfill ran.
+    """
+    if db.query(ResumeSkill.resume_id).first() or db.query(JobSkill.job_description_id).first():
+        return False
+    if not (db.query(Resume.id).first() or db.query(JobDescription.id).first()):
+        return False
+    backfill_skill_links(db)
+    return True
+
+
+def backfill_skill_links(db: Session) -> None:
+    """Populate the join tables from the JSON skill columns of existing rows."""
+    # Only the skill lists are read; skip loading the raw and parsed text
+    resumes = db.query(Resume).options(load_only(Resume.id, Resume.skills)).filter(Resume.skills.isnot(None))
+    for resume in resumes:
+        resume.skill_links = resume_skill_links(db, resume.skills)
+    jobs = db.query(JobDescription).options(
+        load_only(JobDescription.id, JobDescription.required_skills, JobDescription.preferred_skills)
+    )
+    for job in jobs:
+        job.skill_links = job_skill_links(db, job.required_skills, job.preferred_skills)
+    db.commit()
@@ -1,27 +1,53 @@
-from passlib.context import CryptContext
-from passlib.hash import bcrypt
+import base64
+import os
+import bcrypt
 import secrets
+from typing import List
+from app.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes; truncate explicitly as passlib did
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+PASSWORD_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
+
+
+def _password_bytes(password: str) -> bytes:
+    return password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
 
 
 def hash_password(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(_password_bytes(password), salt).decode('ascii')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_password_bytes(plain_password), hashed_password.encode('ascii'))
 
 
 def generate_password(length: int = 12) -> str:
     """Generate a secure random password."""
-    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # Rejection sampling over 7-bit values keeps every character equally likely;
+    # 70 of 128 values are kept, so 3x overprovisioning rarely needs a second urandom()
+    chars = []
+    while len(chars) < length:
+        for byte in os.urandom(3 * length):
+            index = byte & 0x7F
+            if index < len(PASSWORD_ALPHABET):
+                chars.append(PASSWORD_ALPHABET[index])
+    return ''.join(chars[:length])
 
 
 def generate_token(length: int = 32) -> str:
     """Generate a secure random token."""
-    return secrets.token_urlsafe(length)
\ No newline at end of file
+    return secrets.token_urlsafe(length)
+
+
+def generate_tokens(count: int, length: int = 32) -> List[str]:
+    """Generate ``count`` tokens like generate_token, drawing all entropy in one call."""
+    raw = os.urandom(length * count)
+    return [
+        base64.urlsafe_b64encode(raw[i:i + length]).rstrip(b'=').decode('ascii')
+        for i in range(0, len(raw), length)
+    ]
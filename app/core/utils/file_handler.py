@@ -1,14 +1,50 @@
 import os
+import re
 import hashlib
 import shutil
+import tempfile
+import anyio
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import BinaryIO, Optional, Tuple, List
 from werkzeug.utils import secure_filename
 from app.config import settings
 from app.core.utils.logger import get_logger
 
+try:
+    import blake3
+except ImportError:  # Optional: fall back to SHA-256
+    blake3 = None
+
 logger = get_logger(__name__)
 
+# Read size for streaming uploads to disk
+HASH_CHUNK_SIZE = 1 << 20
+
+# Same character class werkzeug's secure_filename strips
+UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+def _secure_filename(filename: str) -> str:
+    """secure_filename with a fast path for ASCII names on POSIX.
+
+    For ASCII input werkzeug's Unicode normalization is a no-op and its
+    reserved-name check only applies on Windows, so the result is identical.
+    """
+    if not filename.isascii() or os.name == 'nt':
+        return secure_filename(filename)
+    filename = '_'.join(filename.replace(os.sep, ' ').split())
+    return UNSAFE_FILENAME_CHARS.sub('', filename).strip('._')
+
+
+def _new_file_hasher():
+    """Hasher for upload dedup; BLAKE3 unless SHA-256 is configured or blake3 is missing.
+
+    Both produce 64 hex characters, so either fits ``Resume.file_hash``.
+    """
+    if blake3 is not None and settings.file_hash_algorithm == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
 
 class FileHandler:
     """Handle file upload, validation, and management."""
@@ -18,8 +54,10 @@ class FileHandler:
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         
         # Create subdirectories
-        (self.upload_dir / "resumes").mkdir(exist_ok=True)
-        (self.upload_dir / "job_descriptions").mkdir(exist_ok=True)
+        self.resume_dir = self.upload_dir / "resumes"
+        self.job_description_dir = self.upload_dir / "job_descriptions"
+        self.resume_dir.mkdir(exist_ok=True)
+        self.job_description_dir.mkdir(exist_ok=True)
         (self.upload_dir / "temp").mkdir(exist_ok=True)
     
     def validate_file(self, filename: str, file_size: int) -> Tuple[bool, Optional[str]]:
@@ -36,33 +74,50 @@ class FileHandler:
         
         return True, None
     
-    def save_file(self, file_content: bytes, filename: str, file_type: str = "resume") -> Tuple[str, str]:
-        """Save file to disk and return file path and hash."""
+    async def save_file(self, src: BinaryIO, filename: str, file_type: str = "resume") -> Tuple[str, str]:
+        """Stream file to disk, hashing it on the way, and return file path and hash."""
+        # The whole read/hash/write loop runs in one worker thread, off the event loop
+        return await anyio.to_thread.run_sync(self._save_file, src, filename, file_type)
+    
+    def _save_file(self, src: BinaryIO, filename: str, file_type: str) -> Tuple[str, str]:
         # Secure filename
-        secure_name = secure_filename(filename)
-        
-        # Generate file hash
-        file_hash = hashlib.sha256(file_content).hexdigest()
-        
-        # Create unique filename with hash
+        secure_name = _secure_filename(filename)
         name, ext = secure_name.rsplit('.', 1)
-        unique_filename = f"{name}_{file_hash[:8]}.{ext}"
         
-        # Determine save path
-        if file_type == "resume":
-            file_path = self.upload_dir / "resumes" / unique_filename
-        else:
-            file_path = self.upload_dir / "job_descriptions" / unique_filename
+        # Determine save directory
+        save_dir = self.resume_dir if file_type == "resume" else self.job_description_dir
         
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # Single pass: each chunk is hashed and written without copying it
+        hasher = _new_file_hasher()
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        # A unique partial file per upload; concurrent saves share a PID (worker threads)
+        with tempfile.NamedTemporaryFile(
+            dir=save_dir, prefix=f"{secure_name}.", suffix=".partial", delete=False
+        ) as f:
+            partial_path = Path(f.name)
+            try:
+                while n := src.readinto(buffer):
+                    hasher.update(view[:n])
+                    f.write(view[:n])
+            except Exception:
+                f.close()
+                partial_path.unlink(missing_ok=True)
+                raise
+        file_hash = hasher.hexdigest()
+        
+        # Create unique filename with hash once it is known
+        file_path = save_dir / f"{name}_{file_hash[:8]}.{ext}"
+        os.replace(partial_path, file_path)
         
         logger.info(f"File saved: {file_path}")
         return str(file_path), file_hash
     
-    def delete_file(self, file_path: str) -> bool:
+    async def delete_file(self, file_path: str) -> bool:
         """Delete file from disk."""
+        return await anyio.to_thread.run_sync(self._delete_file, file_path)
+    
+    def _delete_file(self, file_path: str) -> bool:
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -73,8 +128,11 @@ class FileHandler:
             logger.error(f"Error deleting file {file_path}: {str(e)}")
             return False
     
-    def get_file_info(self, file_path: str) -> Optional[dict]:
+    async def get_file_info(self, file_path: str) -> Optional[dict]:
         """Get file information."""
+        return await anyio.to_thread.run_sync(self._get_file_info, file_path)
+    
+    def _get_file_info(self, file_path: str) -> Optional[dict]:
         try:
             if not os.path.exists(file_path):
                 return None
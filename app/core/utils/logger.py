@@ -1,37 +1,99 @@
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from loguru import logger as loguru_logger
 from app.config import settings
 
-# Remove default handler
-loguru_logger.remove()
-
-# Add custom handler with formatting
-loguru_logger.add(
-    sys.stdout,
-    colorize=True,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level=settings.log_level
-)
-
-# Add file handler for production
-if not settings.debug:
-    log_file = Path("logs") / "app.log"
-    log_file.parent.mkdir(exist_ok=True)
-    
-    loguru_logger.add(
-        log_file,
-        rotation="10 MB",
-        retention="30 days",
-        compression="zip",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="INFO"
-    )
-
-# Create standard logger for compatibility
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+    import json
+
+TEXT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s"
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, serialized with orjson when available."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': record.created,
+            'level': record.levelname,
+            'name': record.name,
+            'function': record.funcName,
+            'line': record.lineno,
+            'msg': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc_info'] = record.exc_text
+        if record.stack_info:
+            entry['stack_info'] = self.formatStack(record.stack_info)
+        if orjson is not None:
+            return orjson.dumps(entry).decode('utf-8')
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback apart from the message.
+
+    The stock prepare() folds the traceback into ``msg``; here it is rendered
+    into ``exc_text`` (exc_info objects can't safely cross threads) so each
+    output formatter decides how to show it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self.formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _build_handlers() -> list:
+    """Output handlers; these run on the listener thread, not the caller's."""
+    console = logging.StreamHandler(sys.stdout)
+    # Readable lines while developing, structured lines in production
+    console.setFormatter(logging.Formatter(TEXT_FORMAT) if settings.debug else JSONFormatter())
+    handlers = [console]
+
+    # Add file handler for production
+    if not settings.debug:
+        log_file = Path("logs") / "app.log"
+        log_file.parent.mkdir(exist_ok=True)
+
+        file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=30)
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(JSONFormatter())
+        handlers.append(file_handler)
+
+    return handlers
+
+
+# Callers only enqueue records; formatting and IO happen on the listener thread
+_log_queue = queue.SimpleQueue()
+_listener = QueueListener(_log_queue, *_build_handlers(), respect_handler_level=True)
+
+_root = logging.getLogger()
+_queue_handler = _RecordQueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter())
+_root.addHandler(_queue_handler)
+_root.setLevel(getattr(logging, settings.log_level.upper()))
+
+_listener.start()
+# Flush queued records on interpreter exit
+atexit.register(_listener.stop)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, settings.log_level.upper()))
-    return logger
\ No newline at end of file
+    return logger
@@ -1,8 +1,17 @@
 import re
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, validator, EmailStr
+from typing import Annotated, Optional, List, Dict, Any
+from pydantic import BaseModel, Field, field_validator, model_validator, EmailStr
 from datetime import datetime
 
+NON_DIGIT_PATTERN = re.compile(r'\D')
+# Deletes every ASCII non-digit; phone numbers are almost always ASCII
+ASCII_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+# Bounds are checked by pydantic-core itself, without a Python validator call
+Weight = Annotated[float, Field(ge=0, le=1)]
+
 
 class ResumeUploadValidator(BaseModel):
     """Validator for resume upload."""
@@ -12,18 +21,23 @@ class ResumeUploadValidator(BaseModel):
     filename: str
     file_size: int
     
-    @validator('candidate_name')
+    @field_validator('candidate_name')
+    @classmethod
     def validate_candidate_name(cls, v):
         if len(v.strip()) < 2:
             raise ValueError('Candidate name must be at least 2 characters long')
         return v.strip().title()
     
-    @validator('candidate_phone')
+    @field_validator('candidate_phone')
+    @classmethod
     def validate_phone(cls, v):
         if v is None:
             return v
         # Remove all non-digit characters
-        phone = re.sub(r'\D', '', v)
+        if v.isascii():
+            phone = v.translate(ASCII_NON_DIGIT_TABLE)
+        else:
+            phone = NON_DIGIT_PATTERN.sub('', v)
         if len(phone) < 10:
             raise ValueError('Phone number must be at least 10 digits')
         return phone
@@ -40,25 +54,29 @@ class JobDescriptionValidator(BaseModel):
     remote_allowed: bool = False
     raw_content: str
     
-    @validator('title')
+    @field_validator('title')
+    @classmethod
     def validate_title(cls, v):
         if len(v.strip()) < 5:
             raise ValueError('Job title must be at least 5 characters long')
         return v.strip().title()
     
-    @validator('company')
+    @field_validator('company')
+    @classmethod
     def validate_company(cls, v):
         if len(v.strip()) < 2:
             raise ValueError('Company name must be at least 2 characters long')
         return v.strip().title()
     
-    @validator('raw_content')
+    @field_validator('raw_content')
+    @classmethod
     def validate_content(cls, v):
         if len(v.strip()) < 50:
             raise ValueError('Job description must be at least 50 characters long')
         return v.strip()
     
-    @validator('job_type')
+    @field_validator('job_type')
+    @classmethod
     def validate_job_type(cls, v):
         allowed_types = ['full-time', 'part-time', 'contract', 'internship', 'freelance']
         if v and v.lower() not in allowed_types:
@@ -68,14 +86,17 @@ class JobDescriptionValidator(BaseModel):
 
 class ScoringValidator(BaseModel):
     """Validator for scoring parameters."""
-    hard_match_weight: float = 0.4
-    soft_match_weight: float = 0.6
-    experience_weight: float = 0.3
-    skills_weight: float = 0.4
-    education_weight: float = 0.3
+    hard_match_weight: Weight = 0.4
+    soft_match_weight: Weight = 0.6
+    experience_weight: Weight = 0.3
+    skills_weight: Weight = 0.4
+    education_weight: Weight = 0.3
     
-    @validator('hard_match_weight', 'soft_match_weight', 'experience_weight', 'skills_weight', 'education_weight')
-    def validate_weights(cls, v):
-        if not 0 <= v <= 1:
-            raise ValueError('Weight values must be between 0 and 1')
-        return v
\ No newline at end of file
+    @model_validator(mode='after')
+    def validate_weight_sums(self):
+        # Each group splits one score, so its weights must add up to 1
+        if abs(self.hard_match_weight + self.soft_match_weight - 1.0) > 0.01:
+            raise ValueError('Hard and soft match weights must sum to 1.0')
+        if abs(self.experience_weight + self.skills_weight + self.education_weight - 1.0) > 0.01:
+            raise ValueError('Experience, skills and education weights must sum to 1.0')
+        return self
@@ -1,12 +1,16 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.security import HTTPBearer
 import uvicorn
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.core.database.database import create_tables
+from app.core.database.database import create_tables, engine, SessionLocal
+from app.core.database.skill_links import backfill_skill_links_if_empty
+from app.core.ai_pipeline.skill_extractor import get_skill_extractor
+from app.core.ai_pipeline.semantic_matcher import get_semantic_matcher
 from app.api.routes import auth, resumes, jobs, matching, analytics
 from app.api.middleware.auth import JWTMiddleware
 from app.core.utils.logger import get_logger
@@ -24,6 +28,12 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Resume Relevance Check System...")
     create_tables()
     logger.info("Database tables created/verified")
+    with SessionLocal() as db:
+        if backfill_skill_links_if_empty(db):
+            logger.info("Skill link tables backfilled from existing resumes and jobs")
+    get_skill_extractor()
+    get_semantic_matcher()
+    logger.info("AI pipeline models loaded")
     
     yield
     
@@ -38,9 +48,14 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    # orjson encodes responses, datetimes included, in C
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Add JWT middleware; added first so it runs innermost, after CORS answers preflights
+app.add_middleware(JWTMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -57,9 +72,6 @@ if not settings.debug:
         allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"]
     )
 
-# Add JWT middleware
-app.add_middleware(JWTMiddleware)
-
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(resumes.router, prefix="/api/v1/resumes", tags=["resumes"])
@@ -85,7 +97,9 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": "2024-01-01T00:00:00Z",
-        "environment": "development" if settings.debug else "production"
+        "environment": "development" if settings.debug else "production",
+        # Checked-out count creeping up between requests points to a session leak
+        "database_pool": engine.pool.status()
     }
 
 
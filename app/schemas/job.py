@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, field_validator, ConfigDict
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
@@ -16,32 +16,37 @@ class JobDescriptionCreate(BaseModel):
     remote_allowed: bool = False
     urgency_level: str = "medium"
     
-    @validator('title')
+    @field_validator('title')
+    @classmethod
     def validate_title(cls, v):
         if len(v.strip()) < 5:
             raise ValueError('Job title must be at least 5 characters long')
         return v.strip()
     
-    @validator('company')
+    @field_validator('company')
+    @classmethod
     def validate_company(cls, v):
         if len(v.strip()) < 2:
             raise ValueError('Company name must be at least 2 characters long')
         return v.strip()
     
-    @validator('raw_content')
+    @field_validator('raw_content')
+    @classmethod
     def validate_content(cls, v):
         if len(v.strip()) < 50:
             raise ValueError('Job description must be at least 50 characters long')
         return v.strip()
     
-    @validator('job_type')
+    @field_validator('job_type')
+    @classmethod
     def validate_job_type(cls, v):
         allowed_types = ['full-time', 'part-time', 'contract', 'internship', 'freelance']
         if v.lower() not in allowed_types:
             raise ValueError(f'Job type must be one of: {", ".join(allowed_types)}')
         return v.lower()
     
-    @validator('urgency_level')
+    @field_validator('urgency_level')
+    @classmethod
     def validate_urgency(cls, v):
         allowed_levels = ['low', 'medium', 'high']
         if v.lower() not in allowed_levels:
@@ -86,8 +91,7 @@ class JobDescriptionResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobDescriptionListResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, field_validator, ConfigDict
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
@@ -9,7 +9,8 @@ class EvaluationRequest(BaseModel):
     job_id: int
     custom_weights: Optional[Dict[str, float]] = None
     
-    @validator('custom_weights')
+    @field_validator('custom_weights')
+    @classmethod
     def validate_weights(cls, v):
         if v is None:
             return v
@@ -38,7 +39,8 @@ class BatchEvaluationRequest(BaseModel):
     job_id: int
     custom_weights: Optional[Dict[str, float]] = None
     
-    @validator('resume_ids')
+    @field_validator('resume_ids')
+    @classmethod
     def validate_resume_ids(cls, v):
         if len(v) == 0:
             raise ValueError('At least one resume ID must be provided')
@@ -71,8 +73,7 @@ class EvaluationResponse(BaseModel):
     confidence_score: Optional[float]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EvaluationListResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, field_validator, EmailStr, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -11,7 +11,8 @@ class UserCreate(BaseModel):
     full_name: Optional[str] = None
     role: Optional[str] = "recruiter"
     
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
         if len(v) < 3:
             raise ValueError('Username must be at least 3 characters long')
@@ -19,7 +20,8 @@ class UserCreate(BaseModel):
             raise ValueError('Username can only contain letters, numbers, hyphens, and underscores')
         return v
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
@@ -31,7 +33,8 @@ class UserCreate(BaseModel):
             raise ValueError('Password must contain at least one digit')
         return v
     
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_role(cls, v):
         allowed_roles = ['recruiter', 'admin', 'student']
         if v not in allowed_roles:
@@ -55,8 +58,7 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -1,11 +1,11 @@
 from typing import Dict, List, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from sqlalchemy import func, and_, or_
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
-from app.core.database.models import Resume, JobDescription, ResumeEvaluation, Analytics
+from app.core.database.models import Resume, JobDescription, ResumeEvaluation, Analytics, Skill, ResumeSkill, JobSkill
 from app.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -83,7 +83,7 @@ class AnalyticsService:
                     'id': e.id,
                     'score': e.overall_score,
                     'suitability': e.suitability,
-                    'created_at': e.created_at.isoformat()
+                    'created_at': e.created_at
                 }
                 for e in recent_evaluations
             ]
@@ -99,8 +99,8 @@ class AnalyticsService:
         
         start_date = datetime.now() - timedelta(days=days)
         
-        # Get all evaluations in date range
-        evaluation_query = db.query(ResumeEvaluation).filter(
+        # Get all evaluations in date range; only their skill columns are read
+        evaluation_query = db.query(ResumeEvaluation).options(raiseload('*')).filter(
             ResumeEvaluation.created_at >= start_date
         )
         
@@ -113,7 +113,6 @@ class AnalyticsService:
         
         # Analyze skills
         skill_demand = {}  # Skill -> count of JDs requiring it
-        skill_supply = {}  # Skill -> count of resumes having it
         skill_gaps = {}    # Skill -> count of times it was missing
         
         for evaluation in evaluations:
@@ -127,12 +126,15 @@ class AnalyticsService:
                 for skill in evaluation.missing_skills:
                     skill_gaps[skill] = skill_gaps.get(skill, 0) + 1
         
-        # Calculate supply from resumes
-        resumes = db.query(Resume).filter(Resume.created_at >= start_date).all()
-        for resume in resumes:
-            if resume.skills:
-                for skill in resume.skills:
-                    skill_supply[skill] = skill_supply.get(skill, 0) + 1
+        # Calculate supply from resumes, aggregated in the database over the join table
+        supply_rows = db.query(Skill.name, func.count(ResumeSkill.resume_id)).join(
+            ResumeSkill, ResumeSkill.skill_id == Skill.id
+        ).join(
+            Resume, Resume.id == ResumeSkill.resume_id
+        ).filter(
+            Resume.created_at >= start_date
+        ).group_by(Skill.name).all()
+        skill_supply = dict(supply_rows)  # Skill -> count of resumes having it
         
         # Most in-demand skills
         top_demand = sorted(skill_demand.items(), key=lambda x: x[1], reverse=True)[:10]
@@ -172,8 +174,11 @@ class AnalyticsService:
         
         start_date = datetime.now() - timedelta(days=days)
         
-        # Get evaluations
-        evaluation_query = db.query(ResumeEvaluation).filter(
+        # Get evaluations; the top candidates list needs only the candidate name
+        evaluation_query = db.query(ResumeEvaluation).options(
+            selectinload(ResumeEvaluation.resume).load_only(Resume.candidate_name),
+            raiseload('*')
+        ).filter(
             ResumeEvaluation.created_at >= start_date
         )
         
@@ -247,23 +252,21 @@ class AnalyticsService:
         
         start_date = datetime.now() - timedelta(days=days)
         
-        job_query = db.query(JobDescription).filter(
+        demand_count = func.count(JobSkill.job_description_id)
+        skill_query = db.query(Skill.name, demand_count).join(
+            JobSkill, JobSkill.skill_id == Skill.id
+        ).join(
+            JobDescription, JobDescription.id == JobSkill.job_description_id
+        ).filter(
+            JobSkill.required.is_(True),
             JobDescription.created_at >= start_date
         )
         
         if user_id:
-            job_query = job_query.filter(JobDescription.created_by == user_id)
-        
-        jobs = job_query.all()
-        
-        skill_counts = {}
-        for job in jobs:
-            if job.required_skills:
-                for skill in job.required_skills:
-                    skill_counts[skill] = skill_counts.get(skill, 0) + 1
+            skill_query = skill_query.filter(JobDescription.created_by == user_id)
         
         # Return top 10 skills
-        top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_skills = skill_query.group_by(Skill.name).order_by(demand_count.desc()).limit(10).all()
         return [{'skill': skill, 'demand_count': count} for skill, count in top_skills]
     
     def _analyze_experience_levels(self, resumes: List[Resume]) -> Dict[str, Any]:
@@ -1,8 +1,9 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 from fastapi import HTTPException, status
 
 from app.core.database.models import JobDescription
+from app.core.database.skill_links import job_skill_links
 from app.core.ai_pipeline.jd_parser import JobDescriptionParser
 from app.core.utils.validators import JobDescriptionValidator
 from app.core.utils.logger import get_logger
@@ -29,7 +30,7 @@ class JobService:
         # Validate job data
         try:
             validator = JobDescriptionValidator(**job_data)
-            validated_data = validator.dict()
+            validated_data = validator.model_dump()
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -59,6 +60,7 @@ class JobService:
                 created_by=created_by,
                 status="active"
             )
+            job.skill_links = job_skill_links(db, job.required_skills, job.preferred_skills)
             
             db.add(job)
             db.commit()
@@ -94,7 +96,8 @@ class JobService:
     ) -> List[JobDescription]:
         """List job descriptions with optional filtering."""
         
-        query = db.query(JobDescription)
+        # List responses never include the full parse, so leave it in the database
+        query = db.query(JobDescription).options(defer(JobDescription.parsed_content))
         
         if created_by:
             query = query.filter(JobDescription.created_by == created_by)
@@ -150,6 +153,7 @@ class JobService:
                 job.parsed_content = self._serialize_parsed_jd(parsed_jd)
                 job.required_skills = parsed_jd.required_skills
                 job.preferred_skills = parsed_jd.preferred_skills
+                job.skill_links = job_skill_links(db, job.required_skills, job.preferred_skills)
                 job.required_experience_years = parsed_jd.required_experience_years
             
             db.commit()
@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
 from datetime import datetime
 from app.core.ai_pipeline.resume_parser import ParsedResume, ContactInfo
 import asyncio
@@ -9,8 +10,8 @@ from fastapi import HTTPException, status
 from app.core.database.models import Resume, JobDescription, ResumeEvaluation
 from app.core.ai_pipeline.resume_parser import ResumeParser
 from app.core.ai_pipeline.jd_parser import JobDescriptionParser
-from app.core.ai_pipeline.skill_extractor import AdvancedSkillExtractor
-from app.core.ai_pipeline.semantic_matcher import SemanticMatcher
+from app.core.ai_pipeline.skill_extractor import get_skill_extractor
+from app.core.ai_pipeline.semantic_matcher import get_semantic_matcher
 from app.core.ai_pipeline.scoring_engine import AdvancedScoringEngine, ScoringWeights
 from app.core.ai_pipeline.feedback_generator import AIFeedbackGenerator
 from app.services.resume_service import ResumeService
@@ -24,8 +25,8 @@ class MatchingService:
     """Service for resume-job matching and evaluation."""
     
     def __init__(self):
-        self.skill_extractor = AdvancedSkillExtractor()
-        self.semantic_matcher = SemanticMatcher()
+        self.skill_extractor = get_skill_extractor()
+        self.semantic_matcher = get_semantic_matcher()
         self.scoring_engine = AdvancedScoringEngine()
         self.feedback_generator = AIFeedbackGenerator()
         self.resume_service = ResumeService()
@@ -41,6 +42,27 @@ class MatchingService:
     ) -> ResumeEvaluation:
         """Evaluate a resume against a job description."""
         
+        evaluation = ResumeEvaluation(
+            **await self._evaluate(db, resume_id, job_id, user_id, custom_weights)
+        )
+        
+        db.add(evaluation)
+        db.commit()
+        db.refresh(evaluation)
+        
+        logger.info(f"Evaluation completed: ID {evaluation.id}, Score: {evaluation.overall_score}")
+        return evaluation
+    
+    async def _evaluate(
+        self,
+        db: Session,
+        resume_id: int,
+        job_id: int,
+        user_id: Optional[int] = None,
+        custom_weights: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """Run the matching pipeline and return the evaluation's column values."""
+        
         logger.info(f"Evaluating resume {resume_id} against job {job_id}")
         
         # Get resume and job
@@ -57,36 +79,28 @@ class MatchingService:
                 resume, job, custom_weights
             )
             
-            # Create evaluation record
-            evaluation = ResumeEvaluation(
-                resume_id=resume_id,
-                job_description_id=job_id,
-                evaluated_by=user_id,
-                overall_score=evaluation_result['final_score'].overall_score,
-                hard_skills_score=evaluation_result['final_score'].detailed_scores.hard_skills_score,
-                soft_skills_score=evaluation_result['final_score'].detailed_scores.soft_skills_score,
-                experience_score=evaluation_result['final_score'].detailed_scores.experience_score,
-                education_score=evaluation_result['final_score'].detailed_scores.education_score,
-                matching_skills=evaluation_result['matching_skills'],
-                missing_skills=evaluation_result['missing_skills'],
-                additional_skills=evaluation_result['additional_skills'],
-                suitability=evaluation_result['final_score'].suitability,
-                recommendation=evaluation_result['recommendation'],
-                strengths=[s for s in evaluation_result['feedback'].strengths],
-                weaknesses=[s for s in evaluation_result['feedback'].areas_for_improvement],
-                suggestions=[s for s in evaluation_result['feedback'].specific_recommendations],
-                personalized_feedback=evaluation_result['feedback'].overall_assessment,
-                processing_time=evaluation_result['processing_time'],
-                model_version="1.0.0",
-                confidence_score=evaluation_result['final_score'].detailed_scores.overall_confidence
-            )
-            
-            db.add(evaluation)
-            db.commit()
-            db.refresh(evaluation)
-            
-            logger.info(f"Evaluation completed: ID {evaluation.id}, Score: {evaluation.overall_score}")
-            return evaluation
+            return {
+                'resume_id': resume_id,
+                'job_description_id': job_id,
+                'evaluated_by': user_id,
+                'overall_score': evaluation_result['final_score'].overall_score,
+                'hard_skills_score': evaluation_result['final_score'].detailed_scores.hard_skills_score,
+                'soft_skills_score': evaluation_result['final_score'].detailed_scores.soft_skills_score,
+                'experience_score': evaluation_result['final_score'].detailed_scores.experience_score,
+                'education_score': evaluation_result['final_score'].detailed_scores.education_score,
+                'matching_skills': evaluation_result['matching_skills'],
+                'missing_skills': evaluation_result['missing_skills'],
+                'additional_skills': evaluation_result['additional_skills'],
+                'suitability': evaluation_result['final_score'].suitability,
+                'recommendation': evaluation_result['recommendation'],
+                'strengths': [s for s in evaluation_result['feedback'].strengths],
+                'weaknesses': [s for s in evaluation_result['feedback'].areas_for_improvement],
+                'suggestions': [s for s in evaluation_result['feedback'].specific_recommendations],
+                'personalized_feedback': evaluation_result['feedback'].overall_assessment,
+                'processing_time': evaluation_result['processing_time'],
+                'model_version': "1.0.0",
+                'confidence_score': evaluation_result['final_score'].detailed_scores.overall_confidence
+            }
             
         except Exception as e:
             logger.error(f"Error in matching pipeline: {str(e)}")
@@ -170,19 +184,27 @@ class MatchingService:
         
         logger.info(f"Batch evaluating {len(resume_ids)} resumes against job {job_id}")
         
-        evaluations = []
+        rows = []
         for resume_id in resume_ids:
             try:
-                evaluation = await self.evaluate_resume_against_job(
-                    db, resume_id, job_id, user_id
-                )
-                evaluations.append(evaluation)
+                rows.append(await self._evaluate(db, resume_id, job_id, user_id))
             except Exception as e:
                 logger.error(f"Error evaluating resume {resume_id}: {str(e)}")
                 # Continue with other resumes
                 continue
         
-        return evaluations
+        if not rows:
+            return []
+        
+        # One multi-row INSERT ... RETURNING for the whole batch
+        ids = db.scalars(insert(ResumeEvaluation).returning(ResumeEvaluation.id), rows).all()
+        db.commit()
+        
+        evaluations = {
+            e.id: e for e in db.query(ResumeEvaluation).filter(ResumeEvaluation.id.in_(ids))
+        }
+        logger.info(f"Batch evaluation stored {len(ids)} of {len(resume_ids)} evaluations")
+        return [evaluations[i] for i in ids]
     
     async def get_evaluation(self, db: Session, evaluation_id: int) -> ResumeEvaluation:
         """Get evaluation by ID."""
@@ -205,7 +227,9 @@ class MatchingService:
         limit: int = 10
     ) -> List[ResumeEvaluation]:
         """Get all evaluations for a specific resume."""
-        return db.query(ResumeEvaluation).filter(
+        return db.query(ResumeEvaluation).options(
+            *self._evaluation_list_options()
+        ).filter(
             ResumeEvaluation.resume_id == resume_id
         ).order_by(ResumeEvaluation.created_at.desc()).limit(limit).all()
     
@@ -217,7 +241,9 @@ class MatchingService:
         min_score: Optional[float] = None
     ) -> List[ResumeEvaluation]:
         """Get all evaluations for a specific job."""
-        query = db.query(ResumeEvaluation).filter(
+        query = db.query(ResumeEvaluation).options(
+            *self._evaluation_list_options()
+        ).filter(
             ResumeEvaluation.job_description_id == job_id
         )
         
@@ -228,6 +254,18 @@ class MatchingService:
             ResumeEvaluation.overall_score.desc()
         ).limit(limit).all()
     
+    @staticmethod
+    def _evaluation_list_options() -> tuple:
+        """Loader options for evaluation lists: only the fields the list views show."""
+        return (
+            selectinload(ResumeEvaluation.resume).load_only(
+                Resume.candidate_name, Resume.candidate_email
+            ),
+            selectinload(ResumeEvaluation.job_description).load_only(
+                JobDescription.title, JobDescription.company
+            ),
+        )
+    
     def _deserialize_resume(self, resume: Resume) -> 'ParsedResume':
         """Deserialize resume data from database."""
         # This would reconstruct the ParsedResume object
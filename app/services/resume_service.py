@@ -1,12 +1,15 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, defer
 from fastapi import HTTPException, status, UploadFile
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
 from app.core.database.models import Resume, ResumeEvaluation
+from app.core.database.skill_links import resume_skill_links
 from app.core.ai_pipeline.resume_parser import ResumeParser, ParsedResume
-from app.core.ai_pipeline.skill_extractor import AdvancedSkillExtractor
+from app.core.ai_pipeline.skill_extractor import get_skill_extractor
 from app.core.utils.file_handler import FileHandler
 from app.core.utils.validators import ResumeUploadValidator
 from app.core.utils.logger import get_logger
@@ -19,7 +22,7 @@ class ResumeService:
     
     def __init__(self):
         self.resume_parser = ResumeParser()
-        self.skill_extractor = AdvancedSkillExtractor()
+        self.skill_extractor = get_skill_extractor()
         self.file_handler = FileHandler()
         self.executor = ThreadPoolExecutor(max_workers=4)
     
@@ -42,12 +45,10 @@ class ResumeService:
             )
         
         try:
-            # Read file content
-            file_content = await file.read()
-            
-            # Save file to disk
-            file_path, file_hash = self.file_handler.save_file(
-                file_content, file.filename, "resume"
+            # Stream file to disk
+            await file.seek(0)
+            file_path, file_hash = await self.file_handler.save_file(
+                file.file, file.filename, "resume"
             )
             
             # Parse resume in background
@@ -84,6 +85,7 @@ class ResumeService:
                     if hasattr(resume, key):
                         setattr(resume, key, value)
             
+            resume.skill_links = resume_skill_links(db, resume.skills)
             db.add(resume)
             db.commit()
             db.refresh(resume)
@@ -95,7 +97,7 @@ class ResumeService:
             logger.error(f"Error processing resume: {str(e)}")
             # Cleanup file if database operation fails
             if 'file_path' in locals():
-                self.file_handler.delete_file(file_path)
+                await self.file_handler.delete_file(file_path)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error processing resume: {str(e)}"
@@ -131,14 +133,19 @@ class ResumeService:
     ) -> List[Resume]:
         """List resumes with optional filtering."""
         
-        query = db.query(Resume)
+        # List responses never include the raw text or full parse, so leave them in the database
+        query = db.query(Resume).options(defer(Resume.raw_text), defer(Resume.parsed_content))
         
         if filters:
             if 'candidate_name' in filters:
                 query = query.filter(Resume.candidate_name.contains(filters['candidate_name']))
             
             if 'skills' in filters:
-                query = query.filter(Resume.skills.contains(filters['skills']))
+                if db.get_bind().dialect.name == "postgresql":
+                    # JSONB containment (@>), served by the GIN index on resumes.skills
+                    query = query.filter(type_coerce(Resume.skills, JSONB).contains([filters['skills']]))
+                else:
+                    query = query.filter(Resume.skills.contains(filters['skills']))
             
             if 'experience_min' in filters:
                 query = query.filter(Resume.experience_years >= filters['experience_min'])
@@ -153,7 +160,7 @@ class ResumeService:
         resume = await self.get_resume(db, resume_id)
         
         # Delete file from disk
-        file_deleted = self.file_handler.delete_file(resume.file_path)
+        file_deleted = await self.file_handler.delete_file(resume.file_path)
         
         # Delete from database
         db.delete(resume)
@@ -177,6 +184,7 @@ class ResumeService:
             resume.raw_text = parsed_resume.raw_text
             resume.parsed_content = self._serialize_parsed_resume(parsed_resume)
             resume.skills = [skill.name for skill in parsed_resume.skills] if parsed_resume.skills else None
+            resume.skill_links = resume_skill_links(db, resume.skills)
             resume.experience_years = parsed_resume.total_experience_years
             resume.processing_status = "processed"
             
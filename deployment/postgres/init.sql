@@ -16,5 +16,12 @@ CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- For fuzzy text search
 -- CREATE INDEX CONCURRENTLY idx_evaluations_score ON resume_evaluations (overall_score DESC);
 -- CREATE INDEX CONCURRENTLY idx_evaluations_created_at ON resume_evaluations (created_at DESC);
 
+-- Defined on the models; create_all() does not add them to existing tables:
+-- CREATE INDEX CONCURRENTLY ix_resume_evaluations_job_score ON resume_evaluations (job_description_id, overall_score DESC);
+-- CREATE INDEX CONCURRENTLY ix_resume_evaluations_resume_created ON resume_evaluations (resume_id, created_at);
+-- CREATE INDEX CONCURRENTLY ix_resume_evaluations_created_brin ON resume_evaluations USING brin (created_at) WITH (pages_per_range = 32);
+-- CREATE INDEX CONCURRENTLY ix_analytics_date_recorded_brin ON analytics USING brin (date_recorded) WITH (pages_per_range = 32);
+-- CREATE UNIQUE INDEX CONCURRENTLY ix_users_email_lower ON users (lower(email));
+
 -- Grant permissions (adjust as needed for production)
 GRANT ALL PRIVILEGES ON DATABASE resume_ai TO postgres;
\ No newline at end of file
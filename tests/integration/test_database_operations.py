@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database.models import (
+    Base, User, JobDescription, Resume, ResumeEvaluation, Skill, ResumeSkill, JobSkill
+)
+from app.core.database.skill_links import (
+    get_or_create_skills, job_skill_links, backfill_skill_links_if_empty
+)
+from app.services.matching_service import MatchingService
+
+
+@pytest.fixture
+def db():
+    """In-memory database with one job evaluated against several resumes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    user = User(email="hr@example.com", username="hr", hashed_password="x")
+    session.add(user)
+    session.flush()
+    job = JobDescription(title="Engineer", company="Acme", raw_content="...", created_by=user.id)
+    session.add(job)
+    for i in range(5):
+        resume = Resume(
+            candidate_name=f"Candidate {i}", filename=f"{i}.pdf", file_path=f"/tmp/{i}.pdf",
+            file_type="pdf", file_size=1, file_hash=str(i), raw_text="..."
+        )
+        session.add(ResumeEvaluation(
+            resume=resume, job_description=job, evaluated_by=user.id,
+            overall_score=70.0 + i, hard_skills_score=70.0, soft_skills_score=70.0,
+            experience_score=70.0, education_score=70.0, suitability="Medium"
+        ))
+    session.commit()
+    session.expunge_all()
+
+    yield session
+    session.close()
+
+
+def _count_queries(session):
+    statements = []
+    event.listen(session.get_bind(), "before_cursor_execute",
+                 lambda *args: statements.append(args[2]))
+    return statements
+
+
+class TestEvaluationRelationships:
+    """Test relationship loading on evaluation lists."""
+
+    def test_listing_evaluations_does_not_issue_per_row_queries(self, db):
+        """Test that list queries load resume and job for the whole list at once."""
+        statements = _count_queries(db)
+
+        evaluations = db.query(ResumeEvaluation).options(
+            *MatchingService._evaluation_list_options()
+        ).all()
+        names = [e.resume.candidate_name for e in evaluations]
+        titles = {e.job_description.title for e in evaluations}
+
+        assert len(names) == 5
+        assert titles == {"Engineer"}
+        # One for the evaluations, one per eagerly loaded relationship
+        assert len(statements) <= 3
+
+    def test_evaluated_by_user_is_never_lazy_loaded(self, db):
+        """Test that accidental access to the evaluating user fails loudly."""
+        evaluation = db.query(ResumeEvaluation).first()
+
+        with pytest.raises(InvalidRequestError):
+            evaluation.evaluated_by_user
+
+
+class TestSkillLinks:
+    """Test the normalized skill join tables."""
+
+    def test_get_or_create_skills_reuses_existing_rows(self, db):
+        """Test that known skills are reused and new ones are added once."""
+        db.add(Skill(name="Python"))
+        db.commit()
+        python_id = db.query(Skill.id).filter(Skill.name == "Python").scalar()
+
+        skills = get_or_create_skills(db, ["Python", "Docker", "Docker", "", None])
+        db.commit()
+
+        assert set(skills) == {"Python", "Docker"}
+        assert skills["Python"].id == python_id
+        assert db.query(Skill).count() == 2
+
+    def test_job_skill_links_prefer_required(self, db):
+        """Test that a skill listed as both required and preferred is linked once, as required."""
+        links = job_skill_links(db, ["Python", "SQL"], ["SQL", "Docker"])
+
+        assert {link.skill.name: link.required for link in links} == {
+            "Python": True, "SQL": True, "Docker": False
+        }
+
+    def test_backfill_runs_only_while_links_are_empty(self, db):
+        """Test that the startup backfill links existing rows once."""
+        resume = db.query(Resume).filter(Resume.candidate_name == "Candidate 0").one()
+        resume.skills = ["Python", "SQL"]
+        job = db.query(JobDescription).one()
+        job.required_skills = ["Python"]
+        job.preferred_skills = ["Docker"]
+        db.commit()
+
+        assert backfill_skill_links_if_empty(db) is True
+        assert backfill_skill_links_if_empty(db) is False
+
+        resume_skills = {
+            name for (name,) in db.query(Skill.name).join(ResumeSkill).filter(ResumeSkill.resume_id == resume.id)
+        }
+        job_skills = dict(
+            db.query(Skill.name, JobSkill.required).join(JobSkill).filter(JobSkill.job_description_id == job.id)
+        )
+        assert resume_skills == {"Python", "SQL"}
+        assert job_skills == {"Python": True, "Docker": False}
@@ -0,0 +1,33 @@
+import numpy as np
+from unittest.mock import Mock
+
+from app.core.ai_pipeline.embed_cache import EmbeddingDiskCache, cached_encode
+
+
+class TestEmbeddingDiskCache:
+    """Test the on-disk embedding cache."""
+
+    def test_key_depends_on_model_and_text(self, tmp_path):
+        """Test that keys are content addressed per model."""
+        cache = EmbeddingDiskCache('model-a', str(tmp_path))
+        other = EmbeddingDiskCache('model-b', str(tmp_path))
+
+        assert cache.key('python') == cache.key('python')
+        assert cache.key('python') != cache.key('java')
+        assert cache.key('python') != other.key('python')
+
+    def test_cached_encode_only_encodes_misses(self, tmp_path):
+        """Test that cached texts are not re-encoded, even by a new instance."""
+        model = Mock()
+        model.encode.return_value = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+        first = cached_encode(model, ['python', 'java'], EmbeddingDiskCache('m', str(tmp_path)))
+
+        model.encode.return_value = np.array([[0.6, 0.8]])
+        second = cached_encode(model, ['java', 'sql', 'python'], EmbeddingDiskCache('m', str(tmp_path)))
+
+        assert model.encode.call_count == 2
+        assert model.encode.call_args[0][0] == ['sql']
+        assert second.dtype == np.float32
+        np.testing.assert_array_equal(second[0], first[1])
+        np.testing.assert_array_equal(second[2], first[0])
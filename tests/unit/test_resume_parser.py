@@ -113,3 +113,42 @@ class TestResumeParser:
         total_years = self.parser._calculate_total_experience(experiences)
         assert total_years is not None
         assert total_years > 0
+    
+    def test_clean_text_preserves_line_breaks(self):
+        """Test that text cleaning keeps line structure for section detection."""
+        sample_text = "John   Doe\n\n\n  SKILLS \t\nPython,  Java\n"
+        
+        cleaned_text = self.parser._clean_text(sample_text)
+        
+        assert '\n' in cleaned_text
+        assert cleaned_text.split('\n') == ['John Doe', 'SKILLS', 'Python, Java']
+    
+    def test_parse_text_uses_cache(self):
+        """Test that re-parsing identical text returns the cached result."""
+        sample_text = "Jane Smith\njane@example.com\nSKILLS\nPython, SQL"
+        
+        with patch.object(self.parser, '_parse_uncached', wraps=self.parser._parse_uncached) as parse_mock:
+            first = self.parser.parse_text(sample_text)
+            second = self.parser.parse_text(sample_text)
+        
+        assert first == second
+        assert parse_mock.call_count == 1
+        
+        # Each hit is a separate copy, so editing one result leaves the cache intact
+        first.skills.append("COBOL")
+        assert "COBOL" not in second.skills
+        assert "COBOL" not in self.parser.parse_text(sample_text).skills
+    
+    def test_parse_lazy_defers_extraction(self):
+        """Test that lazy parsing only runs the extractors that are accessed."""
+        sample_text = "Jane Smith\njane@example.com\nPROJECTS\nResume Matcher\nBuilt with Python"
+        
+        with patch.object(self.parser, '_extract_projects', wraps=self.parser._extract_projects) as projects_mock:
+            lazy_resume = self.parser.parse_lazy(sample_text)
+            assert lazy_resume.contact_info.email == "jane@example.com"
+            assert projects_mock.call_count == 0
+            
+            parsed = lazy_resume.eager()
+            assert projects_mock.call_count == 1
+        
+        assert isinstance(parsed, ParsedResume)
@@ -54,3 +54,34 @@ class TestScoringEngine:
         low_score = 30.0
         suitability = self.scoring_engine._determine_suitability(low_score, mock_detailed_scores)
         assert suitability == "Low"
+    
+    def test_batch_suitability_matches_single(self):
+        """Test vectorized suitability agrees with the per-resume rules."""
+        import numpy as np
+        
+        def make_scores(missing, matched, experience, hard_skills, confidence):
+            scores = Mock()
+            scores.skills_missing_count = missing
+            scores.skills_matched_count = matched
+            scores.experience_score = experience
+            scores.hard_skills_score = hard_skills
+            scores.education_score = 50.0
+            scores.overall_confidence = confidence
+            return scores
+        
+        overall_scores = np.array([85.0, 85.0, 55.0, 30.0, 85.0])
+        detailed_scores_list = [
+            make_scores(1, 8, 70.0, 70.0, 85.0),
+            make_scores(9, 2, 70.0, 70.0, 85.0),
+            make_scores(1, 8, 95.0, 70.0, 85.0),
+            make_scores(1, 8, 70.0, 70.0, 85.0),
+            make_scores(1, 8, 70.0, 70.0, 40.0),
+        ]
+        
+        batch = self.scoring_engine._determine_suitability_batch(overall_scores, detailed_scores_list)
+        single = [
+            self.scoring_engine._determine_suitability(score, detailed)
+            for score, detailed in zip(overall_scores, detailed_scores_list)
+        ]
+        
+        assert list(batch) == single
@@ -34,6 +34,19 @@ class TestSemanticMatcher:
         matches = self.matcher._fuzzy_match_skills(resume_skills, jd_skills, threshold=80)
         
         assert len(matches) >= 2  # Should match JavaScript and PostgreSQL
+    
+    def test_fuzzy_blocked_path_agrees_with_full_matrix(self):
+        """Test that large skill lists accept the same borderline pairs as small ones."""
+        # token_sort_ratio scores these 84.6, which rounds up to the threshold of 85
+        resume_skills = ['abcdefghijk']
+        jd_skills = ['abcdefghijkXYZW']
+        
+        full = self.matcher._fuzzy_match_skills(resume_skills, jd_skills, threshold=85)
+        with patch.object(SemanticMatcher, 'FUZZY_PREFILTER_MIN_PAIRS', 1):
+            blocked = self.matcher._fuzzy_match_skills(resume_skills, jd_skills, threshold=85)
+        
+        assert len(full) == 1
+        assert blocked == full
         
     def test_jaccard_similarity(self):
         """Test Jaccard similarity calculation."""
@@ -50,7 +63,8 @@ class TestSemanticMatcher:
         """Test semantic matching using embeddings."""
         # Mock sentence transformer
         mock_model = Mock()
-        mock_model.encode.return_value = np.array([[1, 0], [0, 1], [0.5, 0.5]])
+        # Resume and JD skills are encoded together: 2 resume rows, then 3 JD rows
+        mock_model.encode.return_value = np.array([[1, 0], [0, 1], [1, 0], [0.5, 0.5], [0, 1]])
         mock_transformer.return_value = mock_model
         
         matcher = SemanticMatcher()
@@ -63,3 +77,59 @@ class TestSemanticMatcher:
         
         assert isinstance(matches, list)
         # Should find at least one match given the mock embeddings
+    
+    def test_encode_reuses_cached_embeddings(self):
+        """Test that repeated texts are only encoded once."""
+        mock_model = Mock()
+        mock_model.encode.side_effect = lambda texts, **kwargs: np.array([[len(t), 1.0] for t in texts])
+        self.matcher.sentence_transformer = mock_model
+        
+        first = self.matcher._encode(['Python', 'Docker', 'Python'])
+        second = self.matcher._encode(['Docker', 'AWS'])
+        
+        assert mock_model.encode.call_count == 2
+        assert mock_model.encode.call_args_list[0][0][0] == ['Python', 'Docker']
+        assert mock_model.encode.call_args_list[1][0][0] == ['AWS']
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(second[0], first[1])
+    
+    @pytest.mark.parametrize('fit_corpus', [False, True])
+    def test_match_many_matches_single_calls(self, fit_corpus):
+        """Test that batch matching gives the same results as matching one resume at a time."""
+        mock_model = Mock()
+        mock_model.encode.side_effect = lambda texts, **kwargs: np.array(
+            [[len(t), t.lower().count('a') + 1.0, t.lower().count('e') + 1.0] for t in texts]
+        )
+        self.matcher.sentence_transformer = mock_model
+        
+        def profile(*names):
+            skills = [ExtractedSkill(name=name, category='technical', confidence=0.9, context='') for name in names]
+            return SkillProfile(
+                technical_skills=skills, soft_skills=[], domain_expertise=[], tools_platforms=[],
+                certifications=[], skill_categories={}, total_skills_count=len(skills), skill_diversity_score=0.0
+            )
+        
+        jd_parsed = ParsedJobDescription(
+            title='Backend Engineer', company='Acme',
+            required_skills=['Python', 'PostgreSQL', 'Docker'], preferred_skills=['Kubernetes']
+        )
+        jd_text = 'Backend engineer building Python services on PostgreSQL and Docker'
+        resumes = [
+            (profile('Python', 'Postgres', 'Kubernetes'), 'Python developer with Postgres and Kubernetes'),
+            (profile('Java', 'Dockerfile'), 'Java engineer who writes Dockerfiles'),
+            (profile(), 'Recent graduate'),
+        ]
+        corpus = [jd_text] + [text for _, text in resumes]
+        if fit_corpus:
+            self.matcher.fit_tfidf(corpus)
+        
+        results = self.matcher.match_many(resumes, jd_parsed, jd_text, max_workers=2)
+        
+        # Without a fitted corpus the batch is scored with a vectorizer fitted on the batch itself
+        vectorizer = None if fit_corpus else self.matcher._fit_local_tfidf(corpus)
+        expected = [
+            self.matcher.match_resume_to_jd(skills, jd_parsed, text, jd_text, vectorizer)
+            for skills, text in resumes
+        ]
+        assert results == expected
+        assert self.matcher._tfidf_fitted == fit_corpus
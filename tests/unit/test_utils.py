@@ -0,0 +1,25 @@
+import pytest
+from pydantic import ValidationError
+
+from app.core.utils.validators import ScoringValidator
+
+
+class TestScoringValidator:
+    """Test scoring parameter validation."""
+
+    def test_default_weights_are_valid(self):
+        """Test that the default weights pass validation."""
+        ScoringValidator()
+
+    def test_weight_out_of_range(self):
+        """Test that weights outside [0, 1] are rejected."""
+        with pytest.raises(ValidationError):
+            ScoringValidator(hard_match_weight=1.5, soft_match_weight=-0.5)
+
+    def test_weight_groups_must_sum_to_one(self):
+        """Test that each weight group has to add up to 1.0."""
+        with pytest.raises(ValidationError, match='Hard and soft'):
+            ScoringValidator(hard_match_weight=0.5, soft_match_weight=0.6)
+
+        with pytest.raises(ValidationError, match='Experience, skills and education'):
+            ScoringValidator(experience_weight=0.5)